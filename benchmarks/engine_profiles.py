@@ -0,0 +1,77 @@
+"""
+Compare the SQLite engine profiles of database/session.py.
+
+Each profile gets a fresh database file and runs the same workload: single-row
+commits (what every repository save() does) followed by indexed reads.
+
+Usage:
+    python -m benchmarks.engine_profiles [--rows N] [--profiles stock,dev,prod]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy.orm import Session
+
+from database.session import SQLITE_PROFILES, build_engine
+from models.base import Base
+from models.client import Client
+from models.contract import Contract  # noqa: F401 (mapper registry)
+from models.event import Event  # noqa: F401 (mapper registry)
+from models.user import User
+from models.user_role import UserRole
+
+
+def run_profile(profile: str, rows: int) -> dict[str, float]:
+    """
+    Run the workload against a fresh database using the given profile.
+
+    Args:
+        profile (str): Name of a profile in SQLITE_PROFILES.
+        rows (int): Number of clients to insert, one commit each.
+
+    Returns:
+        dict[str, float]: Commits per second and reads per second.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = build_engine(f"sqlite:///{tmp}/bench.db", profile)
+        Base.metadata.create_all(engine)
+        with Session(engine) as session:
+            commercial = User(fullname="Bench", email="bench@test.com",
+                              role=UserRole.COMMERCIAL, password_hash="-")
+            session.add(commercial)
+            session.commit()
+
+            start = time.perf_counter()
+            for i in range(rows):
+                session.add(Client(fullname=f"Client {i}", email=f"c{i}@test.com",
+                                   phone=f"+33{i:09d}", commercial_id=commercial.id))
+                session.commit()
+            write_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            for i in range(rows):
+                session.query(Client).filter_by(phone=f"+33{i:09d}").first()
+            read_time = time.perf_counter() - start
+        engine.dispose()
+    return {"commits/s": rows / write_time, "reads/s": rows / read_time}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=500)
+    parser.add_argument("--profiles", default=",".join(SQLITE_PROFILES))
+    args = parser.parse_args()
+
+    print(f"{'profile':<8} {'commits/s':>12} {'reads/s':>12}")
+    for profile in args.profiles.split(","):
+        result = run_profile(profile, args.rows)
+        print(f"{profile:<8} {result['commits/s']:>12.0f} {result['reads/s']:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
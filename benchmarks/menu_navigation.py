@@ -0,0 +1,84 @@
+"""
+Measure the latency of one menu navigation step with each way of clearing.
+
+A step is what the CLI does when the user picks a menu entry: clear the
+screen, print the welcome line, clear again (display_success() clears before
+printing and most controller branches clear too), then draw the next menu.
+Output goes to a null terminal, so only the cost of producing it is timed.
+
+Variants:
+    subprocess   the former CustomConsole.clear(): os.system("clear"), POSIX only
+    ansi         control sequences written directly, every clear honoured
+    ansi+skip    the current CustomConsole: clears of a clean screen are skipped
+
+Usage:
+    python -m benchmarks.menu_navigation [--steps N]
+"""
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rich.console import Console
+
+from config.console import CustomConsole
+
+OPTIONS = ["Clients", "Contracts", "Events", "Collaborators", "Log out", "Quit"]
+
+
+class SubprocessConsole(Console):
+    """The console as it was: one shell per clear (output discarded)."""
+
+    def clear(self, home: bool = True) -> None:
+        os.system("clear >/dev/null 2>&1")
+
+
+class AnsiConsole(CustomConsole):
+    """The current console without skipping the clears of a clean screen."""
+
+    def clear(self, home: bool = True) -> None:
+        self._dirty = True
+        super().clear(home)
+
+
+VARIANTS = {
+    "subprocess": SubprocessConsole,
+    "ansi": AnsiConsole,
+    "ansi+skip": CustomConsole,
+}
+
+
+def step(console: Console) -> None:
+    """
+    Run one navigation step.
+
+    Args:
+        console (Console): The console to draw on.
+    """
+    console.clear()
+    console.clear()
+    console.print("[bold green]Welcome Homer Simpson (Gestion)")
+    console.rule("[bold royal_blue1]Main Menu")
+    for idx, item in enumerate(OPTIONS, 1):
+        console.print(f"[royal_blue1]{idx}.[/royal_blue1] {item}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--steps", type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"{'variant':<12} {'ms/step':>9} {'steps/s':>9}")
+    with open(os.devnull, "w") as null:
+        for name, console_class in VARIANTS.items():
+            if name == "subprocess" and os.name != "posix":
+                continue
+            console = console_class(file=null, force_terminal=True, width=100)
+            seconds = timeit.timeit(lambda: step(console), number=args.steps) / args.steps
+            print(f"{name:<12} {seconds * 1000:>9.3f} {1 / seconds:>9.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Measure how bulk password hashing scales with the number of processes.
+
+The same batch of passwords is hashed with 1, 2, 4, ... workers up to the CPU
+count; the speedup and parallel efficiency are reported against one worker.
+argon2 hashes are independent and CPU-bound, so the speedup should stay close
+to the worker count until the cores (or memory bandwidth) run out.
+
+Usage:
+    python -m benchmarks.password_hashing [--passwords N] [--profile prod] [--max-workers N]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from controllers.services.user_provisioning import hash_passwords
+from models.user import ARGON2_PROFILES
+
+
+def worker_counts(max_workers: int) -> list[int]:
+    """
+    List the worker counts to try: powers of two, then the maximum.
+
+    Args:
+        max_workers (int): The largest worker count.
+
+    Returns:
+        list[int]: The increasing worker counts.
+    """
+    counts = []
+    n = 1
+    while n < max_workers:
+        counts.append(n)
+        n *= 2
+    counts.append(max_workers)
+    return counts
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--passwords", type=int, default=64)
+    parser.add_argument("--profile", default="prod", choices=ARGON2_PROFILES)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    passwords = [f"Password{i:06d}!" for i in range(args.passwords)]
+    print(f"{args.passwords} passwords, profile {args.profile}, {os.cpu_count()} CPUs")
+    print(f"{'workers':>7} {'seconds':>9} {'hashes/s':>10} {'speedup':>8} {'efficiency':>10}")
+    baseline = None
+    for workers in worker_counts(args.max_workers):
+        start = time.perf_counter()
+        hash_passwords(passwords, workers, args.profile)
+        elapsed = time.perf_counter() - start
+        baseline = baseline or elapsed
+        speedup = baseline / elapsed
+        print(f"{workers:>7} {elapsed:>9.2f} {args.passwords / elapsed:>10.1f} "
+              f"{speedup:>8.2f} {speedup / workers:>10.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,434 @@
+"""
+Benchmark the repository, controller and view hot paths at several scales.
+
+For each scale a database is generated with database/synthetic.py, then every
+case is called repeatedly: repository listings, table rendering, login and the
+create/update paths of the controllers. Each case reports its latency
+percentiles, the SQL statements it runs per call and the peak memory it
+allocates (tracemalloc, measured on one extra call so timings stay clean).
+
+Results can be saved as a baseline and compared on a later run; the exit code
+is 1 when a case got slower than the threshold or runs more queries.
+
+Usage:
+    python -m benchmarks.suite [--scales 100,1000,10000] [--repeat N] [--cases client]
+        [--save baseline.json] [--baseline baseline.json] [--threshold 0.25]
+"""
+import argparse
+import io
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from decimal import Decimal
+from itertools import count
+from pathlib import Path
+from typing import Callable
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("JWT_SECRET", "benchmark-secret-with-enough-bytes-for-hs256")
+
+from rich.console import Console
+from sqlalchemy import Engine, event, func, select
+from sqlalchemy.orm import Session
+
+import controllers.services.token_cache as token_cache
+from config.console import CustomConsole
+from controllers.client_controller import ClientController
+from controllers.contract_controller import ContractController
+from controllers.event_controller import EventController
+from controllers.repositories.client_repository import ClientRepository
+from controllers.repositories.contract_repository import ContractRepository
+from controllers.repositories.event_repository import EventRepository
+from controllers.repositories.user_repository import UserRepository
+from controllers.services.auth import generate_token
+from controllers.services.auth_context import auth_context
+from controllers.user_controller import UserController
+from database.session import SQLITE_PROFILES, build_engine
+from database.synthetic import DatasetSpec, populate
+from models.base import Base
+from models.client import Client
+from models.contract import Contract
+from models.event import Event
+from models.user import User
+from models.user_role import UserRole
+from views.client_view import ClientsView
+from views.contract_view import ContractsView
+from views.event_view import EventsView
+from views.user_view import UsersView
+
+PASSWORD = DatasetSpec.password
+
+
+@dataclass
+class Result:
+    """
+    Measurements of one case at one scale.
+
+    Attributes:
+        p50 (float): Median latency in milliseconds.
+        p95 (float): 95th percentile latency in milliseconds.
+        p99 (float): 99th percentile latency in milliseconds.
+        queries (float): SQL statements executed per call.
+        peak_kib (float): Peak memory allocated by one call, in KiB.
+    """
+
+    p50: float
+    p95: float
+    p99: float
+    queries: float
+    peak_kib: float
+
+
+@dataclass
+class Fixture:
+    """
+    Database and well-known rows a scale's cases run against.
+
+    Attributes:
+        engine (Engine): The engine of the generated database.
+        gestion (User): A gestion user.
+        commercial (User): The commercial with the largest portfolio.
+        support (User): The support user with the most events.
+        client_id (int): A client of ``commercial``.
+        contract_id (int): A signed contract of ``commercial``.
+        event_id (int): The first event.
+        render_rows (int): Number of rows rendered by the table cases.
+    """
+
+    engine: Engine
+    gestion: User
+    commercial: User
+    support: User
+    client_id: int
+    contract_id: int
+    event_id: int
+    render_rows: int
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    """
+    Return a percentile of samples, interpolating between the closest ranks.
+
+    Args:
+        samples (list[float]): The measured values.
+        pct (float): The percentile, between 0 and 100.
+
+    Returns:
+        float: The value below which ``pct`` percent of the samples fall.
+    """
+    ordered = sorted(samples)
+    rank = (len(ordered) - 1) * pct / 100
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def login_as(user: User) -> None:
+    """
+    Make a user the current user, as a login would, without hashing a password.
+
+    Args:
+        user (User): The user whose token is cached.
+    """
+    token_cache.save_token(generate_token(user))
+    auth_context.clear()
+
+
+def _first(engine: Engine, statement):
+    with engine.connect() as conn:
+        return conn.execute(statement).scalar()
+
+
+def build_fixture(engine: Engine, clients: int, render_rows: int) -> Fixture:
+    """
+    Generate a database for a scale and pick the rows the cases work on.
+
+    Args:
+        engine (Engine): The engine of an empty database.
+        clients (int): Number of clients to generate; users scale with it.
+        render_rows (int): Number of rows rendered by the table cases.
+
+    Returns:
+        Fixture: The loaded database and its well-known rows.
+    """
+    Base.metadata.create_all(engine)
+    populate(engine, DatasetSpec(users=max(10, clients // 100), clients=clients))
+    commercial_id = _first(engine, select(Client.commercial_id).group_by(Client.commercial_id)
+                           .order_by(func.count().desc()).limit(1))
+    support_id = _first(engine, select(Event.support_contact_id).where(Event.support_contact_id.is_not(None))
+                        .group_by(Event.support_contact_id).order_by(func.count().desc()).limit(1))
+    with Session(engine, expire_on_commit=False) as session:
+        users = UserRepository(session)
+        return Fixture(
+            engine=engine,
+            gestion=session.scalars(select(User).where(User.role == UserRole.GESTION).limit(1)).one(),
+            commercial=users.get_by_id(commercial_id),
+            support=users.get_by_id(support_id),
+            client_id=_first(engine, select(Client.id).where(Client.commercial_id == commercial_id).limit(1)),
+            contract_id=_first(engine, select(Contract.id).where(
+                Contract.commercial_id == commercial_id, Contract.is_signed.is_(True)).limit(1)),
+            event_id=_first(engine, select(func.min(Event.id))),
+            render_rows=render_rows,
+        )
+
+
+# Each case factory gets the fixture and a fresh session, logs in whoever the
+# case needs and returns the zero-argument callable to time.
+CaseFactory = Callable[[Fixture, Session], Callable[[], object]]
+_serial = count()
+
+
+class _NullOutput(io.TextIOBase):
+    """Text stream that discards everything, without holding a file open."""
+
+    def write(self, text: str) -> int:
+        return len(text)
+
+
+_NULL_OUTPUT = _NullOutput()
+
+
+def _null_console() -> Console:
+    return CustomConsole(file=_NULL_OUTPUT, width=200, force_terminal=True)
+
+
+def _render(view_method: Callable, fetch_rows: Callable) -> Callable[[], object]:
+    rows = fetch_rows()
+    return lambda: view_method(rows)
+
+
+def _login(fx: Fixture, session: Session) -> Callable[[], object]:
+    controller = UserController(session)
+    return lambda: controller.authenticate(fx.commercial.email, PASSWORD)
+
+
+def _create_client(fx: Fixture, session: Session) -> Callable[[], object]:
+    login_as(fx.commercial)
+    controller = ClientController(session, fx.commercial, _null_console())
+
+    def run():
+        n = next(_serial)
+        return controller._create_client("Bench Client", f"bench{n}@bench.io",
+                                         f"+1{n:010d}", "Bench Inc")
+    return run
+
+
+def _update_client(fx: Fixture, session: Session) -> Callable[[], object]:
+    login_as(fx.commercial)
+    controller = ClientController(session, fx.commercial, _null_console())
+    client = controller.get_client_by_id(fx.client_id)
+    email, phone = client.email, client.phone
+    return lambda: controller._update_client(client_id=fx.client_id, fullname="Bench Update",
+                                             email=email, phone=phone, company="Bench Inc")
+
+
+def _create_contract(fx: Fixture, session: Session) -> Callable[[], object]:
+    login_as(fx.gestion)
+    controller = ContractController(session, fx.gestion, _null_console())
+    return lambda: controller._create_contract(client_id=fx.client_id, amount=Decimal("1000"),
+                                               is_signed=True, end_date="2030-12-31")
+
+
+def _update_contract(fx: Fixture, session: Session) -> Callable[[], object]:
+    login_as(fx.gestion)
+    controller = ContractController(session, fx.gestion, _null_console())
+    return lambda: controller._update_contract(contract_id=fx.contract_id, remaining=Decimal("10"))
+
+
+def _create_event(fx: Fixture, session: Session) -> Callable[[], object]:
+    login_as(fx.commercial)
+    controller = EventController(session, fx.commercial, _null_console())
+    return lambda: controller._create_event(contract_id=fx.contract_id, name="Bench Event",
+                                            start_date="2030-06-01 10:00", end_date="2030-06-01 18:00",
+                                            location="Bench Hall", attendees=50)
+
+
+def _update_event(fx: Fixture, session: Session) -> Callable[[], object]:
+    login_as(fx.gestion)
+    controller = EventController(session, fx.gestion, _null_console())
+    return lambda: controller._update_event(event_id=fx.event_id, attendees=80)
+
+
+CASES: dict[str, CaseFactory] = {
+    "user_repo.list_all": lambda fx, s: UserRepository(s).list_all,
+    "client_repo.list_all": lambda fx, s: ClientRepository(s).list_all,
+    "client_repo.list_by_commercial":
+        lambda fx, s: lambda: ClientRepository(s).list_by_commercial(fx.commercial.id),
+    "contract_repo.list_all": lambda fx, s: ContractRepository(s).list_all,
+    "contract_repo.list_by_commercial":
+        lambda fx, s: lambda: ContractRepository(s).list_by_commercial(fx.commercial.id),
+    "contract_repo.list_unsigned": lambda fx, s: ContractRepository(s).list_unsigned,
+    "contract_repo.list_unpaid": lambda fx, s: ContractRepository(s).list_unpaid,
+    "event_repo.list_all": lambda fx, s: EventRepository(s).list_all,
+    "event_repo.list_by_support_contact":
+        lambda fx, s: lambda: EventRepository(s).list_by_support_contact(fx.support.id),
+    "event_repo.list_without_support": lambda fx, s: EventRepository(s).list_without_support,
+    "view.display_user_table": lambda fx, s: _render(
+        UsersView(_null_console()).display_user_table,
+        lambda: UserRepository(s).page(limit=fx.render_rows).items),
+    "view.display_client_table": lambda fx, s: _render(
+        ClientsView(_null_console()).display_client_table,
+        lambda: ClientRepository(s).page(limit=fx.render_rows).items),
+    "view.display_contract_table": lambda fx, s: _render(
+        ContractsView(fx.gestion, _null_console()).display_contract_table,
+        lambda: ContractRepository(s).page(limit=fx.render_rows).items),
+    "view.display_event_table": lambda fx, s: _render(
+        EventsView(_null_console()).display_event_table,
+        lambda: EventRepository(s).page(limit=fx.render_rows).items),
+    "user_controller.authenticate": _login,
+    "client_controller.create": _create_client,
+    "client_controller.update": _update_client,
+    "contract_controller.create": _create_contract,
+    "contract_controller.update": _update_contract,
+    "event_controller.create": _create_event,
+    "event_controller.update": _update_event,
+}
+
+
+def measure(engine: Engine, func: Callable[[], object], repeat: int) -> Result:
+    """
+    Time a callable and count the statements and memory of its calls.
+
+    Args:
+        engine (Engine): The engine whose statements are counted.
+        func (Callable[[], object]): The case to measure.
+        repeat (int): Number of timed calls, after one warm-up call.
+
+    Returns:
+        Result: The measurements.
+    """
+    statements = 0
+
+    def _count(*args) -> None:
+        nonlocal statements
+        statements += 1
+
+    func()
+    event.listen(engine, "before_cursor_execute", _count)
+    try:
+        samples = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            samples.append((time.perf_counter() - start) * 1000)
+    finally:
+        event.remove(engine, "before_cursor_execute", _count)
+
+    tracemalloc.start()
+    try:
+        func()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return Result(
+        p50=statistics.median(samples),
+        p95=percentile(samples, 95),
+        p99=percentile(samples, 99),
+        queries=statements / repeat,
+        peak_kib=peak / 1024,
+    )
+
+
+def compare(
+    results: dict[str, dict],
+    baseline: dict[str, dict],
+    threshold: float,
+    slack_ms: float = 0.05
+) -> list[str]:
+    """
+    List the cases that regressed against a baseline.
+
+    A case regresses when its median latency grew by more than ``threshold``
+    (and by more than ``slack_ms``, so sub-millisecond noise is ignored) or
+    when it runs more SQL statements per call.
+
+    Args:
+        results (dict[str, dict]): Current results, keyed by "scale/case".
+        baseline (dict[str, dict]): Saved results, same layout.
+        threshold (float): Allowed relative slowdown, 0.25 for +25%.
+        slack_ms (float): Absolute slowdown always tolerated, in milliseconds.
+
+    Returns:
+        list[str]: One line per regression, empty when everything is within bounds.
+    """
+    regressions = []
+    for key, current in results.items():
+        previous = baseline.get(key)
+        if previous is None:
+            continue
+        limit = max(previous["p50"] * (1 + threshold), previous["p50"] + slack_ms)
+        if current["p50"] > limit:
+            regressions.append(f"{key}: p50 {previous['p50']:.2f} -> {current['p50']:.2f} ms")
+        if current["queries"] > previous["queries"]:
+            regressions.append(f"{key}: queries {previous['queries']:g} -> {current['queries']:g}")
+    return regressions
+
+
+def run_scale(clients: int, args: argparse.Namespace, tmp: str) -> dict[str, dict]:
+    """
+    Generate the database of a scale and measure every selected case on it.
+
+    Args:
+        clients (int): Number of clients of the scale.
+        args (argparse.Namespace): The command line options.
+        tmp (str): Directory for the database file.
+
+    Returns:
+        dict[str, dict]: The results, keyed by "scale/case".
+    """
+    engine = build_engine(f"sqlite:///{tmp}/bench_{clients}.db", args.db_profile)
+    start = time.perf_counter()
+    fx = build_fixture(engine, clients, args.render_rows)
+    print(f"\n{clients} clients (generated in {time.perf_counter() - start:.1f}s)")
+    print(f"{'case':<36} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'queries':>8} {'peak KiB':>9}")
+
+    results = {}
+    for name, factory in CASES.items():
+        if args.cases and not any(pattern in name for pattern in args.cases.split(",")):
+            continue
+        with Session(engine) as session:
+            result = measure(engine, factory(fx, session), args.repeat)
+        results[f"{clients}/{name}"] = asdict(result)
+        print(f"{name:<36} {result.p50:>9.2f} {result.p95:>9.2f} {result.p99:>9.2f} "
+              f"{result.queries:>8g} {result.peak_kib:>9.0f}")
+    engine.dispose()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--scales", default="100,1000,10000", help="Client counts, comma-separated")
+    parser.add_argument("--repeat", type=int, default=20, help="Timed calls per case")
+    parser.add_argument("--render-rows", type=int, default=100, help="Rows rendered by the table cases")
+    parser.add_argument("--cases", default="", help="Only run the cases containing one of these substrings")
+    parser.add_argument("--db-profile", default="prod", choices=SQLITE_PROFILES)
+    parser.add_argument("--save", type=Path, help="Write the results to this baseline file")
+    parser.add_argument("--baseline", type=Path, help="Compare against this baseline file")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed p50 slowdown, 0.25 = +25%%")
+    args = parser.parse_args()
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        token_cache.TOKEN_PATH = Path(tmp) / "token"
+        for clients in map(int, args.scales.split(",")):
+            results.update(run_scale(clients, args, tmp))
+
+    if args.save:
+        args.save.write_text(json.dumps(results, indent=2, sort_keys=True))
+        print(f"\nBaseline saved to {args.save}")
+    if args.baseline:
+        regressions = compare(results, json.loads(args.baseline.read_text()), args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) against {args.baseline}:")
+            print("\n".join(f"  {line}" for line in regressions))
+            sys.exit(1)
+        print(f"\nNo regression against {args.baseline} (threshold {args.threshold:.0%}).")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+Compare the output formats of the listings on a large client table.
+
+A synthetic database is generated, then ClientsView.display_client_table()
+prints every client in each format. The rich table gets the full list, as a
+rich Table needs every row before it can print; the streamed formats read the
+clients page by page from the repository (iter_pages). Output goes to a null
+terminal. For each format the time to the first printed row, the total time
+and the peak memory allocated are reported.
+
+Usage:
+    python -m benchmarks.table_output [--clients N] [--formats rich,plain,tsv,json]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from config.console import CustomConsole
+from controllers.repositories.client_repository import ClientRepository
+from controllers.repositories.pagination import iter_pages
+from database.synthetic import DatasetSpec, populate
+from models.base import Base
+from views.client_view import ClientsView
+
+
+class FirstWrite:
+    """Null output that remembers when it was first written to."""
+
+    def __init__(self) -> None:
+        self.first = None
+
+    def write(self, text: str) -> int:
+        if self.first is None:
+            self.first = time.perf_counter()
+        return len(text)
+
+    def flush(self) -> None:
+        pass
+
+    def isatty(self) -> bool:
+        return True
+
+
+def run_format(session: Session, fmt: str, page_size: int) -> dict[str, float]:
+    """
+    Print every client in one format.
+
+    Args:
+        session (Session): Session on the generated database.
+        fmt (str): The output format.
+        page_size (int): Clients per page read by the streamed formats.
+
+    Returns:
+        dict[str, float]: First row and total time in ms, peak memory in MiB.
+    """
+    out = FirstWrite()
+    view = ClientsView(CustomConsole(file=out, force_terminal=True, width=200))
+    session.expunge_all()
+    tracemalloc.start()
+    start = time.perf_counter()
+    repo = ClientRepository(session)
+    if fmt == "rich":
+        clients = repo.list_all()
+    else:
+        clients = iter_pages(repo.page, limit=page_size)
+    view.display_client_table(clients, fmt=fmt)
+    total = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {
+        "first_ms": (out.first - start) * 1000,
+        "total_ms": total * 1000,
+        "peak_mib": peak / 2**20,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--clients", type=int, default=5000)
+    parser.add_argument("--formats", default="rich,plain,tsv,json")
+    parser.add_argument("--page-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        Base.metadata.create_all(engine)
+        populate(engine, DatasetSpec(users=max(10, args.clients // 100), clients=args.clients,
+                                     contracts_per_client=0, events_per_contract=0))
+        print(f"{args.clients} clients")
+        print(f"{'format':<8} {'first row ms':>12} {'total ms':>10} {'peak MiB':>9}")
+        with Session(engine) as session:
+            for fmt in args.formats.split(","):
+                result = run_format(session, fmt, args.page_size)
+                print(f"{fmt:<8} {result['first_ms']:>12.1f} {result['total_ms']:>10.1f} "
+                      f"{result['peak_mib']:>9.1f}")
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,538 @@
+"""
+Non-interactive command line: one CRM operation per command, no menus.
+
+    python cli.py login homer@test.com
+    python cli.py clients list --mine --format json
+    python cli.py contracts list --unpaid --format tsv
+    python cli.py events assign 12 13 --support 5
+    python cli.py users import new_hires.csv
+
+Commands authenticate with the cached token of the last login, like
+export.py and import_clients.py, and go through the same controllers and
+permission checks as the menus. Nothing is prompted (except the password of
+``login``) and the screen is never cleared. Listings are read page by page
+and streamed in the chosen format (views/renderers.py); a created or updated
+record is printed as a one-row listing. Messages and errors go to stderr and
+the exit status tells what failed, see EXIT_CODES.
+
+``batch`` runs one command per line of a file (or stdin) in a single
+process, which saves the interpreter start-up and the login check of each
+command.
+"""
+import argparse
+import csv
+import getpass
+import shlex
+import sys
+from contextlib import nullcontext
+from dataclasses import dataclass
+from functools import partial
+from typing import Callable, Sequence, TextIO
+
+from sqlalchemy.orm import Session
+
+from config.console import CustomConsole
+from controllers.client_controller import ClientController
+from controllers.contract_controller import ContractController
+from controllers.event_controller import EventController
+from controllers.repositories.pagination import iter_pages
+from controllers.services.auth import get_current_user
+from controllers.services.auth_context import auth_context
+from controllers.services.permissions import is_allowed
+from controllers.services.token_cache import delete_token
+from controllers.services.user_provisioning import provision_users
+from controllers.user_controller import UserController
+from database.session import SessionLocal
+from exceptions import (
+    CrmAuthenticationError,
+    CrmError,
+    CrmForbiddenAccessError,
+    CrmInvalidValue,
+    CrmNotFoundError,
+)
+from models.user import User
+from views.base import render_table
+from views.client_view import CLIENT_COLUMNS, CLIENT_WIDTHS, ClientsView
+from views.contract_view import CONTRACT_COLUMNS, CONTRACT_WIDTHS, ContractsView
+from views.event_view import EVENT_COLUMNS, EVENT_WIDTHS, EventsView
+from views.renderers import OUTPUT_FORMATS
+from views.user_view import USER_COLUMNS, USER_WIDTHS, UsersView
+
+# Exit status of each error, the most specific class first; 2 is argparse's usage error
+EXIT_CODES = (
+    (CrmAuthenticationError, 3),
+    (CrmForbiddenAccessError, 4),
+    (CrmNotFoundError, 5),
+    (CrmError, 1),
+)
+
+
+@dataclass(frozen=True)
+class Entity:
+    """
+    How the records of one entity are printed.
+
+    Attributes:
+        columns (list[str]): The column names.
+        widths (list[int]): The fixed-width text column widths.
+        format_row (Callable): Turns a record into its cells.
+    """
+
+    columns: list[str]
+    widths: list[int]
+    format_row: Callable
+
+
+ENTITIES = {
+    "clients": Entity(CLIENT_COLUMNS, CLIENT_WIDTHS, ClientsView.format_row),
+    "contracts": Entity(CONTRACT_COLUMNS, CONTRACT_WIDTHS, ContractsView.format_row),
+    "events": Entity(EVENT_COLUMNS, EVENT_WIDTHS, EventsView.format_row),
+    "users": Entity(USER_COLUMNS, USER_WIDTHS, UsersView.format_row),
+}
+
+# (entity, filter) -> permission, title and the page method of the controller to walk
+LISTINGS = {
+    ("clients", None): ("client.list", "All Clients", lambda c: c.repo.page),
+    ("clients", "mine"): ("client.list_own", "My Clients", lambda c: c.own_repo.page),
+    ("contracts", None): ("contract.list", "All Contracts", lambda c: c.repo.page),
+    ("contracts", "mine"): ("contract.list_own", "My Contracts", lambda c: c.own_repo.page),
+    ("contracts", "unsigned"): ("contract.list_unsigned", "Unsigned Contracts",
+                                lambda c: partial(c.own_repo.page, unsigned=True)),
+    ("contracts", "unpaid"): ("contract.list_unpaid", "Unpaid Contracts",
+                              lambda c: partial(c.own_repo.page, unpaid=True)),
+    ("events", None): ("event.list", "All Events", lambda c: c.repo.page),
+    ("events", "mine"): ("event.list_own", "My Events", lambda c: c.own_repo.page),
+    ("events", "unassigned"): ("event.list_unassigned", "Unassigned Events",
+                               lambda c: partial(c.repo.page, unassigned=True)),
+    ("users", None): ("user.list", "All Users", lambda c: c.repo.page),
+}
+
+
+class Context:
+    """
+    What the commands share: the session, the consoles and the current user.
+    """
+
+    def __init__(self, session: Session, output: CustomConsole, messages: CustomConsole) -> None:
+        """
+        Initialize the context.
+
+        Args:
+            session (Session): Database session used by every command.
+            output (CustomConsole): Where listings and records are printed.
+            messages (CustomConsole): Where the controllers' messages go (stderr).
+        """
+        self.session = session
+        self.output = output
+        self.messages = messages
+
+    def user(self) -> User:
+        """
+        Return the user of the cached token.
+
+        Returns:
+            User: The authenticated user.
+
+        Raises:
+            CrmAuthenticationError: If nobody is logged in or the token expired.
+        """
+        return get_current_user(self.session)
+
+    def controller(self, entity: str):
+        """
+        Build the controller of an entity for the current user.
+
+        Args:
+            entity (str): One of ENTITIES.
+
+        Returns:
+            The controller.
+        """
+        if entity == "users":
+            return UserController(self.session)
+        controller_class = {
+            "clients": ClientController,
+            "contracts": ContractController,
+            "events": EventController,
+        }[entity]
+        return controller_class(self.session, self.user(), self.messages)
+
+    def print_records(self, entity: str, title: str, records, fmt: str, row_count: int | None = None) -> int:
+        """
+        Print records in the chosen format.
+
+        Args:
+            entity (str): One of ENTITIES.
+            title (str): The listing title.
+            records: The records, a list or an iterator.
+            fmt (str): One of views.renderers.OUTPUT_FORMATS.
+            row_count (int | None): Number of records if known.
+
+        Returns:
+            int: The number of records printed.
+        """
+        spec = ENTITIES[entity]
+        rows = (spec.format_row(record) for record in records)
+        return render_table(self.output, title, spec.columns, rows, row_count, spec.widths,
+                            fmt, show_empty=True)
+
+
+def _require(user: User, action: str) -> None:
+    """
+    Check a permission of the current user.
+
+    Args:
+        user (User): The current user.
+        action (str): An action of the permission table.
+
+    Raises:
+        CrmForbiddenAccessError: If the role lacks the permission.
+    """
+    if not is_allowed(user.role, action):
+        raise CrmForbiddenAccessError
+
+
+def cmd_login(ctx: Context, args: argparse.Namespace) -> None:
+    """Log in and cache the token for the next commands."""
+    if args.password_stdin:
+        password = sys.stdin.readline().rstrip("\n")
+    else:
+        password = getpass.getpass("Password: ")
+    try:
+        user = UserController(ctx.session).authenticate(args.email, password)
+    except CrmInvalidValue as e:
+        raise CrmAuthenticationError(str(e)) from e
+    ctx.print_records("users", "Logged in", [user], args.format, 1)
+
+
+def cmd_logout(ctx: Context, args: argparse.Namespace) -> None:
+    """Delete the cached token."""
+    delete_token()
+    auth_context.clear()
+
+
+def cmd_whoami(ctx: Context, args: argparse.Namespace) -> None:
+    """Print the user of the cached token."""
+    ctx.print_records("users", "Current user", [ctx.user()], args.format, 1)
+
+
+def cmd_list(ctx: Context, args: argparse.Namespace) -> None:
+    """Stream a listing, one page of the repository at a time."""
+    permission, title, page_method = LISTINGS[(args.entity, args.filter)]
+    if args.entity == "users":
+        _require(ctx.user(), permission)
+        controller = ctx.controller("users")
+    else:
+        controller = ctx.controller(args.entity)
+        _require(controller.current_user, permission)
+    records = iter_pages(page_method(controller), limit=args.batch_size)
+    ctx.print_records(args.entity, title, records, args.format)
+
+
+def _changes(args: argparse.Namespace, fields: Sequence[str]) -> dict:
+    """
+    Collect the options of an update that were given.
+
+    Args:
+        args (argparse.Namespace): The parsed command.
+        fields (Sequence[str]): The option destinations that map to controller arguments.
+
+    Returns:
+        dict: The given values by field name.
+    """
+    return {field: getattr(args, field) for field in fields if getattr(args, field) is not None}
+
+
+def cmd_clients_add(ctx: Context, args: argparse.Namespace) -> None:
+    """Create a client owned by the current commercial."""
+    client = ctx.controller("clients")._create_client(
+        fullname=args.fullname, email=args.email, phone=args.phone, company=args.company)
+    ctx.print_records("clients", "Created client", [client], args.format, 1)
+
+
+def cmd_clients_update(ctx: Context, args: argparse.Namespace) -> None:
+    """Update the given fields of a client, keeping the others."""
+    controller = ctx.controller("clients")
+    client = controller.get_client_by_id(args.id)
+    values = {field: getattr(client, field) for field in ("fullname", "email", "phone", "company")}
+    values.update(_changes(args, values))
+    client = controller._update_client(client_id=args.id, **values)
+    ctx.print_records("clients", "Updated client", [client], args.format, 1)
+
+
+def cmd_contracts_add(ctx: Context, args: argparse.Namespace) -> None:
+    """Create a contract for a client."""
+    contract = ctx.controller("contracts")._create_contract(
+        client_id=args.client, amount=args.amount, is_signed=args.signed, end_date=args.end_date)
+    ctx.print_records("contracts", "Created contract", [contract], args.format, 1)
+
+
+def cmd_contracts_update(ctx: Context, args: argparse.Namespace) -> None:
+    """Update the given fields of a contract."""
+    contract = ctx.controller("contracts")._update_contract(
+        contract_id=args.id, **_changes(args, ("amount", "remaining", "is_signed", "end_date")))
+    ctx.print_records("contracts", "Updated contract", [contract], args.format, 1)
+
+
+def cmd_events_add(ctx: Context, args: argparse.Namespace) -> None:
+    """Create an event under a signed contract of the current commercial."""
+    event = ctx.controller("events")._create_event(
+        contract_id=args.contract, name=args.name, start_date=args.start, end_date=args.end,
+        location=args.location, attendees=args.attendees, notes=args.notes)
+    ctx.print_records("events", "Created event", [event], args.format, 1)
+
+
+def cmd_events_update(ctx: Context, args: argparse.Namespace) -> None:
+    """Update the given fields of an event."""
+    controller = ctx.controller("events")
+    changes = _changes(args, ("name", "location", "attendees", "notes", "start_date", "end_date"))
+    if ("start_date" in changes) != ("end_date" in changes):
+        # The dates are validated together: fill in the one that is kept
+        event = controller.get_event_by_id(args.id)
+        changes.setdefault("start_date", f"{event.start_date:%Y-%m-%d %H:%M}")
+        changes.setdefault("end_date", f"{event.end_date:%Y-%m-%d %H:%M}")
+    event = controller._update_event(event_id=args.id, **changes)
+    ctx.print_records("events", "Updated event", [event], args.format, 1)
+
+
+def cmd_events_assign(ctx: Context, args: argparse.Namespace) -> None:
+    """Assign a support contact to one or more events, all or none of them."""
+    events = ctx.controller("events")._assign_support_many(event_ids=args.ids, support_contact_id=args.support)
+    ctx.print_records("events", "Assigned events", events, args.format, len(events))
+
+
+def cmd_users_import(ctx: Context, args: argparse.Namespace) -> None:
+    """Create the users of a CSV file; every row is validated before anything is written."""
+    try:
+        if args.source == "-":
+            source = nullcontext(sys.stdin)
+        else:
+            source = open(args.source, newline="", encoding="utf-8")
+        with source as rows:
+            count = provision_users(ctx.session, csv.DictReader(rows),
+                                    batch_size=args.batch_size, workers=args.workers)
+    except OSError as e:
+        raise CrmInvalidValue(f"Cannot read {args.source}: {e.strerror}") from e
+    print(f"Created {count} users.", file=sys.stderr)
+
+
+def _yes_no(value: str) -> bool:
+    """Parse a yes/no option value."""
+    if value.lower() in ("y", "yes", "true", "1"):
+        return True
+    if value.lower() in ("n", "no", "false", "0"):
+        return False
+    raise argparse.ArgumentTypeError("expected yes or no")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """
+    Build the parser of every command.
+
+    Returns:
+        argparse.ArgumentParser: The parser; each command sets ``handler``.
+    """
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--format", choices=OUTPUT_FORMATS, default=None,
+                        help="Output format (default: CRM_OUTPUT, or chosen from the output)")
+
+    parser = argparse.ArgumentParser(prog="crm", description="Run one Epic Events CRM operation.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    login = commands.add_parser("login", parents=[common], help="Log in and cache the token")
+    login.add_argument("email")
+    login.add_argument("--password-stdin", action="store_true",
+                       help="Read the password from the first line of stdin instead of prompting")
+    login.set_defaults(handler=cmd_login)
+    commands.add_parser("logout", help="Forget the cached token").set_defaults(handler=cmd_logout)
+    commands.add_parser("whoami", parents=[common],
+                        help="Print the logged-in user").set_defaults(handler=cmd_whoami)
+
+    filters = {
+        "clients": ("mine",),
+        "contracts": ("mine", "unsigned", "unpaid"),
+        "events": ("mine", "unassigned"),
+        "users": (),
+    }
+    actions = {}
+    for entity, entity_filters in filters.items():
+        entity_parser = commands.add_parser(entity, help=f"Manage {entity}")
+        actions[entity] = entity_parser.add_subparsers(dest="action", required=True)
+        listing = actions[entity].add_parser("list", parents=[common], help=f"List {entity}")
+        group = listing.add_mutually_exclusive_group()
+        for name in entity_filters:
+            group.add_argument(f"--{name}", dest="filter", action="store_const", const=name)
+        listing.add_argument("--batch-size", type=int, default=500,
+                             help="Rows read from the database per page")
+        listing.set_defaults(handler=cmd_list, entity=entity, filter=None)
+
+    add = actions["clients"].add_parser("add", parents=[common], help="Create a client")
+    for field in ("fullname", "email", "phone", "company"):
+        add.add_argument(f"--{field}", required=True)
+    add.set_defaults(handler=cmd_clients_add)
+    update = actions["clients"].add_parser("update", parents=[common], help="Update a client")
+    update.add_argument("id", type=int)
+    for field in ("fullname", "email", "phone", "company"):
+        update.add_argument(f"--{field}")
+    update.set_defaults(handler=cmd_clients_update)
+
+    add = actions["contracts"].add_parser("add", parents=[common], help="Create a contract")
+    add.add_argument("--client", type=int, required=True)
+    add.add_argument("--amount", required=True)
+    add.add_argument("--end-date", required=True, help="YYYY-MM-DD")
+    add.add_argument("--signed", action="store_true")
+    add.set_defaults(handler=cmd_contracts_add)
+    update = actions["contracts"].add_parser("update", parents=[common], help="Update a contract")
+    update.add_argument("id", type=int)
+    update.add_argument("--amount")
+    update.add_argument("--remaining")
+    update.add_argument("--signed", dest="is_signed", type=_yes_no, metavar="yes|no")
+    update.add_argument("--end-date", help="YYYY-MM-DD")
+    update.set_defaults(handler=cmd_contracts_update)
+
+    add = actions["events"].add_parser("add", parents=[common], help="Create an event")
+    add.add_argument("--contract", type=int, required=True)
+    add.add_argument("--name", required=True)
+    add.add_argument("--start", required=True, help="YYYY-MM-DD HH:MM")
+    add.add_argument("--end", required=True, help="YYYY-MM-DD HH:MM")
+    add.add_argument("--location", required=True)
+    add.add_argument("--attendees", type=int, required=True)
+    add.add_argument("--notes")
+    add.set_defaults(handler=cmd_events_add)
+    update = actions["events"].add_parser("update", parents=[common], help="Update an event")
+    update.add_argument("id", type=int)
+    update.add_argument("--name")
+    update.add_argument("--start", dest="start_date", help="YYYY-MM-DD HH:MM")
+    update.add_argument("--end", dest="end_date", help="YYYY-MM-DD HH:MM")
+    update.add_argument("--location")
+    update.add_argument("--attendees", type=int)
+    update.add_argument("--notes")
+    update.set_defaults(handler=cmd_events_update)
+    assign = actions["events"].add_parser("assign", parents=[common], help="Assign a support contact")
+    assign.add_argument("ids", type=int, nargs="+", metavar="id")
+    assign.add_argument("--support", type=int, required=True, help="ID of the support user")
+    assign.set_defaults(handler=cmd_events_assign)
+
+    import_users = actions["users"].add_parser(
+        "import", help="Create users from a CSV with columns fullname, email, role, password")
+    import_users.add_argument("source", help="CSV file, '-' for stdin")
+    import_users.add_argument("--batch-size", type=int, default=500,
+                              help="Users hashed and inserted per transaction")
+    import_users.add_argument("--workers", type=int, default=None,
+                              help="Password hashing processes (default: all CPUs)")
+    import_users.set_defaults(handler=cmd_users_import)
+
+    batch = commands.add_parser("batch", help="Run one command per line, in one process")
+    batch.add_argument("source", nargs="?", default="-", help="Command file, '-' for stdin (default)")
+    batch.add_argument("--keep-going", action="store_true", help="Run the next lines after a failure")
+    batch.set_defaults(handler=None)
+    return parser
+
+
+def exit_code(error: CrmError) -> int:
+    """
+    Return the exit status of an error.
+
+    Args:
+        error (CrmError): The error a command raised.
+
+    Returns:
+        int: The status, see EXIT_CODES.
+    """
+    for error_class, code in EXIT_CODES:
+        if isinstance(error, error_class):
+            return code
+    return 1
+
+
+def run_command(ctx: Context, args: argparse.Namespace) -> int:
+    """
+    Run one parsed command.
+
+    Args:
+        ctx (Context): The shared context.
+        args (argparse.Namespace): The parsed command.
+
+    Returns:
+        int: The exit status.
+    """
+    try:
+        args.handler(ctx, args)
+    except CrmError as e:
+        ctx.session.rollback()
+        print(f"Error: {e}", file=sys.stderr)
+        return exit_code(e)
+    return 0
+
+
+def run_batch(ctx: Context, parser: argparse.ArgumentParser, source: TextIO, keep_going: bool) -> int:
+    """
+    Run the commands of a file, one per line.
+
+    Blank lines and lines starting with ``#`` are skipped. Failures are
+    reported on stderr with their line number.
+
+    Args:
+        ctx (Context): The shared context.
+        parser (argparse.ArgumentParser): The command parser.
+        source (TextIO): The command lines.
+        keep_going (bool): Run the next lines after a failure instead of stopping.
+
+    Returns:
+        int: 0 if every command succeeded, else the status of the last failure.
+    """
+    status = 0
+    for number, line in enumerate(source, 1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        try:
+            args = parser.parse_args(shlex.split(line))
+        except SystemExit as e:
+            code = e.code if isinstance(e.code, int) else 2
+        else:
+            if args.handler is None or args.handler is cmd_login:
+                print(f"Line {number}: {args.command} is not allowed in a batch", file=sys.stderr)
+                code = 2
+            else:
+                code = run_command(ctx, args)
+        if code:
+            print(f"Line {number} failed: {line}", file=sys.stderr)
+            status = code
+            if not keep_going:
+                break
+    return status
+
+
+def main(argv: list[str] | None = None, output: CustomConsole | None = None) -> int:
+    """
+    Run one command, or a batch of them.
+
+    Args:
+        argv (list[str] | None): Command-line arguments, defaults to sys.argv.
+        output (CustomConsole | None): Where results are printed, stdout if None.
+
+    Returns:
+        int: The process exit code.
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    session = SessionLocal()
+    ctx = Context(session, output or CustomConsole(), CustomConsole(stderr=True))
+    try:
+        if args.command == "batch":
+            if args.source == "-":
+                return run_batch(ctx, parser, sys.stdin, args.keep_going)
+            try:
+                with open(args.source, encoding="utf-8") as source:
+                    return run_batch(ctx, parser, source, args.keep_going)
+            except OSError as e:
+                print(f"Error: {e}", file=sys.stderr)
+                return 1
+        return run_command(ctx, args)
+    finally:
+        session.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,50 @@
+"""
+Named user-facing actions (login, menu choices) for the opt-in diagnostics.
+
+The menu loops wrap each dispatched choice in track_action(); the SQL trace
+and the session profiler register themselves as observers to measure them.
+Without observers, track_action() costs a list check.
+"""
+from contextlib import ExitStack, contextmanager
+from typing import Callable, ContextManager, Iterator
+
+ActionObserver = Callable[[str], ContextManager]
+
+_observers: list[ActionObserver] = []
+
+
+def add_action_observer(observer: ActionObserver) -> None:
+    """
+    Register a context manager factory entered around every tracked action.
+
+    Args:
+        observer (ActionObserver): Called with the action name, returns a context manager.
+    """
+    _observers.append(observer)
+
+
+def remove_action_observer(observer: ActionObserver) -> None:
+    """
+    Unregister an observer added by add_action_observer().
+
+    Args:
+        observer (ActionObserver): The observer to remove.
+    """
+    _observers.remove(observer)
+
+
+@contextmanager
+def track_action(name: str) -> Iterator[None]:
+    """
+    Mark a block as one user-facing action for the registered observers.
+
+    Args:
+        name (str): The action name, e.g. "Clients: List clients".
+    """
+    if not _observers:
+        yield
+        return
+    with ExitStack() as stack:
+        for observer in list(_observers):
+            stack.enter_context(observer(name))
+        yield
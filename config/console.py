@@ -1,20 +1,93 @@
-import os
-import platform
+from contextlib import contextmanager
+from typing import Iterator
 
 from rich.console import Console
+from rich.segment import Segment
+
+# Erase the scrollback as well, like the `clear` command does
+CLEAR_SCROLLBACK = "\033[3J"
+
 
 class CustomConsole(Console):
-    def clear(self):
-        """Clear the console in a cross-platform way"""
-        cleared = False
-        if platform.system() == "Windows":
-            if os.system('cls') == 0:
-                cleared = True
-        if os.system('clear') == 0:
-            cleared = True
-        # If the system command did not work, try the ANSI sequence
-        if not cleared:
-            print("\033[H\033[J", end="")
+    """
+    Rich console that manages the screen with control sequences only.
+
+    clear() used to run `clear` (or `cls`) through os.system(), which cost a
+    shell fork+exec for nearly every message. The escape sequences are now
+    written directly (through the win32 console API on legacy Windows
+    terminals, by rich), and a clear is skipped while nothing has been written
+    since the previous one.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        # Whether anything was written since the last clear
+        self._dirty = True
+
+    def print(self, *args, **kwargs) -> None:
+        self._dirty = True
+        super().print(*args, **kwargs)
+
+    def rule(self, *args, **kwargs) -> None:
+        self._dirty = True
+        super().rule(*args, **kwargs)
+
+    def input(self, *args, **kwargs) -> str:
+        # The prompt and the echoed answer both land on the screen
+        self._dirty = True
+        return super().input(*args, **kwargs)
+
+    def write_text(self, text: str) -> None:
+        """
+        Write text as is: no markup, highlighting, wrapping or measuring.
+
+        Used by the streamed listings (views/renderers.py). Goes through the
+        console's buffer, so capture() and record still see it.
+
+        Args:
+            text (str): The text, line breaks included.
+        """
+        self._dirty = True
+        with self:
+            self._buffer.append(Segment(text))
+
+    def clear(self, home: bool = True) -> None:
+        """
+        Clear the screen and its scrollback, without spawning a process.
+
+        Nothing is written when the output is not a terminal (pipes, files)
+        or when the screen is still clean.
+
+        Args:
+            home (bool): Also move the cursor to the top-left corner.
+        """
+        if not self.is_terminal or not self._dirty:
+            return
+        super().clear(home)
+        if not self.legacy_windows and not self.is_alt_screen:
+            self.file.write(CLEAR_SCROLLBACK)
+            self.file.flush()
+        self._dirty = False
+
+    @contextmanager
+    def alternate_screen(self, enable: bool = True) -> Iterator[None]:
+        """
+        Run the block on the terminal's alternate screen, like full-screen programs.
+
+        The user's shell scrollback is left untouched and restored on exit.
+
+        Args:
+            enable (bool): Switch to the alternate screen; False makes this a no-op.
+        """
+        if not enable or not self.set_alt_screen(True):
+            yield
+            return
+        self._dirty = True
+        try:
+            yield
+        finally:
+            self.set_alt_screen(False)
+
 
 # Create a unique instance of the console
-console = CustomConsole()
\ No newline at end of file
+console = CustomConsole()
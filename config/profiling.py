@@ -0,0 +1,314 @@
+"""
+Per-action latency profiling of an interactive session.
+
+Enabled with ``main.py --profile`` (or ``CRM_PROFILE=1``), the profiler
+observes every tracked action (login, main menu entries and submenu choices,
+see config/actions.py) and splits its time into:
+
+* ``input``: waiting for the user at a prompt, excluded from everything else;
+* ``sql``: executing statements (engine events), with the statement count;
+* ``render``: printing (console.print / console.rule / console.write_text);
+* ``clear``: console.clear();
+* ``other``: the remaining busy time (Python code of the action).
+
+CPU time is reported next to the wall-clock busy time. ``--profile-detail``
+adds a cProfile of each action (paused at prompts and inside nested actions)
+and the peak memory it allocates (tracemalloc). Actions nest: a main menu
+entry includes the submenu choices made inside it.
+
+The report is written when the session ends.
+"""
+import atexit
+import cProfile
+import io
+import pstats
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable, Iterator
+
+from sqlalchemy import Engine, event
+
+from config.actions import add_action_observer, remove_action_observer
+
+# Running totals the actions take deltas of
+_COUNTERS = ("input_ms", "sql_ms", "queries", "render_ms", "clear_ms")
+
+
+@dataclass
+class ActionProfile:
+    """
+    Measurements of one tracked action.
+
+    Attributes:
+        name (str): The action name.
+        depth (int): Nesting level, 0 for top-level actions.
+        wall_ms (float): Wall-clock time, user input included.
+        cpu_ms (float): Process CPU time.
+        input_ms (float): Time spent waiting for the user at prompts.
+        sql_ms (float): Time spent executing SQL statements.
+        queries (int): Number of SQL statements.
+        render_ms (float): Time spent rendering with rich.
+        clear_ms (float): Time spent clearing the console.
+        peak_kib (float | None): Peak memory allocated above the start, detail mode only.
+        hotspots (str): The cProfile listing, detail mode only.
+        children (list[ActionProfile]): The actions run inside this one.
+    """
+
+    name: str
+    depth: int
+    wall_ms: float = 0.0
+    cpu_ms: float = 0.0
+    input_ms: float = 0.0
+    sql_ms: float = 0.0
+    queries: int = 0
+    render_ms: float = 0.0
+    clear_ms: float = 0.0
+    peak_kib: float | None = None
+    hotspots: str = ""
+    children: list["ActionProfile"] = field(default_factory=list)
+
+    @property
+    def busy_ms(self) -> float:
+        """float: Wall-clock time minus the time waiting for the user."""
+        return self.wall_ms - self.input_ms
+
+    @property
+    def other_ms(self) -> float:
+        """float: Busy time not spent in SQL, rendering or clearing."""
+        return self.busy_ms - self.sql_ms - self.render_ms - self.clear_ms
+
+
+@dataclass
+class _Frame:
+    """State of an action while it runs."""
+
+    profile: ActionProfile
+    counters: dict[str, float]
+    wall: float
+    cpu: float
+    profiler: cProfile.Profile | None = None
+    memory_start: int = 0
+    memory_peak: int = 0
+
+
+class SessionProfiler:
+    """
+    Profiles the tracked actions of a session.
+    """
+
+    def __init__(self, engine: Engine, console, detail: bool = False, top: int = 15) -> None:
+        """
+        Initialize the profiler.
+
+        Args:
+            engine (Engine): The engine whose statements are timed.
+            console: The shared rich console whose input, rendering and clearing are timed.
+            detail (bool): Also run cProfile and tracemalloc for every action.
+            top (int): Number of functions listed per action in detail mode.
+        """
+        self.engine = engine
+        self.console = console
+        self.detail = detail
+        self.top = top
+        self.started = datetime.now()
+        self.actions: list[ActionProfile] = []
+        self.totals = dict.fromkeys(_COUNTERS, 0.0)
+        self._stack: list[_Frame] = []
+        self._originals: dict[str, Callable] = {}
+        self._console_busy = False
+
+    def install(self) -> None:
+        """Hook the engine and the console, and start observing the tracked actions."""
+        event.listen(self.engine, "before_cursor_execute", self._before_execute)
+        event.listen(self.engine, "after_cursor_execute", self._after_execute)
+        for method, counter in (("input", "input_ms"), ("print", "render_ms"), ("rule", "render_ms"),
+                                ("write_text", "render_ms"), ("clear", "clear_ms")):
+            if not hasattr(self.console, method):
+                continue
+            self._originals[method] = getattr(self.console, method)
+            setattr(self.console, method, self._timed(self._originals[method], counter))
+        add_action_observer(self.action)
+        if self.detail:
+            tracemalloc.start()
+
+    def uninstall(self) -> None:
+        """Undo install()."""
+        event.remove(self.engine, "before_cursor_execute", self._before_execute)
+        event.remove(self.engine, "after_cursor_execute", self._after_execute)
+        for method in self._originals:
+            # Drop the instance attribute so the class method shows through again
+            delattr(self.console, method)
+        self._originals.clear()
+        remove_action_observer(self.action)
+        if self.detail:
+            tracemalloc.stop()
+
+    def _timed(self, func: Callable, counter: str) -> Callable:
+        """
+        Wrap a console method so its time is added to a counter.
+
+        Calls nested in a timed call (input() prints its prompt) are only
+        counted once. Prompts also pause the cProfile of the running action,
+        so waiting for the user does not drown its hotspots.
+
+        Args:
+            func (Callable): The bound console method.
+            counter (str): The counter receiving its duration.
+
+        Returns:
+            Callable: The wrapper.
+        """
+        pause = counter == "input_ms"
+
+        def wrapper(*args, **kwargs):
+            if self._console_busy:
+                return func(*args, **kwargs)
+            self._console_busy = True
+            profiler = self._stack[-1].profiler if pause and self._stack else None
+            if profiler:
+                profiler.disable()
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.totals[counter] += (time.perf_counter() - start) * 1000
+                self._console_busy = False
+                if profiler:
+                    profiler.enable()
+        return wrapper
+
+    def _before_execute(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        conn.info.setdefault("profile_start", []).append(time.perf_counter())
+
+    def _after_execute(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        start = conn.info["profile_start"].pop()
+        self.totals["sql_ms"] += (time.perf_counter() - start) * 1000
+        self.totals["queries"] += 1
+
+    @contextmanager
+    def action(self, name: str) -> Iterator[ActionProfile]:
+        """
+        Measure the block as one action.
+
+        Args:
+            name (str): The action name.
+
+        Yields:
+            ActionProfile: The measurements, filled in when the block exits.
+        """
+        parent = self._stack[-1] if self._stack else None
+        frame = _Frame(ActionProfile(name, len(self._stack)), dict(self.totals),
+                       time.perf_counter(), time.process_time())
+        if self.detail:
+            if parent is not None:
+                # The parent's profile and peak stop here, they resume when this one ends
+                parent.profiler.disable()
+                parent.memory_peak = max(parent.memory_peak, tracemalloc.get_traced_memory()[1])
+            tracemalloc.reset_peak()
+            frame.memory_start = tracemalloc.get_traced_memory()[0]
+            frame.profiler = cProfile.Profile()
+            frame.profiler.enable()
+        self._stack.append(frame)
+        try:
+            yield frame.profile
+        finally:
+            self._stack.pop()
+            self._finish(frame)
+            if parent is not None:
+                parent.profile.children.append(frame.profile)
+                if self.detail:
+                    parent.profiler.enable()
+            else:
+                self.actions.append(frame.profile)
+
+    def _finish(self, frame: _Frame) -> None:
+        """
+        Fill in the profile of an action that just ended.
+
+        Args:
+            frame (_Frame): The ended action.
+        """
+        profile = frame.profile
+        profile.wall_ms = (time.perf_counter() - frame.wall) * 1000
+        profile.cpu_ms = (time.process_time() - frame.cpu) * 1000
+        for counter in _COUNTERS:
+            setattr(profile, counter, self.totals[counter] - frame.counters[counter])
+        if frame.profiler is not None:
+            frame.profiler.disable()
+            peak = max(frame.memory_peak, tracemalloc.get_traced_memory()[1])
+            profile.peak_kib = max(0, peak - frame.memory_start) / 1024
+            out = io.StringIO()
+            pstats.Stats(frame.profiler, stream=out).sort_stats("cumulative").print_stats(self.top)
+            profile.hotspots = out.getvalue().strip()
+
+    def report(self) -> str:
+        """
+        Describe every action of the session.
+
+        Returns:
+            str: A table of the actions, then the hotspots in detail mode.
+        """
+        header = (f"{'action':<44} {'busy ms':>9} {'cpu ms':>8} {'sql ms':>8} {'queries':>7} "
+                  f"{'render ms':>9} {'clear ms':>8} {'other ms':>8} {'input ms':>9}"
+                  + (f" {'peak KiB':>9}" if self.detail else ""))
+        lines = [f"Session profile, started {self.started:%Y-%m-%d %H:%M:%S}", "", header]
+        details = []
+        for profile in self._flatten(self.actions):
+            name = ("  " * profile.depth + profile.name)[:44]
+            line = (f"{name:<44} {profile.busy_ms:>9.1f} {profile.cpu_ms:>8.1f} {profile.sql_ms:>8.1f} "
+                    f"{profile.queries:>7.0f} {profile.render_ms:>9.1f} {profile.clear_ms:>8.1f} "
+                    f"{profile.other_ms:>8.1f} {profile.input_ms:>9.1f}")
+            if profile.peak_kib is not None:
+                line += f" {profile.peak_kib:>9.0f}"
+            lines.append(line)
+            if profile.hotspots:
+                details.append(f"--- {profile.name}\n{profile.hotspots}")
+        return "\n".join(lines + [""] + details) + "\n"
+
+    def _flatten(self, profiles: list[ActionProfile]) -> Iterator[ActionProfile]:
+        """Yield the profiles depth-first, each followed by its children."""
+        for profile in profiles:
+            yield profile
+            yield from self._flatten(profile.children)
+
+    def write(self, path: str) -> None:
+        """
+        Write the report to a file.
+
+        Args:
+            path (str): The report file.
+        """
+        with open(path, "w") as f:
+            f.write(self.report())
+
+
+def default_report_path() -> str:
+    """
+    Return a new report file name in the working directory.
+
+    Returns:
+        str: e.g. "crm_profile_20250101_120000.txt".
+    """
+    return f"crm_profile_{datetime.now():%Y%m%d_%H%M%S}.txt"
+
+
+def enable_profiling(engine: Engine, console, path: str | None = None, detail: bool = False) -> SessionProfiler:
+    """
+    Profile the tracked actions of the session and write the report at exit.
+
+    Args:
+        engine (Engine): The application engine.
+        console: The shared rich console.
+        path (str | None): The report file, default_report_path() if None.
+        detail (bool): Also run cProfile and tracemalloc for every action.
+
+    Returns:
+        SessionProfiler: The installed profiler.
+    """
+    profiler = SessionProfiler(engine, console, detail)
+    profiler.install()
+    atexit.register(profiler.write, path or default_report_path())
+    return profiler
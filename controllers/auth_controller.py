@@ -3,10 +3,19 @@ from typing import Optional
 from sqlalchemy.orm import Session
 
 from controllers.user_controller import UserController
+from controllers.services.auth import get_current_user
+from controllers.services.auth_context import auth_context
+from controllers.services.authorization import get_token_payload_or_raise
 from controllers.services.token_cache import delete_token
 from models.user import User
-from views.auth_view import get_credentials, show_login_error, show_login_success, show_logout_success
-from exceptions import CrmInvalidValue
+from views.auth_view import (
+    get_credentials,
+    show_login_error,
+    show_login_success,
+    show_logout_success,
+    show_session_resumed,
+)
+from exceptions import CrmAuthenticationError, CrmInvalidValue
 
 
 class AuthController:
@@ -17,18 +26,49 @@ class AuthController:
         self.session = session
         self.user_controller = UserController(session)
 
-    def authenticate(self) -> User:
+    def authenticate(self, resume: bool = True) -> User:
         """
-        Prompt the user to log in until credentials are valid, return the user.
+        Return the authenticated user, prompting for credentials until they are valid.
+
+        Args:
+            resume (bool): First try to resume the session of the cached token.
 
         Returns:
             User: The authenticated user
         """
-        user = None
+        user = self.resume_session() if resume else None
         while not user:
             user = self.login_flow()
         return user
 
+    def resume_session(self) -> Optional[User]:
+        """
+        Resume the session of a still-valid cached token, without prompting.
+
+        Only the token signature and expiry are checked and the user is loaded
+        by ID, so the password hash is not verified again. A token whose user
+        is gone or whose role changed since login is discarded.
+
+        Returns:
+            Optional[User]: The user of the token, or None if a login is required.
+        """
+        try:
+            payload = get_token_payload_or_raise()
+        except CrmAuthenticationError:
+            # Missing, expired or invalid token: the next login replaces it
+            return None
+        try:
+            user = get_current_user(self.session)
+        except CrmAuthenticationError:
+            # Valid token of a deleted user
+            user = None
+        if user is None or user.role.value != payload.get("role"):
+            delete_token()
+            auth_context.clear()
+            return None
+        show_session_resumed(user)
+        return user
+
     def login_flow(self) -> Optional[User]:
         """
         Handle login flow: show form, authenticate via UserController, handle responses.
@@ -51,4 +91,5 @@ class AuthController:
         """
 
         delete_token()
+        auth_context.clear()
         show_logout_success()
\ No newline at end of file
@@ -2,14 +2,15 @@ from typing import Type
 
 from sqlalchemy.orm import Session
 
+from config.actions import track_action
 from config.console import Console
 from config.sentry_logging import capture_event
 from controllers.repositories.client_repository import ClientRepository
+from controllers.repositories.row_policy import RowPolicy
 from controllers.services.auth import get_current_user
 from controllers.services.authorization import (
-    get_client_owner_id,
-    requires_ownership_or_role,
-    requires_role,
+    get_client_with_owner,
+    requires_permission,
 )
 from controllers.validators.validators import (
     validate_company,
@@ -41,6 +42,9 @@ class ClientController:
         self.current_user = current_user
         self.console = console
         self.repo = ClientRepository(session)
+        # Every role may read all clients (client.list), so self.repo stays unrestricted;
+        # the "my clients" listings opt in to the row policy through own_repo
+        self.own_repo = ClientRepository(session, RowPolicy.for_user(current_user))
         self.view = client_view.ClientsView(console)
 
     def show_menu(self) -> None:
@@ -49,26 +53,32 @@ class ClientController:
         """
         while True:
             choice = self.view.show_menu(self.current_user.role.value)
-            if choice == "List clients":
-                self.list_clients()
-            elif choice == "List my clients":
-                clients = self.list_by_commercial()
-                self.view.display_client_table(clients, my_clients=True)
-            elif choice == "Add client":
-                self.add_client()
-            elif choice == "Edit client":
-                self.edit_client()
-            elif choice == "Back":
-                break
+            with track_action(f"Clients: {choice}"):
+                if choice == "List clients":
+                    self.list_clients()
+                elif choice == "List my clients":
+                    self.list_my_clients()
+                elif choice == "Add client":
+                    self.add_client()
+                elif choice == "Edit client":
+                    self.edit_client()
+                elif choice == "Back":
+                    break
 
     def list_clients(self) -> None:
         """
-        List clients: commercial sees own, others see all.
+        List all clients (all roles).
         """
-        clients = self.repo.list_all()
-        self.view.display_client_table(clients)
+        self.view.display_client_pages(self.repo.page)
 
-    @requires_role("commercial")
+    @requires_permission("client.list_own")
+    def list_my_clients(self) -> None:
+        """
+        List the clients of the current commercial, one page at a time.
+        """
+        self.view.display_client_pages(self.own_repo.page, my_clients=True)
+
+    @requires_permission("client.list_own")
     def list_by_commercial(self) -> list[Type[Client]]:
         """
         Lists all clients from the current commercial.
@@ -76,7 +86,7 @@ class ClientController:
         Returns:
             list[Type[Client]]: List of clients associated with the current commercial.
         """
-        return self.repo.list_by_commercial(self.current_user.id)
+        return self.own_repo.list_all()
 
     def add_client(self) -> None:
         """
@@ -92,7 +102,7 @@ class ClientController:
                           level="error", reason=str(e))
             self.view.show_error(str(e))
 
-    @requires_role("commercial")
+    @requires_permission("client.create")
     def _create_client(self, fullname: str, email: str, phone: str, company: str) -> Client:
         """
         Creates a new client in the database and associates it with the current commercial.
@@ -140,17 +150,29 @@ class ClientController:
             capture_event("Client update failed, user not authorized", level="error", reason=str(e))
             self.view.show_error("You can only update your own clients.")
 
-    @requires_ownership_or_role(get_client_owner_id, 'gestion')
-    def _update_client(self, client_id: int, fullname: str, email: str, phone: str, company: str) -> Client:
+    @requires_permission("client.update", get_client_with_owner, pass_as="client")
+    def _update_client(
+        self,
+        client_id: int,
+        fullname: str,
+        email: str,
+        phone: str,
+        company: str,
+        client: Client | None = None
+    ) -> Client:
         """
         Updates a client's information and returns it.
 
+        Values equal to the stored ones are kept without being validated
+        again, so a client without phone or company can still be updated.
+
         Args:
             client_id (int): The ID of the client to update.
             fullname (str): The new full name.
             email (str): The new email.
             phone (str): The new phone number.
             company (str): The new company name.
+            client (Client | None): The client, when already loaded by the ownership check.
 
         Returns:
             Client: The updated client.
@@ -158,16 +180,21 @@ class ClientController:
         Raises:
             CrmInvalidValue: If validation fails or email/phone already exists.
         """
-        client = self.get_client_by_id(client_id)
+        if client is None:
+            client = self.get_client_by_id(client_id)
 
-        fullname = validate_name(fullname)
-        email = validate_email(email)
-        if self.repo.get_by_email(email) and not client.email == email:
-            raise CrmInvalidValue("Email already exists.")
-        phone = validate_phone(phone)
-        if self.repo.get_by_phone(phone) and not client.phone == phone:
-            raise CrmInvalidValue("Phone already exists.")
-        company = validate_company(company)
+        if fullname != client.fullname:
+            fullname = validate_name(fullname)
+        if email != client.email:
+            email = validate_email(email)
+            if self.repo.get_by_email(email) and not client.email == email:
+                raise CrmInvalidValue("Email already exists.")
+        if phone != client.phone:
+            phone = validate_phone(phone)
+            if self.repo.get_by_phone(phone) and not client.phone == phone:
+                raise CrmInvalidValue("Phone already exists.")
+        if company != client.company:
+            company = validate_company(company)
 
         client.fullname = fullname
         client.email = email
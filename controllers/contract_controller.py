@@ -1,16 +1,18 @@
 from datetime import datetime
+from functools import partial
 from decimal import Decimal
 from typing import Any
 
 from sqlalchemy.orm import Session
 
+from config.actions import track_action
 from config.sentry_logging import capture_event
 from controllers.repositories.client_repository import ClientRepository
 from controllers.repositories.contract_repository import ContractRepository
+from controllers.repositories.row_policy import RowPolicy
 from controllers.services.authorization import (
-    get_contract_owner_id,
-    requires_ownership_or_role,
-    requires_role,
+    get_contract_with_owner,
+    requires_permission,
 )
 from controllers.validators.validators import validate_amount, validate_date
 from exceptions import CrmInvalidValue, CrmIntegrityError, CrmNotFoundError, CrmForbiddenAccessError
@@ -36,6 +38,9 @@ class ContractController:
         self.current_user = current_user
         self.console = console
         self.repo = ContractRepository(session)
+        # Every role may read all contracts (contract.list), so self.repo stays unrestricted;
+        # the "my contracts" listings opt in to the row policy through own_repo
+        self.own_repo = ContractRepository(session, RowPolicy.for_user(current_user))
         self.client_repo = ClientRepository(session)
         self.view = contract_view.ContractsView(current_user, console)
 
@@ -45,61 +50,62 @@ class ContractController:
         """
         while True:
             choice = self.view.show_menu(self.current_user.role.value)
-            if choice == "List all contracts":
-                self.console.clear()
-                self.list_all_contracts()
-            elif choice == "List my contracts":
-                self.console.clear()
-                self.list_by_commercial()
-            elif choice == "List unsigned contracts":
-                self.console.clear()
-                self.list_unsigned_contracts()
-            elif choice == "List unpaid contracts":
-                self.console.clear()
-                self.list_unpaid_contracts()
-            elif choice == "Add contract":
-                self.console.clear()
-                self.add_contract()
-            elif choice == "Edit contract":
-                self.console.clear()
-                self.edit_contract()
-            elif choice == "Back":
-                break
+            with track_action(f"Contracts: {choice}"):
+                if choice == "List all contracts":
+                    self.console.clear()
+                    self.list_all_contracts()
+                elif choice == "List my contracts":
+                    self.console.clear()
+                    self.list_by_commercial()
+                elif choice == "List unsigned contracts":
+                    self.console.clear()
+                    self.list_unsigned_contracts()
+                elif choice == "List unpaid contracts":
+                    self.console.clear()
+                    self.list_unpaid_contracts()
+                elif choice == "Add contract":
+                    self.console.clear()
+                    self.add_contract()
+                elif choice == "Edit contract":
+                    self.console.clear()
+                    self.edit_contract()
+                elif choice == "Back":
+                    break
 
     def list_all_contracts(self) -> None:
         """
         List all contracts (all roles).
         """
-        ctrs = self.repo.list_all()
-        self.view.display_contract_table(ctrs, title="All Contracts")
+        self.view.display_contract_pages(self.repo.page, title="All Contracts")
 
-    @requires_role("commercial")
+    @requires_permission("contract.list_own")
     def list_by_commercial(self) -> None:
         """
         List contracts for the current commercial user.
         """
-        ctrs = self.repo.list_by_commercial(self.current_user.id)
-        self.view.display_contract_table(ctrs, title="My Contracts")
+        self.view.display_contract_pages(self.own_repo.page, title="My Contracts")
 
-    @requires_role("commercial")
+    @requires_permission("contract.list_unsigned")
     def list_unsigned_contracts(self) -> None:
         """
         List all unsigned contracts for the current commercial user.
         """
-        ctrs = self.repo.list_all()
-        filtered = [c for c in ctrs if not c.is_signed]
-        self.view.display_contract_table(filtered, title="Unsigned Contracts")
+        self.view.display_contract_pages(
+            partial(self.own_repo.page, unsigned=True),
+            title="Unsigned Contracts"
+        )
 
-    @requires_role("commercial")
+    @requires_permission("contract.list_unpaid")
     def list_unpaid_contracts(self) -> None:
         """
         List all contracts not yet fully paid for the current commercial user.
         """
-        ctrs = self.repo.list_all()
-        filtered = [c for c in ctrs if c.remaining_amount > 0]
-        self.view.display_contract_table(filtered, title="Unpaid Contracts")
+        self.view.display_contract_pages(
+            partial(self.own_repo.page, unpaid=True),
+            title="Unpaid Contracts"
+        )
 
-    @requires_role("gestion")
+    @requires_permission("contract.create")
     def add_contract(self) -> None:
         """
         Prompt and create a new contract, then display result or error.
@@ -110,19 +116,19 @@ class ContractController:
             capture_event("Contract created", level="info",
                           contract_id=contract.id)
             self.view.show_success(f"Created contract ID {contract.id}")
-        except (CrmInvalidValue, CrmNotFoundError) as e:
+        except (CrmInvalidValue, CrmNotFoundError, CrmIntegrityError) as e:
             capture_event("Contract creation failed",
                           level="error", reason=str(e))
             self.view.show_error(str(e))
 
-    @requires_role("gestion")
+    @requires_permission("contract.create")
     def _create_contract(
         self,
         client_id: int,
         amount: Decimal,
         is_signed: bool,
         end_date: str
-    ) -> Contract | None:
+    ) -> Contract:
         """
         Create a new contract in the database.
 
@@ -158,10 +164,8 @@ class ContractController:
         )
         try:
             return self.repo.save(contract)
-        except CrmIntegrityError as e:
-            capture_event("Contract creation failed",
-                          level="error", reason=str(e))
-            self.view.show_error(str(e))
+        except Exception as e:
+            raise CrmIntegrityError(f"Could not create contract: {e}") from e
 
     def get_contract_by_id(self, contract_id: int) -> Contract:
         """
@@ -203,14 +207,15 @@ class ContractController:
             self.view.show_error("You can only update your own contracts.")
 
 
-    @requires_ownership_or_role(get_contract_owner_id, 'gestion')
+    @requires_permission("contract.update", get_contract_with_owner, pass_as="contract")
     def _update_contract(
         self,
         contract_id: int,
         amount: Decimal = None,
         is_signed: bool = None,
         remaining: Decimal = None,
-        end_date: str = None
+        end_date: str = None,
+        contract: Contract | None = None
     ) -> Contract:
         """
         Update an existing contract.
@@ -221,6 +226,7 @@ class ContractController:
             is_signed: Whether the contract is signed.
             remaining: Remaining amount of the contract.
             end_date: End date (YYYY-MM-DD).
+            contract: The contract, when already loaded by the ownership check.
 
         Returns:
             Contract: The updated Contract.
@@ -230,10 +236,8 @@ class ContractController:
             CrmNotFoundError: If the contract does not exist.
             CrmIntegrityError: If saving fails.
         """
-        repo = self.repo
-        contract = repo.get_by_id(contract_id)
-        if not contract:
-            raise CrmNotFoundError("Contract")
+        if contract is None:
+            contract = self.get_contract_by_id(contract_id)
 
         if amount is not None:
             contract.total_amount = validate_amount(amount)
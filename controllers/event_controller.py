@@ -1,12 +1,17 @@
-from typing import Any, Optional
+from functools import partial
+from typing import Any, Iterable, Optional
 
 from sqlalchemy.orm import Session
 
+from config.actions import track_action
 from config.sentry_logging import capture_event
 from controllers.repositories.contract_repository import ContractRepository
 from controllers.repositories.event_repository import EventRepository
+from controllers.repositories.row_policy import RowPolicy
+from controllers.repositories.unit_of_work import unit_of_work
 from controllers.services.auth import get_current_user
-from controllers.services.authorization import requires_role
+from controllers.services.authorization import requires_permission, requires_permission_for_all
+from controllers.services.permissions import Access, get_access
 from controllers.validators.validators import (
     validate_attendees,
     validate_event_dates,
@@ -41,6 +46,9 @@ class EventController:
         self.current_user = current_user
         self.console = console
         self.repo = EventRepository(session)
+        # Every role may read all events (event.list), so self.repo stays unrestricted;
+        # the "my events" listings opt in to the row policy through own_repo
+        self.own_repo = EventRepository(session, RowPolicy.for_user(current_user))
         self.contract_repo = ContractRepository(session)
         self.view = event_view.EventsView(console)
 
@@ -50,56 +58,56 @@ class EventController:
         """
         while True:
             choice = self.view.show_menu(self.current_user.role.value)
-            if choice == "List all events":
-                self.list_all_events()
-            elif choice == "List my events":
-                self.list_my_events()
-            elif choice == "List unassigned events":
-                self.list_unassigned_events()
-            elif choice == "Add event":
-                self.add_event()
-            elif choice == "Assign support":
-                self.assign_support()
-            elif choice == "Edit event":
-                self.edit_event()
-            elif choice == "Back":
-                break
+            with track_action(f"Events: {choice}"):
+                if choice == "List all events":
+                    self.list_all_events()
+                elif choice == "List my events":
+                    self.list_my_events()
+                elif choice == "List unassigned events":
+                    self.list_unassigned_events()
+                elif choice == "Add event":
+                    self.add_event()
+                elif choice == "Assign support":
+                    self.assign_support()
+                elif choice == "Edit event":
+                    self.edit_event()
+                elif choice == "Back":
+                    break
 
     def list_all_events(self) -> None:
         """
         List all events (all roles).
         """
         try:
-            events = self.repo.list_all()
-            self.view.display_event_table(events, title="All Events")
+            self.view.display_event_pages(self.repo.page, title="All Events")
         except Exception as e:
             capture_event("Event list failed", level="error", reason=str(e))
             self.view.show_error(str(e))
 
-    @requires_role("support")
+    @requires_permission("event.list_own")
     def list_my_events(self) -> None:
         """
         List events assigned to the current support user.
         """
         try:
-            uid = self.current_user.id
-            events = self.repo.list_by_support_contact(uid)
-            self.view.display_event_table(events, title="My Events")
+            self.view.display_event_pages(self.own_repo.page, title="My Events")
         except Exception as e:
             capture_event("My-events list failed",
                           level="error", reason=str(e))
             self.view.show_error(str(e))
 
-    @requires_role("gestion")
+    @requires_permission("event.list_unassigned")
     def list_unassigned_events(self) -> None:
         """
         List all events without a support contact (gestion only).
         """
-        events = self.repo.list_without_support()
-        self.view.display_event_table(events, title="Unassigned Events")
+        self.view.display_event_pages(
+            partial(self.repo.page, unassigned=True),
+            title="Unassigned Events"
+        )
 
 
-    @requires_role("commercial")
+    @requires_permission("event.create")
     def add_event(self) -> None:
         """
         Prompt and create a new event, then display result or error.
@@ -114,7 +122,7 @@ class EventController:
                           level="error", reason=str(e))
             self.view.show_error(str(e))
 
-    @requires_role("commercial")
+    @requires_permission("event.create")
     def _create_event(
         self,
         contract_id: int,
@@ -231,14 +239,14 @@ class EventController:
 
         # --- specific authorizations support vs gestion  ---
         user = get_current_user(self.session)
-        if user.role.value == "support":
-            # support can only edit events assigned to them
-            if event.support_contact_id != user.id:
-                raise CrmForbiddenAccessError(
-                    "You can only update events assigned to you.")
-        elif user.role.value != "gestion":
+        access = get_access(user.role, "event.update")
+        if access is None:
             # other roles (commercial,…) are not authorized
             raise CrmForbiddenAccessError()
+        if access is Access.OWNER and event.support_contact_id != user.id:
+            # support can only edit events assigned to them
+            raise CrmForbiddenAccessError(
+                "You can only update events assigned to you.")
 
         # assign validated fields
         if name is not None:
@@ -282,7 +290,7 @@ class EventController:
         Prompt and assign a support contact to an event, then display result or error.
         """
         try:
-            if not self.repo.list_without_support():
+            if not self.repo.page(unassigned=True, limit=1).items:
                 self.view.show_info("All events are assigned.")
                 return
             event_id, support_contact_id = self.view.prompt_assign_support()
@@ -296,7 +304,7 @@ class EventController:
                           level="error", reason=str(e))
             self.view.show_error(str(e))
 
-    @requires_role("gestion")
+    @requires_permission("event.assign_support")
     def _assign_support(self, event_id: int, support_contact_id: int) -> Event:
         """
         Business logic to attach a support user to an event.
@@ -316,7 +324,60 @@ class EventController:
         event = self.repo.get_by_id(event_id)
         if not event:
             raise CrmNotFoundError("Event")
+        self._check_support_user(support_contact_id)
+
+        event.support_contact_id = support_contact_id
+        try:
+            return self.repo.save(event)
+        except Exception as e:
+            raise CrmIntegrityError(
+                f"Could not assign support to event: {e}") from e
+
+    @requires_permission_for_all("event.assign_support", "event")
+    def _assign_support_many(self, event_ids: Iterable[int], support_contact_id: int) -> list[Event]:
+        """
+        Attach a support user to many events, all or none of them.
+
+        The permission is checked for the whole set with one query, and the
+        events are loaded with another. The updates are committed together in
+        one unit of work, so a failed save leaves every event unchanged.
+
+        Args:
+            event_ids: IDs of the events to assign support to
+            support_contact_id: ID of the support contact to assign
+
+        Returns:
+            list[Event]: The updated events, in ID order
+
+        Raises:
+            CrmNotFoundError: If some events or the support user are not found.
+            CrmInvalidValue: If the support user doesn't have the support role.
+            CrmIntegrityError: If there's an error saving the events.
+        """
+        self._check_support_user(support_contact_id)
+        events = self.repo.get_many(set(event_ids))
+        for event in events:
+            event.support_contact_id = support_contact_id
+        try:
+            with unit_of_work(self.session):
+                for event in events:
+                    self.repo.save(event, refresh=False)
+            return events
+        except Exception as e:
+            raise CrmIntegrityError(
+                f"Could not assign support to events: {e}") from e
+
+    def _check_support_user(self, support_contact_id: int) -> None:
+        """
+        Make sure a user exists and has the support role.
+
+        Args:
+            support_contact_id: ID of the user to check
 
+        Raises:
+            CrmNotFoundError: If the user is not found.
+            CrmInvalidValue: If the user doesn't have the support role.
+        """
         from controllers.repositories.user_repository import UserRepository
         user_repo = UserRepository(self.session)
         sup = user_repo.get_by_id(support_contact_id)
@@ -324,10 +385,3 @@ class EventController:
             raise CrmNotFoundError("Support user")
         if sup.role.value != "support":
             raise CrmInvalidValue("User must have support role.")
-
-        event.support_contact_id = support_contact_id
-        try:
-            return self.repo.save(event)
-        except Exception as e:
-            raise CrmIntegrityError(
-                f"Could not assign support to event: {e}") from e
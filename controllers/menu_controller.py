@@ -2,6 +2,7 @@ from typing import Callable, Dict
 
 from sqlalchemy.orm import Session
 
+from config.actions import track_action
 from config.console import console
 from controllers.auth_controller import AuthController
 from controllers.client_controller import ClientController
@@ -64,5 +65,6 @@ class MenuController:
                 display_info("Exiting. Goodbye!")
                 return "quit"
             else:
-                self.console.clear()
-                self.controller_map[selected_label](user).show_menu()
+                with track_action(f"Main: {selected_label}"):
+                    self.console.clear()
+                    self.controller_map[selected_label](user).show_menu()
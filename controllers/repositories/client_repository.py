@@ -1,21 +1,28 @@
-from typing import Type
+from typing import Iterator, Type
 
+from sqlalchemy import RowMapping, insert, or_, select
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import InstrumentedAttribute, Query, Session, joinedload
 
+from controllers.repositories.pagination import PAGE_SIZE, Page, paginate
+from controllers.repositories.row_policy import UNRESTRICTED, RowPolicy
+from controllers.repositories.unit_of_work import abort_change, in_unit_of_work, save_entity
 from models.client import Client
 
 
 class ClientRepository:
     """Repository class for handling database operations for Client model."""
 
-    def __init__(self, session: Session):
+    def __init__(self, session: Session, policy: RowPolicy = UNRESTRICTED):
         """Initialize the ClientRepository with a database session.
 
         Args:
             session (Session): SQLAlchemy database session.
+            policy (RowPolicy): Row-level policy added to every read query.
+                Unrestricted by default.
         """
         self.session = session
+        self.policy = policy
 
     def get_by_email(self, email: str) -> Client | None:
         """Retrieve a client by their email address.
@@ -37,7 +44,8 @@ class ClientRepository:
         Returns:
             Client | None: The Client object if found, None otherwise.
         """
-        return self.session.query(Client).filter_by(id=client_id).first()
+        query = self.session.query(Client).filter_by(id=client_id)
+        return self.policy.apply(query, Client).first()
 
     def get_by_phone(self, phone: str) -> Client | None:
         """Retrieve a client by their phone number.
@@ -50,11 +58,13 @@ class ClientRepository:
         """
         return self.session.query(Client).filter_by(phone=phone).first()
 
-    def save(self, client: Client) -> Client:
+    def save(self, client: Client, refresh: bool = True) -> Client:
         """Save a client to the database.
 
         Args:
             client (Client): The Client object to save.
+            refresh (bool): Reload database-generated values after saving.
+                Inside a unit of work, the client is only flushed when set.
 
         Returns:
             Client: The saved Client object with updated attributes.
@@ -62,23 +72,93 @@ class ClientRepository:
         Raises:
             Exception: If there is an error during database operations.
         """
+        return save_entity(self.session, client, refresh)
+
+    def _list_query(self, commercial_id: int | None = None) -> Query:
+        """Build the base query used by the list and page methods.
+
+        Args:
+            commercial_id (int | None): Restrict to this commercial's clients if provided.
+
+        Returns:
+            Query: A Client query with the commercial eager-loaded for display,
+            restricted to the rows visible under the repository policy.
+        """
+        query = self.session.query(Client).options(joinedload(Client.commercial))
+        query = self.policy.apply(query, Client)
+        if commercial_id is not None:
+            query = query.filter(Client.commercial_id == commercial_id)
+        return query
+
+    def find_existing(self, emails: set[str], phones: set[str]) -> tuple[set[str], set[str]]:
+        """Find which of the given emails and phone numbers are already used.
+
+        Both sets are checked with a single set-based query.
+
+        Args:
+            emails (set[str]): Email addresses to look up.
+            phones (set[str]): Phone numbers to look up.
+
+        Returns:
+            tuple[set[str], set[str]]: The emails and the phones already in the database.
+        """
+        if not emails and not phones:
+            return set(), set()
+        rows = self.session.execute(
+            select(Client.email, Client.phone).where(
+                or_(Client.email.in_(emails), Client.phone.in_(phones))
+            )
+        )
+        found_emails, found_phones = set(), set()
+        for email, phone in rows:
+            if email in emails:
+                found_emails.add(email)
+            if phone in phones:
+                found_phones.add(phone)
+        return found_emails, found_phones
+
+    def get_owner_ids(self, client_ids: set[int]) -> dict[int, int | None]:
+        """Retrieve the commercial owner of many clients with a single query.
+
+        Args:
+            client_ids (set[int]): The IDs of the clients to look up.
+
+        Returns:
+            dict[int, int | None]: The commercial ID of each existing client, keyed by client ID.
+        """
+        if not client_ids:
+            return {}
+        rows = self.session.execute(
+            select(Client.id, Client.commercial_id).where(Client.id.in_(client_ids))
+        )
+        return dict(rows.all())
+
+    def bulk_insert(self, rows: list[dict]) -> None:
+        """Insert many clients in a single transaction.
+
+        Inside a unit of work, the rows join its transaction instead.
+
+        Args:
+            rows (list[dict]): Column values of the clients to insert.
+
+        Raises:
+            IntegrityError: If a row violates a constraint; nothing is inserted.
+        """
         try:
-            self.session.add(client)
-            self.session.commit()
-            self.session.refresh(client)
-            return client
+            self.session.execute(insert(Client), rows)
+            if not in_unit_of_work(self.session):
+                self.session.commit()
         except IntegrityError:
-            self.session.rollback()
+            abort_change(self.session)
             raise
 
-
     def list_all(self) -> list[Type[Client]]:
         """Retrieve all clients from the database.
 
         Returns:
             list[Type[Client]]: A list of all Client objects.
         """
-        return self.session.query(Client).all()
+        return self._list_query().all()
 
     def list_by_commercial(self, user_id: int) -> list[Type[Client]]:
         """Retrieve all clients assigned to a specific commercial user.
@@ -89,4 +169,44 @@ class ClientRepository:
         Returns:
             list[Type[Client]]: A list of Client objects assigned to the specified commercial.
         """
-        return self.session.query(Client).filter_by(commercial_id=user_id).all()
+        return self._list_query(commercial_id=user_id).all()
+
+    def page(
+        self,
+        commercial_id: int | None = None,
+        after=None,
+        before=None,
+        limit: int = PAGE_SIZE,
+        sort_key: InstrumentedAttribute | None = None
+    ) -> Page[Client]:
+        """Retrieve one page of clients using keyset pagination.
+
+        Args:
+            commercial_id (int | None): Restrict to this commercial's clients if provided.
+            after: Cursor returned as ``next_cursor`` by the previous page.
+            before: Cursor returned as ``prev_cursor`` by the following page.
+            limit (int): Maximum number of clients in the page.
+            sort_key (InstrumentedAttribute | None): Column to sort on, ties broken by id.
+
+        Returns:
+            Page[Client]: The requested page of clients.
+        """
+        keys = (sort_key, Client.id) if sort_key is not None else (Client.id,)
+        return paginate(self._list_query(commercial_id), keys, after, before, limit)
+
+    def stream_rows(self, batch_size: int = 1000) -> Iterator[RowMapping]:
+        """Stream every client as a column mapping, fetching batch_size rows at a time.
+
+        Rows are read from the cursor incrementally and never become ORM objects,
+        so memory use does not depend on the table size.
+
+        Args:
+            batch_size (int): Number of rows fetched from the database per batch.
+
+        Returns:
+            Iterator[RowMapping]: The client rows, ordered by id.
+        """
+        query = self.policy.apply(select(Client.__table__), Client).order_by(Client.id)
+        return self.session.execute(
+            query, execution_options={"yield_per": batch_size}
+        ).mappings()
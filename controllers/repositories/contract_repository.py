@@ -1,27 +1,35 @@
-from typing import Type
+from typing import Iterator, Type
 
-from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import Session
+from sqlalchemy import RowMapping, false, select
+from sqlalchemy.orm import InstrumentedAttribute, Query, Session, joinedload
 
+from controllers.repositories.pagination import PAGE_SIZE, Page, paginate
+from controllers.repositories.row_policy import UNRESTRICTED, RowPolicy
+from controllers.repositories.unit_of_work import save_entity
 from models.contract import Contract
 
 
 class ContractRepository:
     """Repository class for handling database operations for Contract model."""
 
-    def __init__(self, session: Session):
+    def __init__(self, session: Session, policy: RowPolicy = UNRESTRICTED):
         """Initialize the ContractRepository with a database session.
 
         Args:
             session (Session): SQLAlchemy database session.
+            policy (RowPolicy): Row-level policy added to every read query.
+                Unrestricted by default.
         """
         self.session = session
+        self.policy = policy
 
-    def save(self, contract: Contract) -> Contract:
+    def save(self, contract: Contract, refresh: bool = True) -> Contract:
         """Insert or update a Contract in the database.
 
         Args:
             contract (Contract): The Contract object to save.
+            refresh (bool): Reload database-generated values after saving.
+                Inside a unit of work, the contract is only flushed when set.
 
         Returns:
             Contract: The saved Contract object with updated attributes.
@@ -29,14 +37,23 @@ class ContractRepository:
         Raises:
             Exception: If there is an error during database operations.
         """
-        try:
-            self.session.add(contract)
-            self.session.commit()
-            self.session.refresh(contract)
-            return contract
-        except IntegrityError:
-            self.session.rollback()
-            raise
+        return save_entity(self.session, contract, refresh)
+
+    def _list_query(self) -> Query:
+        """Build the base query used by the list methods.
+
+        The client and commercial are joined in the same SELECT because the
+        contract table displays both names for every row.
+
+        Returns:
+            Query: A Contract query with its display relationships eager-loaded,
+            restricted to the rows visible under the repository policy.
+        """
+        query = self.session.query(Contract).options(
+            joinedload(Contract.client),
+            joinedload(Contract.commercial),
+        )
+        return self.policy.apply(query, Contract)
 
     def list_all(self) -> list[Type[Contract]]:
         """Retrieve all contracts from the database.
@@ -44,7 +61,7 @@ class ContractRepository:
         Returns:
             list[Type[Contract]]: A list of all Contract objects.
         """
-        return self.session.query(Contract).all()
+        return self._list_query().all()
 
     def list_by_commercial(self, commercial_id: int) -> list[Type[Contract]]:
         """Retrieve all contracts associated with a specific commercial user.
@@ -55,7 +72,104 @@ class ContractRepository:
         Returns:
             list[Type[Contract]]: A list of Contract objects associated with the commercial.
         """
-        return self.session.query(Contract).filter(Contract.commercial_id == commercial_id).all()
+        return self._list_query().filter(Contract.commercial_id == commercial_id).all()
+
+    def _filtered_query(
+        self,
+        commercial_id: int | None = None,
+        unsigned: bool = False,
+        unpaid: bool = False
+    ) -> Query:
+        """Build a list query with the given status filters applied in SQL.
+
+        Args:
+            commercial_id (int | None): Restrict to this commercial's contracts if provided.
+            unsigned (bool): Only keep contracts that are not signed.
+            unpaid (bool): Only keep contracts with a remaining amount above zero.
+
+        Returns:
+            Query: The filtered Contract query.
+        """
+        query = self._list_query()
+        if commercial_id is not None:
+            query = query.filter(Contract.commercial_id == commercial_id)
+        if unsigned:
+            # "= 0" matches the predicate of the partial index ix_contract_unsigned
+            query = query.filter(Contract.is_signed == false())
+        if unpaid:
+            query = query.filter(Contract.remaining_amount > 0)
+        return query
+
+    def list_filtered(
+        self,
+        commercial_id: int | None = None,
+        unsigned: bool = False,
+        unpaid: bool = False
+    ) -> list[Type[Contract]]:
+        """Retrieve contracts matching the given status filters.
+
+        The filters are applied in SQL so only matching rows are loaded.
+        When both ``unsigned`` and ``unpaid`` are set, a contract must match both.
+
+        Args:
+            commercial_id (int | None): Restrict to this commercial's contracts if provided.
+            unsigned (bool): Only keep contracts that are not signed.
+            unpaid (bool): Only keep contracts with a remaining amount above zero.
+
+        Returns:
+            list[Type[Contract]]: A list of Contract objects matching the filters.
+        """
+        return self._filtered_query(commercial_id, unsigned, unpaid).all()
+
+    def page(
+        self,
+        commercial_id: int | None = None,
+        unsigned: bool = False,
+        unpaid: bool = False,
+        after=None,
+        before=None,
+        limit: int = PAGE_SIZE,
+        sort_key: InstrumentedAttribute | None = None
+    ) -> Page[Contract]:
+        """Retrieve one page of contracts using keyset pagination.
+
+        Args:
+            commercial_id (int | None): Restrict to this commercial's contracts if provided.
+            unsigned (bool): Only keep contracts that are not signed.
+            unpaid (bool): Only keep contracts with a remaining amount above zero.
+            after: Cursor returned as ``next_cursor`` by the previous page.
+            before: Cursor returned as ``prev_cursor`` by the following page.
+            limit (int): Maximum number of contracts in the page.
+            sort_key (InstrumentedAttribute | None): Column to sort on, ties broken by id.
+
+        Returns:
+            Page[Contract]: The requested page of contracts.
+        """
+        keys = (sort_key, Contract.id) if sort_key is not None else (Contract.id,)
+        query = self._filtered_query(commercial_id, unsigned, unpaid)
+        return paginate(query, keys, after, before, limit)
+
+    def list_unsigned(self, commercial_id: int | None = None) -> list[Type[Contract]]:
+        """Retrieve all contracts that are not signed yet.
+
+        Args:
+            commercial_id (int | None): Restrict to this commercial's contracts if provided.
+
+        Returns:
+            list[Type[Contract]]: A list of unsigned Contract objects.
+        """
+        return self.list_filtered(commercial_id, unsigned=True)
+
+    def list_unpaid(self, commercial_id: int | None = None) -> list[Type[Contract]]:
+        """Retrieve all contracts that are not fully paid.
+
+        Args:
+            commercial_id (int | None): Restrict to this commercial's contracts if provided.
+
+        Returns:
+            list[Type[Contract]]: A list of Contract objects with a remaining amount above zero.
+        """
+        return self.list_filtered(commercial_id, unpaid=True)
 
     def get_by_id(self, contract_id: int) -> Type[Contract] | None:
         """Retrieve a contract by its ID.
@@ -66,4 +180,38 @@ class ContractRepository:
         Returns:
             Type[Contract] | None: The Contract object if found, None otherwise.
         """
-        return self.session.query(Contract).filter(Contract.id == contract_id).one_or_none()
+        query = self.session.query(Contract).filter(Contract.id == contract_id)
+        return self.policy.apply(query, Contract).one_or_none()
+
+    def get_owner_ids(self, contract_ids: set[int]) -> dict[int, int]:
+        """Retrieve the commercial owner of many contracts with a single query.
+
+        Args:
+            contract_ids (set[int]): The IDs of the contracts to look up.
+
+        Returns:
+            dict[int, int]: The commercial ID of each existing contract, keyed by contract ID.
+        """
+        if not contract_ids:
+            return {}
+        rows = self.session.execute(
+            select(Contract.id, Contract.commercial_id).where(Contract.id.in_(contract_ids))
+        )
+        return dict(rows.all())
+
+    def stream_rows(self, batch_size: int = 1000) -> Iterator[RowMapping]:
+        """Stream every contract as a column mapping, fetching batch_size rows at a time.
+
+        Rows are read from the cursor incrementally and never become ORM objects,
+        so memory use does not depend on the table size.
+
+        Args:
+            batch_size (int): Number of rows fetched from the database per batch.
+
+        Returns:
+            Iterator[RowMapping]: The contract rows, ordered by id.
+        """
+        query = self.policy.apply(select(Contract.__table__), Contract).order_by(Contract.id)
+        return self.session.execute(
+            query, execution_options={"yield_per": batch_size}
+        ).mappings()
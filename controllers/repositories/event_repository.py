@@ -1,27 +1,36 @@
-from typing import Optional, Type
+from typing import Iterator, Optional, Type
 
-from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import Session
+from sqlalchemy import RowMapping, select
+from sqlalchemy.orm import InstrumentedAttribute, Query, Session, joinedload
 
+from controllers.repositories.pagination import PAGE_SIZE, Page, paginate
+from controllers.repositories.row_policy import UNRESTRICTED, RowPolicy
+from controllers.repositories.unit_of_work import save_entity
+from models.contract import Contract
 from models.event import Event
 
 
 class EventRepository:
     """Repository class for handling database operations for Event model."""
 
-    def __init__(self, session: Session):
+    def __init__(self, session: Session, policy: RowPolicy = UNRESTRICTED):
         """Initialize the EventRepository with a database session.
 
         Args:
             session (Session): SQLAlchemy database session.
+            policy (RowPolicy): Row-level policy added to every read query.
+                Unrestricted by default.
         """
         self.session = session
+        self.policy = policy
 
-    def save(self, event: Event) -> Event:
+    def save(self, event: Event, refresh: bool = True) -> Event:
         """Save an event to the database.
 
         Args:
             event (Event): The Event object to save.
+            refresh (bool): Reload database-generated values after saving.
+                Inside a unit of work, the event is only flushed when set.
 
         Returns:
             Event: The saved Event object with updated attributes.
@@ -29,14 +38,7 @@ class EventRepository:
         Raises:
             Exception: If there is an error during database operations.
         """
-        try:
-            self.session.add(event)
-            self.session.commit()
-            self.session.refresh(event)
-            return event
-        except IntegrityError:
-            self.session.rollback()
-            raise
+        return save_entity(self.session, event, refresh)
 
     def get_by_id(self, event_id: int) -> Optional[Event]:
         """Retrieve an event by its ID.
@@ -47,7 +49,74 @@ class EventRepository:
         Returns:
             Optional[Event]: The Event object if found, None otherwise.
         """
-        return self.session.query(Event).filter(Event.id == event_id).first()
+        query = self.session.query(Event).filter(Event.id == event_id)
+        return self.policy.apply(query, Event).first()
+
+    def get_many(self, event_ids: set[int]) -> list[Type[Event]]:
+        """Retrieve many events with a single query, in ID order.
+
+        Args:
+            event_ids (set[int]): The IDs of the events to retrieve.
+
+        Returns:
+            list[Type[Event]]: The existing events among the IDs.
+        """
+        if not event_ids:
+            return []
+        return self._list_query().filter(Event.id.in_(event_ids)).order_by(Event.id).all()
+
+    def get_with_owner_id(self, event_id: int) -> tuple[Event, int | None] | None:
+        """Retrieve an event and the commercial owning its contract in one query.
+
+        Args:
+            event_id (int): The ID of the event to retrieve.
+
+        Returns:
+            tuple[Event, int | None] | None: The Event and the contract's commercial ID
+            (None if the contract is missing), or None if the event does not exist.
+        """
+        row = (
+            self.session.query(Event, Contract.commercial_id)
+            .outerjoin(Contract, Event.contract_id == Contract.id)
+            .filter(Event.id == event_id)
+            .first()
+        )
+        return tuple(row) if row else None
+
+    def get_owner_ids(self, event_ids: set[int]) -> dict[int, int | None]:
+        """Retrieve the commercial owning the contract of many events with a single joined query.
+
+        Args:
+            event_ids (set[int]): The IDs of the events to look up.
+
+        Returns:
+            dict[int, int | None]: The contract's commercial ID of each existing event
+            (None if the contract is missing), keyed by event ID.
+        """
+        if not event_ids:
+            return {}
+        rows = self.session.execute(
+            select(Event.id, Contract.commercial_id)
+            .outerjoin(Contract, Event.contract_id == Contract.id)
+            .where(Event.id.in_(event_ids))
+        )
+        return dict(rows.all())
+
+    def _list_query(self) -> Query:
+        """Build the base query used by the list methods.
+
+        The event table displays the client of the linked contract and the
+        support contact, so both paths are joined in the same SELECT.
+
+        Returns:
+            Query: An Event query with its display relationships eager-loaded,
+            restricted to the rows visible under the repository policy.
+        """
+        query = self.session.query(Event).options(
+            joinedload(Event.contract).joinedload(Contract.client),
+            joinedload(Event.support_contact),
+        )
+        return self.policy.apply(query, Event)
 
     def list_all(self) -> list[Type[Event]]:
         """Retrieve all events from the database.
@@ -55,7 +124,7 @@ class EventRepository:
         Returns:
             list[Type[Event]]: A list of all Event objects.
         """
-        return self.session.query(Event).all()
+        return self._list_query().all()
 
     def list_by_support_contact(self, support_contact_id: int) -> list[Type[Event]]:
         """Retrieve all events assigned to a specific support contact.
@@ -66,7 +135,7 @@ class EventRepository:
         Returns:
             list[Type[Event]]: A list of Event objects assigned to the support contact.
         """
-        return self.session.query(Event).filter(Event.support_contact_id == support_contact_id).all()
+        return self._list_query().filter(Event.support_contact_id == support_contact_id).all()
 
     def list_without_support(self) -> list[Type[Event]]:
         """Retrieve all events without an assigned support contact.
@@ -74,7 +143,7 @@ class EventRepository:
         Returns:
             list[Type[Event]]: A list of Event objects without a support contact.
         """
-        return self.session.query(Event).filter(Event.support_contact_id.is_(None)).all()
+        return self._list_query().filter(Event.support_contact_id.is_(None)).all()
 
     def list_by_contract(self, contract_id: int) -> list[Type[Event]]:
         """Retrieve all events associated with a specific contract.
@@ -85,4 +154,55 @@ class EventRepository:
         Returns:
             list[Type[Event]]: A list of Event objects for the specified contract.
         """
-        return self.session.query(Event).filter(Event.contract_id == contract_id).all()
+        return self._list_query().filter(Event.contract_id == contract_id).all()
+
+    def page(
+        self,
+        support_contact_id: int | None = None,
+        unassigned: bool = False,
+        contract_id: int | None = None,
+        after=None,
+        before=None,
+        limit: int = PAGE_SIZE,
+        sort_key: InstrumentedAttribute | None = None
+    ) -> Page[Event]:
+        """Retrieve one page of events using keyset pagination.
+
+        Args:
+            support_contact_id (int | None): Restrict to events assigned to this support contact.
+            unassigned (bool): Only keep events without a support contact.
+            contract_id (int | None): Restrict to the events of this contract.
+            after: Cursor returned as ``next_cursor`` by the previous page.
+            before: Cursor returned as ``prev_cursor`` by the following page.
+            limit (int): Maximum number of events in the page.
+            sort_key (InstrumentedAttribute | None): Column to sort on, ties broken by id.
+
+        Returns:
+            Page[Event]: The requested page of events.
+        """
+        query = self._list_query()
+        if support_contact_id is not None:
+            query = query.filter(Event.support_contact_id == support_contact_id)
+        if unassigned:
+            query = query.filter(Event.support_contact_id.is_(None))
+        if contract_id is not None:
+            query = query.filter(Event.contract_id == contract_id)
+        keys = (sort_key, Event.id) if sort_key is not None else (Event.id,)
+        return paginate(query, keys, after, before, limit)
+
+    def stream_rows(self, batch_size: int = 1000) -> Iterator[RowMapping]:
+        """Stream every event as a column mapping, fetching batch_size rows at a time.
+
+        Rows are read from the cursor incrementally and never become ORM objects,
+        so memory use does not depend on the table size.
+
+        Args:
+            batch_size (int): Number of rows fetched from the database per batch.
+
+        Returns:
+            Iterator[RowMapping]: The event rows, ordered by id.
+        """
+        query = self.policy.apply(select(Event.__table__), Event).order_by(Event.id)
+        return self.session.execute(
+            query, execution_options={"yield_per": batch_size}
+        ).mappings()
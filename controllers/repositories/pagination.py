@@ -0,0 +1,119 @@
+import os
+from dataclasses import dataclass, field
+from typing import Any, Callable, Generic, Iterator, Sequence, TypeVar
+
+from sqlalchemy import tuple_
+from sqlalchemy.orm import InstrumentedAttribute, Query
+
+T = TypeVar("T")
+
+PAGE_SIZE = int(os.getenv("CRM_PAGE_SIZE", 20))
+
+
+@dataclass
+class Page(Generic[T]):
+    """
+    One page of a keyset-paginated listing.
+
+    Attributes:
+        items (list[T]): The rows of this page, in display order.
+        next_cursor (Any | None): Cursor to pass as ``after`` to get the next page,
+            None if this is the last page.
+        prev_cursor (Any | None): Cursor to pass as ``before`` to get the previous page,
+            None if this is the first page.
+    """
+
+    items: list[T] = field(default_factory=list)
+    next_cursor: Any | None = None
+    prev_cursor: Any | None = None
+
+
+def _cursor_of(row, keys: Sequence[InstrumentedAttribute]) -> Any:
+    """
+    Build the cursor value of a row for the given sort keys.
+
+    Args:
+        row: The ORM object to read the key values from.
+        keys (Sequence[InstrumentedAttribute]): The sort key columns.
+
+    Returns:
+        Any: A scalar for a single key, a tuple otherwise.
+    """
+    values = tuple(getattr(row, key.key) for key in keys)
+    return values[0] if len(values) == 1 else values
+
+
+def paginate(
+    query: Query,
+    keys: Sequence[InstrumentedAttribute],
+    after: Any | None = None,
+    before: Any | None = None,
+    limit: int = PAGE_SIZE
+) -> Page:
+    """
+    Fetch one page of a query using keyset (seek) pagination.
+
+    Rows are ordered by ``keys``, whose last column must be unique (usually the
+    primary key) so the ordering is stable. Instead of an OFFSET, the page
+    starts right after (or ends right before) the given cursor, so every page
+    costs the same whatever its position in the listing.
+
+    Args:
+        query (Query): The base query, with filters and loader options applied.
+        keys (Sequence[InstrumentedAttribute]): The sort key columns.
+        after (Any | None): Cursor of the row preceding the requested page.
+        before (Any | None): Cursor of the row following the requested page.
+        limit (int): Maximum number of rows in the page.
+
+    Returns:
+        Page: The requested page with its navigation cursors.
+    """
+    key = keys[0] if len(keys) == 1 else tuple_(*keys)
+
+    if before is not None:
+        rows = (
+            query.filter(key < before)
+            .order_by(*(k.desc() for k in keys))
+            .limit(limit + 1)
+            .all()
+        )
+        has_more = len(rows) > limit
+        items = list(reversed(rows[:limit]))
+        return Page(
+            items=items,
+            next_cursor=_cursor_of(items[-1], keys) if items else None,
+            prev_cursor=_cursor_of(items[0], keys) if has_more else None,
+        )
+
+    if after is not None:
+        query = query.filter(key > after)
+    rows = query.order_by(*keys).limit(limit + 1).all()
+    has_more = len(rows) > limit
+    items = rows[:limit]
+    return Page(
+        items=items,
+        next_cursor=_cursor_of(items[-1], keys) if has_more else None,
+        prev_cursor=_cursor_of(items[0], keys) if after is not None and items else None,
+    )
+
+
+def iter_pages(fetch_page: Callable[..., Page[T]], **kwargs) -> Iterator[T]:
+    """
+    Iterate over every row of a keyset-paginated listing, one page at a time.
+
+    Each page is a separate query, so the rows reach the caller as soon as
+    their page is read and only one page is held at a time.
+
+    Args:
+        fetch_page (Callable[..., Page[T]]): A repository ``page`` method.
+        **kwargs: Passed to every call, e.g. filters or ``limit``.
+
+    Yields:
+        T: The rows, in listing order.
+    """
+    page = fetch_page(**kwargs)
+    while True:
+        yield from page.items
+        if page.next_cursor is None:
+            return
+        page = fetch_page(after=page.next_cursor, **kwargs)
@@ -0,0 +1,96 @@
+from dataclasses import dataclass
+from typing import TypeVar
+
+from sqlalchemy import ColumnElement
+
+from models.client import Client
+from models.contract import Contract
+from models.event import Event
+from models.user import User
+from models.user_role import UserRole
+
+Q = TypeVar("Q")
+
+# Column holding the user a row belongs to, per role and model.
+# Models missing from a role's entry are not restricted for that role,
+# and gestion has no entry at all: it sees every row.
+ROW_RULES = {
+    UserRole.COMMERCIAL: {
+        Client: Client.commercial_id,
+        Contract: Contract.commercial_id,
+    },
+    UserRole.SUPPORT: {
+        Event: Event.support_contact_id,
+    },
+}
+
+
+@dataclass(frozen=True)
+class RowPolicy:
+    """
+    Row-level visibility of a user, turned into SQL predicates.
+
+    Repositories built with a policy add its predicate to every read query, so
+    rows outside the user's scope are filtered by the database (using the
+    indexes on the owner columns) instead of being loaded and discarded.
+
+    Scoping is opt-in: the permission table lets every role list all clients,
+    contracts and events, so the controllers keep an unrestricted repository
+    and use a policy-bound one only for the "my ..." listings. Writes are
+    guarded by requires_permission, not by the policy.
+
+    Attributes:
+        role (UserRole | None): Role of the user, None for an unrestricted policy.
+        user_id (int | None): ID of the user.
+    """
+
+    role: UserRole | None = None
+    user_id: int | None = None
+
+    @classmethod
+    def for_user(cls, user: User) -> "RowPolicy":
+        """
+        Build the policy of a user.
+
+        Args:
+            user (User): The authenticated user.
+
+        Returns:
+            RowPolicy: The policy matching the user's role and ID.
+        """
+        return cls(role=user.role, user_id=user.id)
+
+    def predicate(self, model: type) -> ColumnElement[bool] | None:
+        """
+        Return the condition a row of the model must meet to be visible.
+
+        Args:
+            model (type): The mapped model class queried.
+
+        Returns:
+            ColumnElement[bool] | None: The SQL condition, None if every row is visible.
+        """
+        column = ROW_RULES.get(self.role, {}).get(model)
+        if column is None:
+            return None
+        return column == self.user_id
+
+    def apply(self, query: Q, model: type) -> Q:
+        """
+        Restrict a Query or Select on the model to the visible rows.
+
+        Args:
+            query (Q): The ORM Query or Core Select to restrict.
+            model (type): The mapped model class queried.
+
+        Returns:
+            Q: The query with the policy predicate added, if any.
+        """
+        condition = self.predicate(model)
+        if condition is None:
+            return query
+        return query.where(condition)
+
+
+# Policy of trusted callers (gestion, scripts): no restriction
+UNRESTRICTED = RowPolicy()
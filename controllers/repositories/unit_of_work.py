@@ -0,0 +1,141 @@
+from contextlib import contextmanager
+from typing import Iterator, TypeVar
+
+from sqlalchemy.exc import IntegrityError, PendingRollbackError
+from sqlalchemy.orm import Session
+
+from exceptions import CrmIntegrityError
+
+T = TypeVar("T")
+
+_DEPTH_KEY = "unit_of_work_depth"
+_FAILED_KEY = "unit_of_work_failed"
+_FAILED_MESSAGE = "A change failed inside the unit of work; nothing was saved."
+
+
+def in_unit_of_work(session: Session) -> bool:
+    """
+    Tell whether a unit of work is open on the session.
+
+    Args:
+        session (Session): The database session.
+
+    Returns:
+        bool: True inside a unit_of_work() block.
+    """
+    return session.info.get(_DEPTH_KEY, 0) > 0
+
+
+@contextmanager
+def unit_of_work(session: Session) -> Iterator[Session]:
+    """
+    Group repository saves and deletes into a single transaction.
+
+    Inside the block, repository save() and delete() only stage changes; the
+    outermost block commits them once on exit, or rolls everything back if an
+    exception escapes. Nested blocks join the outer transaction.
+
+    A save or delete that fails inside the block fails the whole unit of work,
+    even if its error is caught: the outermost block then rolls everything back
+    and raises CrmIntegrityError instead of committing part of the changes.
+
+    Args:
+        session (Session): The database session shared by the repositories.
+
+    Yields:
+        Session: The same session.
+
+    Raises:
+        CrmIntegrityError: If a save or delete failed inside the block.
+    """
+    depth = session.info.get(_DEPTH_KEY, 0)
+    session.info[_DEPTH_KEY] = depth + 1
+    try:
+        yield session
+        if depth == 0:
+            if session.info.get(_FAILED_KEY):
+                raise CrmIntegrityError(_FAILED_MESSAGE)
+            session.commit()
+    except Exception as e:
+        session.rollback()
+        failed = session.info.pop(_FAILED_KEY, False)
+        if depth > 0:
+            # The rollback also undid the outer blocks' changes
+            session.info[_FAILED_KEY] = True
+        elif failed and isinstance(e, PendingRollbackError):
+            # The session was used again after the failed flush
+            raise CrmIntegrityError(_FAILED_MESSAGE) from e
+        raise
+    finally:
+        session.info[_DEPTH_KEY] -= 1
+
+
+def abort_change(session: Session) -> None:
+    """
+    Undo a save or delete that failed.
+
+    Outside a unit of work the transaction is rolled back. Inside one, rolling
+    back would silently drop the changes staged earlier in the block, so the
+    unit of work is marked as failed and rolled back on exit instead.
+
+    Args:
+        session (Session): The database session.
+    """
+    if in_unit_of_work(session):
+        session.info[_FAILED_KEY] = True
+    else:
+        session.rollback()
+
+
+def save_entity(session: Session, entity: T, refresh: bool = True) -> T:
+    """
+    Add an entity and persist it according to the current mode.
+
+    Outside a unit of work the entity is committed right away (and reloaded if
+    ``refresh`` is set). Inside one it is only staged; ``refresh`` then flushes
+    it so database-generated values such as the id are available.
+
+    Args:
+        session (Session): The database session.
+        entity (T): The model instance to save.
+        refresh (bool): Whether database-generated values are needed afterwards.
+
+    Returns:
+        T: The saved entity.
+
+    Raises:
+        IntegrityError: If there is a database integrity error.
+    """
+    try:
+        session.add(entity)
+        if in_unit_of_work(session):
+            if refresh:
+                session.flush()
+            return entity
+        session.commit()
+        if refresh:
+            session.refresh(entity)
+        return entity
+    except IntegrityError:
+        abort_change(session)
+        raise
+
+
+def delete_entity(session: Session, entity) -> None:
+    """
+    Delete an entity, committing right away unless a unit of work is open.
+
+    Args:
+        session (Session): The database session.
+        entity: The model instance to delete.
+
+    Raises:
+        IntegrityError: If there is a database integrity error.
+    """
+    try:
+        session.delete(entity)
+        if not in_unit_of_work(session):
+            session.commit()
+    except IntegrityError:
+        abort_change(session)
+        raise
@@ -1,8 +1,11 @@
 from typing import Type
 
+from sqlalchemy import insert, select
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import InstrumentedAttribute, Session
 
+from controllers.repositories.pagination import PAGE_SIZE, Page, paginate
+from controllers.repositories.unit_of_work import abort_change, delete_entity, in_unit_of_work, save_entity
 from models.user import User
 
 
@@ -44,12 +47,14 @@ class UserRepository:
         """
         return self.session.query(User).filter_by(id=user_id).first()
 
-    def save(self, user: User) -> User:
+    def save(self, user: User, refresh: bool = True) -> User:
         """
         Save a user to the database.
 
         Args:
             user (User): The User object to save.
+            refresh (bool): Reload database-generated values after saving.
+                Inside a unit of work, the user is only flushed when set.
 
         Returns:
             User: The saved User object with updated attributes.
@@ -57,13 +62,40 @@ class UserRepository:
         Raises:
             IntegrityError: If there is a database integrity error.
         """
+        return save_entity(self.session, user, refresh)
+
+    def find_existing_emails(self, emails: set[str]) -> set[str]:
+        """
+        Find which of the given emails are already registered, with a single query.
+
+        Args:
+            emails (set[str]): Email addresses to look up.
+
+        Returns:
+            set[str]: The emails already in the database.
+        """
+        if not emails:
+            return set()
+        return set(self.session.scalars(select(User.email).where(User.email.in_(emails))))
+
+    def bulk_insert(self, rows: list[dict]) -> None:
+        """
+        Insert many users in a single transaction.
+
+        Inside a unit of work, the rows join its transaction instead.
+
+        Args:
+            rows (list[dict]): Column values of the users to insert, password_hash included.
+
+        Raises:
+            IntegrityError: If a row violates a constraint; nothing is inserted.
+        """
         try:
-            self.session.add(user)
-            self.session.commit()
-            self.session.refresh(user)
-            return user
+            self.session.execute(insert(User), rows)
+            if not in_unit_of_work(self.session):
+                self.session.commit()
         except IntegrityError:
-            self.session.rollback()
+            abort_change(self.session)
             raise
 
     def delete(self, user: User) -> None:
@@ -76,12 +108,7 @@ class UserRepository:
         Raises:
             IntegrityError: If there is a database integrity error.
         """
-        try:
-            self.session.delete(user)
-            self.session.commit()
-        except IntegrityError:
-            self.session.rollback()
-            raise
+        delete_entity(self.session, user)
 
     def list_all(self) -> list[Type[User]]:
         """
@@ -91,3 +118,25 @@ class UserRepository:
             list[Type[User]]: A list of all User objects.
         """
         return self.session.query(User).all()
+
+    def page(
+        self,
+        after=None,
+        before=None,
+        limit: int = PAGE_SIZE,
+        sort_key: InstrumentedAttribute | None = None
+    ) -> Page[User]:
+        """
+        Retrieve one page of users using keyset pagination.
+
+        Args:
+            after: Cursor returned as ``next_cursor`` by the previous page.
+            before: Cursor returned as ``prev_cursor`` by the following page.
+            limit (int): Maximum number of users in the page.
+            sort_key (InstrumentedAttribute | None): Column to sort on, ties broken by id.
+
+        Returns:
+            Page[User]: The requested page of users.
+        """
+        keys = (sort_key, User.id) if sort_key is not None else (User.id,)
+        return paginate(self.session.query(User), keys, after, before, limit)
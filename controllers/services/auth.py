@@ -6,6 +6,7 @@ from jwt import decode, encode, ExpiredSignatureError, InvalidTokenError
 from sqlalchemy.orm import Session
 
 from controllers.repositories.user_repository import UserRepository
+from controllers.services.auth_context import auth_context
 from controllers.services.token_cache import delete_token, load_token
 from exceptions import CrmAuthenticationError
 from models.user import User
@@ -85,6 +86,9 @@ def get_current_user(session: Session) -> User | None:
     """
     Get the currently authenticated user from the stored token.
 
+    The verified claims and the user are cached in the auth context until the
+    token expires or the token file changes.
+
     Args:
         session (Session): Database session for user lookup.
 
@@ -94,15 +98,23 @@ def get_current_user(session: Session) -> User | None:
     Raises:
         CrmAuthenticationError: If no token is found or token is invalid.
     """
-    token = load_token()
-    if not token:
-        raise CrmAuthenticationError("No authentication token found.")
+    user = auth_context.get_user(session)
+    if user:
+        return user
+
+    payload = auth_context.get_claims()
+    if payload is None:
+        token = load_token()
+        if not token:
+            raise CrmAuthenticationError("No authentication token found.")
+        payload = decode_token(token)
+        auth_context.set_claims(payload)
 
-    payload = decode_token(token)
     user_id = payload["id"]
     user = UserRepository(session).get_by_id(user_id)
 
     if not user:
         raise CrmAuthenticationError("User not found.")
 
+    auth_context.set_user(session, user)
     return user
@@ -0,0 +1,122 @@
+import os
+import time
+from datetime import datetime
+
+from sqlalchemy.orm import Session
+
+import controllers.services.token_cache as token_cache
+from models.user import User
+
+
+class AuthContext:
+    """
+    In-process cache of the verified token claims and the authenticated user.
+
+    Claims stay valid until the token expires or the token file changes
+    (checked with a stat of the file, not a read), so repeated authorization
+    checks skip the file read, the JWT signature check and the user SELECT.
+    """
+
+    def __init__(self):
+        """Initialize an empty context."""
+        self.clear()
+
+    def clear(self) -> None:
+        """Forget the cached claims and user."""
+        self._stamp = None
+        self._claims = None
+        self._user = None
+        self._user_session = None
+
+    @staticmethod
+    def _file_stamp() -> tuple[int, int, int] | None:
+        """
+        Identify the current version of the token file.
+
+        Returns:
+            tuple[int, int, int] | None: (inode, mtime in ns, size), None if there is no file.
+        """
+        try:
+            stat = os.stat(token_cache.TOKEN_PATH)
+        except OSError:
+            return None
+        return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+    @staticmethod
+    def _expires_at(claims: dict) -> float:
+        """
+        Read the expiry of the claims as a timestamp.
+
+        Args:
+            claims (dict): The decoded token payload.
+
+        Returns:
+            float: The expiry timestamp, 0 when the claims have no expiry.
+        """
+        exp = claims.get("exp", 0)
+        return exp.timestamp() if isinstance(exp, datetime) else float(exp)
+
+    def get_claims(self) -> dict | None:
+        """
+        Return the cached claims if they are still valid.
+
+        Returns:
+            dict | None: The claims, None if nothing is cached, the token
+            file changed or the token expired.
+        """
+        if self._claims is None:
+            return None
+        if self._file_stamp() != self._stamp or self._expires_at(self._claims) <= time.time():
+            self.clear()
+            return None
+        return self._claims
+
+    def set_claims(self, claims: dict) -> None:
+        """
+        Cache freshly verified claims for the current token file.
+
+        Claims without an expiry, or read while no token file exists, are not cached.
+
+        Args:
+            claims (dict): The decoded token payload.
+        """
+        stamp = self._file_stamp()
+        if stamp is None or self._expires_at(claims) <= time.time():
+            self.clear()
+            return
+        if claims != self._claims:
+            self._user = None
+            self._user_session = None
+        self._stamp = stamp
+        self._claims = claims
+
+    def get_user(self, session: Session) -> User | None:
+        """
+        Return the cached user for the current claims and session.
+
+        Args:
+            session (Session): The session the user must belong to.
+
+        Returns:
+            User | None: The cached user, None on a cache miss.
+        """
+        claims = self.get_claims()
+        if claims is None or self._user is None or self._user_session is not session:
+            return None
+        return self._user
+
+    def set_user(self, session: Session, user: User) -> None:
+        """
+        Cache the user loaded for the current claims.
+
+        Args:
+            session (Session): The session the user was loaded with.
+            user (User): The authenticated user.
+        """
+        if self._claims is not None and self._claims.get("id") == user.id:
+            self._user = user
+            self._user_session = session
+
+
+# Create a unique instance of the auth context
+auth_context = AuthContext()
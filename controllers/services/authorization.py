@@ -1,11 +1,14 @@
+import inspect
+from dataclasses import dataclass, field
 from functools import wraps
-
-from sqlalchemy.orm import InstrumentedAttribute
+from typing import Iterable
 
 from controllers.repositories.client_repository import ClientRepository
 from controllers.repositories.contract_repository import ContractRepository
 from controllers.repositories.event_repository import EventRepository
 from controllers.services.auth import decode_token
+from controllers.services.auth_context import auth_context
+from controllers.services.permissions import Access, check_action, get_access, is_allowed
 from controllers.services.token_cache import load_token
 from exceptions import (
     CrmAuthenticationError,
@@ -13,22 +16,111 @@ from exceptions import (
     CrmInvalidValue,
     CrmNotFoundError,
 )
+from models.client import Client
+from models.contract import Contract
+from models.event import Event
 
 
 def get_token_payload_or_raise() -> dict:
     """
     Load and decode the authentication token from cache.
 
+    Verified claims are reused from the auth context while the token file is
+    unchanged and the token has not expired.
+
     Returns:
         dict: The decoded token payload.
 
     Raises:
         CrmAuthenticationError: If the token is missing or invalid.
     """
+    payload = auth_context.get_claims()
+    if payload is not None:
+        return payload
     token = load_token()
     if not token:
         raise CrmAuthenticationError()
-    return decode_token(token)
+    payload = decode_token(token)
+    auth_context.set_claims(payload)
+    return payload
+
+
+def _unwrap_session(session):
+    """
+    Return the SQLAlchemy session of a controller, or the session itself.
+
+    Args:
+        session: Database session or controller object with a session attribute.
+
+    Returns:
+        The database session.
+    """
+    if hasattr(session, 'session'):
+        return session.session
+    return session
+
+
+def get_client_with_owner(session, client_id: int) -> tuple[Client, int | None]:
+    """
+    Load a client together with its commercial owner's ID.
+
+    Args:
+        session: Database session or controller object with a session attribute.
+        client_id (int): The ID of the client.
+
+    Returns:
+        tuple[Client, int | None]: The client and the ID of its commercial owner.
+
+    Raises:
+        CrmNotFoundError: If the client does not exist.
+    """
+    client = ClientRepository(_unwrap_session(session)).get_by_id(client_id)
+    if not client:
+        raise CrmNotFoundError("Client")
+    return client, client.commercial_id
+
+
+def get_contract_with_owner(session, contract_id: int) -> tuple[Contract, int]:
+    """
+    Load a contract together with its commercial owner's ID.
+
+    Args:
+        session: Database session or controller object with a session attribute.
+        contract_id (int): The ID of the contract.
+
+    Returns:
+        tuple[Contract, int]: The contract and the ID of its commercial owner.
+
+    Raises:
+        CrmNotFoundError: If the contract does not exist.
+    """
+    contract = ContractRepository(_unwrap_session(session)).get_by_id(contract_id)
+    if not contract:
+        raise CrmNotFoundError("Contract")
+    return contract, contract.commercial_id
+
+
+def get_event_with_owner(session, event_id: int) -> tuple[Event, int]:
+    """
+    Load an event together with the commercial owner of its contract, in one joined query.
+
+    Args:
+        session: Database session or controller object with a session attribute.
+        event_id (int): The ID of the event.
+
+    Returns:
+        tuple[Event, int]: The event and the ID of its commercial owner.
+
+    Raises:
+        CrmNotFoundError: If the event or its associated contract does not exist.
+    """
+    row = EventRepository(_unwrap_session(session)).get_with_owner_id(event_id)
+    if not row:
+        raise CrmNotFoundError("Event")
+    event, owner_id = row
+    if owner_id is None:
+        raise CrmNotFoundError("Associated contract")
+    return event, owner_id
 
 
 def get_client_owner_id(session, **kwargs) -> int:
@@ -45,15 +137,10 @@ def get_client_owner_id(session, **kwargs) -> int:
     Raises:
         CrmNotFoundError: If the client does not exist.
     """
-    if hasattr(session, 'session'):
-        session = session.session
-    client = ClientRepository(session).get_by_id(kwargs["client_id"])
-    if not client:
-        raise CrmNotFoundError("Client")
-    return client.commercial_id
+    return get_client_with_owner(session, kwargs["client_id"])[1]
 
 
-def get_contract_owner_id(session, contract_id: int) -> InstrumentedAttribute[int] | None:
+def get_contract_owner_id(session, contract_id: int) -> int:
     """
     Retrieve the commercial owner's ID for a contract.
 
@@ -62,17 +149,12 @@ def get_contract_owner_id(session, contract_id: int) -> InstrumentedAttribute[in
         contract_id (int): The ID of the contract.
 
     Returns:
-        InstrumentedAttribute[int] | None: The ID of the commercial owner.
+        int: The ID of the commercial owner.
 
     Raises:
         CrmNotFoundError: If the contract does not exist.
     """
-    if hasattr(session, 'session'):
-        session = session.session
-    contract = ContractRepository(session).get_by_id(contract_id)
-    if not contract:
-        raise CrmNotFoundError("Contract")
-    return contract.commercial_id
+    return get_contract_with_owner(session, contract_id)[1]
 
 
 def get_event_owner_id(session, event_id: int) -> int:
@@ -89,100 +171,268 @@ def get_event_owner_id(session, event_id: int) -> int:
     Raises:
         CrmNotFoundError: If the event or its associated contract does not exist.
     """
-    if hasattr(session, 'session'):
-        session = session.session
-    event = EventRepository(session).get_by_id(event_id)
-    if not event:
-        raise CrmNotFoundError("Event")
-    contract = ContractRepository(session).get_by_id(event.contract_id)
-    if not contract:
-        raise CrmNotFoundError("Associated contract")
-    return contract.commercial_id
+    return get_event_with_owner(session, event_id)[1]
+
 
+# Repository and display name of each resource type checked in batches
+BATCH_RESOURCES = {
+    "client": (ClientRepository, "Client"),
+    "contract": (ContractRepository, "Contract"),
+    "event": (EventRepository, "Event"),
+}
 
-def requires_role(required_role: str):
+
+@dataclass
+class BatchAuthorization:
     """
-    Decorator to restrict access to users with a specific role.
+    Per-ID outcome of a batch ownership check.
+
+    Attributes:
+        allowed (set[int]): IDs the current user may act on.
+        denied (set[int]): IDs that exist but that the user may not act on
+            (owned by another user, or without an owner).
+        not_found (set[int]): IDs with no matching resource.
+    """
+
+    allowed: set[int] = field(default_factory=set)
+    denied: set[int] = field(default_factory=set)
+    not_found: set[int] = field(default_factory=set)
+
+    def status(self, resource_id: int) -> str:
+        """
+        Return the outcome for one ID.
+
+        Args:
+            resource_id (int): An ID that was part of the check.
+
+        Returns:
+            str: "allowed", "denied" or "not_found".
+        """
+        if resource_id in self.allowed:
+            return "allowed"
+        if resource_id in self.denied:
+            return "denied"
+        return "not_found"
+
+    def raise_for_errors(self, resource_name: str = "Resource") -> None:
+        """
+        Fail unless every checked ID is allowed.
+
+        Args:
+            resource_name (str): Name of the resource used in the error message.
+
+        Raises:
+            CrmNotFoundError: If some IDs do not exist.
+            CrmForbiddenAccessError: If some IDs belong to another user.
+        """
+        if self.not_found:
+            ids = ", ".join(map(str, sorted(self.not_found)))
+            raise CrmNotFoundError(message=f"{resource_name} not found: {ids}.")
+        if self.denied:
+            raise CrmForbiddenAccessError
+
+
+def authorize_many(session, resource: str, resource_ids: Iterable[int], action: str) -> BatchAuthorization:
+    """
+    Check a permission on many resources at once, with one query for the whole set.
+
+    The access of the current user's role to ``action`` is looked up in the
+    permission table. ``Access.ALLOW`` grants every existing resource;
+    ``Access.OWNER`` only the resources the user owns, never those without
+    an owner.
 
     Args:
-        required_role (str): The role required to access the decorated function.
+        session: Database session or controller object with a session attribute.
+        resource (str): One of BATCH_RESOURCES ("client", "contract", "event").
+        resource_ids (Iterable[int]): The IDs to check.
+        action (str): An action of the permission table, e.g. "event.assign_support".
 
     Returns:
-        function: The decorated function with role-based access control.
+        BatchAuthorization: The allowed, denied and missing IDs.
+
+    Raises:
+        CrmInvalidValue: If the resource type or the action is unknown.
+        CrmAuthenticationError: If the token is missing or invalid.
+        CrmForbiddenAccessError: If the role has no access to the action at all.
     """
-    def decorator(func):
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            payload = get_token_payload_or_raise()
-            if payload.get("role") != required_role:
-                raise CrmForbiddenAccessError
-            return func(*args, **kwargs)
-        return wrapper
-    return decorator
+    if resource not in BATCH_RESOURCES:
+        raise CrmInvalidValue(f"Resource must be one of: {', '.join(BATCH_RESOURCES)}")
+    check_action(action)
+    payload = get_token_payload_or_raise()
+    access = get_access(payload["role"], action)
+    if access is None:
+        raise CrmForbiddenAccessError
+    repository, _ = BATCH_RESOURCES[resource]
+
+    resource_ids = set(resource_ids)
+    owners = repository(_unwrap_session(session)).get_owner_ids(resource_ids)
+    result = BatchAuthorization()
+    for resource_id in resource_ids:
+        if resource_id not in owners:
+            result.not_found.add(resource_id)
+        # A resource without an owner (None) is only open to Access.ALLOW
+        elif access is Access.ALLOW or owners[resource_id] == payload["id"]:
+            result.allowed.add(resource_id)
+        else:
+            result.denied.add(resource_id)
+    return result
+
+
+def _get_session(args: tuple, kwargs: dict):
+    """
+    Find the session (or controller) a decorated call was made with.
+
+    Args:
+        args (tuple): Positional arguments of the call.
+        kwargs (dict): Keyword arguments of the call.
+
+    Returns:
+        The ``session`` keyword argument, or the first positional argument.
+
+    Raises:
+        CrmInvalidValue: If session is not provided.
+    """
+    session = kwargs.get("session")
+    if session is None and args:
+        session = args[0]
+    if session is None:
+        raise CrmInvalidValue("Session required")
+    return session
 
 
-def requires_self_or_role(required_role: str):
+def _resolve_owner(get_owner_id, signature: inspect.Signature, session, args: tuple, kwargs: dict):
     """
-    Decorator to restrict access to the user themselves or users with a specific role.
+    Call an owner lookup with the resource ID found in the decorated call.
 
     Args:
-        required_role (str): The role that can access any user's data.
+        get_owner_id (function): Function that retrieves the owner ID of the resource.
+        signature (inspect.Signature): Signature of the decorated function.
+        session: Database session or controller object with a session attribute.
+        args (tuple): Positional arguments of the call.
+        kwargs (dict): Keyword arguments of the call.
 
     Returns:
-        function: The decorated function with access control.
+        The value returned by ``get_owner_id``.
     """
+    arguments = signature.bind_partial(*args, **kwargs).arguments
+    owner_kwargs = {'session': session}
+    for id_name in ('client_id', 'contract_id', 'event_id'):
+        if id_name in arguments:
+            owner_kwargs[id_name] = arguments[id_name]
+            break
+    return get_owner_id(**owner_kwargs)
+
+
+def requires_permission(action: str, get_owner_id=None, pass_as: str | None = None):
+    """
+    Decorator to restrict access according to the permission table.
+
+    The role of the current user is looked up for ``action`` in
+    controllers.services.permissions. ``Access.ALLOW`` grants the call. Without
+    ``get_owner_id``, ``Access.OWNER`` grants it too and the decorated function
+    checks ownership itself; with it, the user must own the resource.
+
+    With ``pass_as``, ``get_owner_id`` must return an (entity, owner_id) tuple,
+    such as get_client_with_owner(). The entity loaded for the check is then
+    handed to the decorated function as the ``pass_as`` keyword argument, so
+    it does not need to load it again.
+
+    Args:
+        action (str): An action of the permission table, e.g. "client.update".
+        get_owner_id (function | None): Function that retrieves the owner ID of the resource.
+        pass_as (str | None): Keyword argument receiving the loaded entity.
+
+    Returns:
+        function: The decorated function with permission-based access control.
+
+    Raises:
+        CrmInvalidValue: If the action is unknown, or session is not provided
+            when ownership is checked.
+        CrmForbiddenAccessError: If the user lacks the permission or ownership.
+    """
+    check_action(action)
+
     def decorator(func):
+        if get_owner_id is None:
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                payload = get_token_payload_or_raise()
+                if not is_allowed(payload.get("role"), action):
+                    raise CrmForbiddenAccessError
+                return func(*args, **kwargs)
+            return wrapper
+
+        signature = inspect.signature(func)
+
         @wraps(func)
-        def wrapper(*args, **kwargs):
+        def owner_wrapper(*args, **kwargs):
+            session = _get_session(args, kwargs)
             payload = get_token_payload_or_raise()
-            if payload["role"] != required_role and payload["id"] != kwargs.get("user_id"):
+            access = get_access(payload["role"], action)
+            if access is None:
                 raise CrmForbiddenAccessError
+            if access is Access.ALLOW and pass_as is None:
+                return func(*args, **kwargs)
+
+            owner_id = _resolve_owner(get_owner_id, signature, session, args, kwargs)
+            if pass_as is not None:
+                entity, owner_id = owner_id
+                kwargs[pass_as] = entity
+            if access is Access.OWNER and owner_id != payload["id"]:
+                raise CrmForbiddenAccessError
+
             return func(*args, **kwargs)
-        return wrapper
+        return owner_wrapper
     return decorator
 
 
-def requires_ownership_or_role(get_owner_id, required_role: str):
+def requires_permission_for_all(action: str, resource: str, pass_as: str | None = None):
     """
-    Decorator to restrict access to the resource owner or users with a specific role.
+    Batch variant of requires_permission for methods taking a list of IDs.
+
+    The IDs are read from the ``<resource>_ids`` argument and checked with
+    authorize_many(). Without ``pass_as`` the call is rejected unless every ID
+    is allowed; with it, the BatchAuthorization is handed to the decorated
+    function as that keyword argument so it can process the allowed IDs and
+    report the others.
 
     Args:
-        get_owner_id (function): Function that retrieves the owner ID of the resource.
-        required_role (str): The role that can access any resource.
+        action (str): An action of the permission table, e.g. "event.assign_support".
+        resource (str): One of BATCH_RESOURCES ("client", "contract", "event").
+        pass_as (str | None): Keyword argument receiving the BatchAuthorization.
 
     Returns:
-        function: The decorated function with ownership/role-based access control.
+        function: The decorated function with permission-based access control.
 
     Raises:
-        CrmInvalidValue: If session is not provided.
-        CrmForbiddenAccessError: If user lacks required role or ownership.
+        CrmInvalidValue: If the action or resource is unknown, or session or the
+            IDs argument is not provided.
+        CrmForbiddenAccessError: If the role has no access to the action, or some
+            IDs are not allowed (without ``pass_as``).
+        CrmNotFoundError: If some IDs do not exist (without ``pass_as``).
     """
+    check_action(action)
+    if resource not in BATCH_RESOURCES:
+        raise CrmInvalidValue(f"Resource must be one of: {', '.join(BATCH_RESOURCES)}")
+    ids_name = f"{resource}_ids"
+    resource_name = BATCH_RESOURCES[resource][1]
+
     def decorator(func):
+        signature = inspect.signature(func)
+
         @wraps(func)
         def wrapper(*args, **kwargs):
-            session = kwargs.get("session")
-            if session is None and args:
-                session = args[0]
-            if session is None:
-                raise CrmInvalidValue("Session required")
-
-            payload = get_token_payload_or_raise()
-            current_user_id = payload["id"]
-            current_user_role = payload["role"]
+            session = _get_session(args, kwargs)
 
-            if current_user_role == required_role:
-                return func(*args, **kwargs)
-
-            owner_kwargs = {'session': session}
-            if 'client_id' in kwargs:
-                owner_kwargs['client_id'] = kwargs['client_id']
-            elif 'contract_id' in kwargs:
-                owner_kwargs['contract_id'] = kwargs['contract_id']
-
-            owner_id = get_owner_id(**owner_kwargs)
-            if owner_id != current_user_id:
-                raise CrmForbiddenAccessError
+            arguments = signature.bind_partial(*args, **kwargs).arguments
+            if ids_name not in arguments:
+                raise CrmInvalidValue(f"{ids_name} required")
 
+            result = authorize_many(session, resource, arguments[ids_name], action)
+            if pass_as is None:
+                result.raise_for_errors(resource_name)
+            else:
+                kwargs[pass_as] = result
             return func(*args, **kwargs)
         return wrapper
     return decorator
@@ -0,0 +1,216 @@
+import csv
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Iterable, TextIO
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from controllers.repositories.client_repository import ClientRepository
+from controllers.repositories.user_repository import UserRepository
+from controllers.services.authorization import requires_permission
+from controllers.validators.validators import (
+    validate_company,
+    validate_email,
+    validate_name,
+    validate_phone,
+)
+from exceptions import CrmError, CrmInvalidValue, CrmNotFoundError
+from models.user_role import UserRole
+
+IMPORT_COLUMNS = ("fullname", "email", "phone", "company")
+REJECT_COLUMNS = ("line", *IMPORT_COLUMNS, "error")
+
+
+@dataclass
+class ImportReport:
+    """
+    Outcome of a client import.
+
+    Attributes:
+        imported (int): Number of clients inserted.
+        rejected (int): Number of rows written to the reject file.
+    """
+
+    imported: int = 0
+    rejected: int = 0
+
+
+def validate_client_row(row: dict) -> dict:
+    """
+    Validate and normalize one CSV row with the client validators.
+
+    Args:
+        row (dict): The raw CSV row.
+
+    Returns:
+        dict: The normalized fullname, email, phone and company.
+
+    Raises:
+        CrmInvalidValue: If a field is missing or invalid.
+    """
+    return {
+        "fullname": validate_name(row.get("fullname") or ""),
+        "email": validate_email(row.get("email") or ""),
+        "phone": validate_phone(row.get("phone") or ""),
+        "company": validate_company(row.get("company") or ""),
+    }
+
+
+class ClientImporter:
+    """
+    Streams a CSV of clients into the database in batched transactions.
+
+    Each row is validated, checked against the database and the rows already
+    seen in the file, then inserted with its batch. Invalid or duplicate rows
+    are written to a reject file with the reason instead of aborting.
+    """
+
+    def __init__(self, session: Session, commercial_id: int, rejects: TextIO, batch_size: int = 1000):
+        """
+        Initialize the importer.
+
+        Args:
+            session (Session): Database session.
+            commercial_id (int): The commercial user the imported clients are assigned to.
+            rejects (TextIO): Stream receiving the rejected rows as CSV.
+            batch_size (int): Number of rows inserted per transaction.
+        """
+        self.repo = ClientRepository(session)
+        self.commercial_id = commercial_id
+        self.batch_size = batch_size
+        self.report = ImportReport()
+        self.seen_emails: set[str] = set()
+        self.seen_phones: set[str] = set()
+        self.rejects = csv.DictWriter(rejects, fieldnames=REJECT_COLUMNS, extrasaction="ignore")
+        self.rejects.writeheader()
+
+    def reject(self, line: int, row: dict, error: str) -> None:
+        """
+        Record a rejected row.
+
+        Args:
+            line (int): Line number of the row in the source file.
+            row (dict): The raw CSV row.
+            error (str): Why the row was rejected.
+        """
+        self.rejects.writerow({**row, "line": line, "error": error})
+        self.report.rejected += 1
+
+    def run(self, rows: Iterable[dict]) -> ImportReport:
+        """
+        Import the given rows.
+
+        Args:
+            rows (Iterable[dict]): CSV rows, e.g. from csv.DictReader.
+
+        Returns:
+            ImportReport: The number of imported and rejected rows.
+        """
+        batch: list[tuple[int, dict, dict]] = []
+        # Line 1 is the CSV header
+        for line, row in enumerate(rows, start=2):
+            try:
+                values = validate_client_row(row)
+            except CrmInvalidValue as e:
+                self.reject(line, row, str(e))
+                continue
+            if values["email"] in self.seen_emails:
+                self.reject(line, row, "Email already exists.")
+                continue
+            if values["phone"] in self.seen_phones:
+                self.reject(line, row, "Phone already exists.")
+                continue
+            self.seen_emails.add(values["email"])
+            self.seen_phones.add(values["phone"])
+            batch.append((line, row, values))
+            if len(batch) >= self.batch_size:
+                self.flush(batch)
+                batch = []
+        if batch:
+            self.flush(batch)
+        return self.report
+
+    def flush(self, batch: list[tuple[int, dict, dict]]) -> None:
+        """
+        Drop the rows clashing with the database, then insert the batch at once.
+
+        Args:
+            batch (list[tuple[int, dict, dict]]): (line, raw row, validated values) tuples.
+        """
+        emails, phones = self.repo.find_existing(
+            {values["email"] for _, _, values in batch},
+            {values["phone"] for _, _, values in batch},
+        )
+        now = datetime.now()
+        accepted = []
+        for line, row, values in batch:
+            if values["email"] in emails:
+                self.reject(line, row, "Email already exists.")
+            elif values["phone"] in phones:
+                self.reject(line, row, "Phone already exists.")
+            else:
+                accepted.append((line, row, {
+                    **values,
+                    "commercial_id": self.commercial_id,
+                    "created_at": now,
+                    "updated_at": now,
+                }))
+        if not accepted:
+            return
+
+        try:
+            self.repo.bulk_insert([client for _, _, client in accepted])
+            self.report.imported += len(accepted)
+        except IntegrityError:
+            # Rows were added concurrently: retry one by one to isolate them
+            for line, row, client in accepted:
+                try:
+                    self.repo.bulk_insert([client])
+                    self.report.imported += 1
+                except IntegrityError as e:
+                    self.reject(line, row, f"Integrity error: {e.orig}")
+
+
+@requires_permission("client.import")
+def import_clients(
+    session: Session,
+    source: TextIO,
+    rejects: TextIO,
+    commercial_id: int,
+    batch_size: int = 1000
+) -> ImportReport:
+    """
+    Import a CSV of clients and assign them to a commercial.
+
+    The CSV must have a header with the columns fullname, email, phone, company.
+
+    Args:
+        session (Session): Database session.
+        source (TextIO): The CSV to import.
+        rejects (TextIO): Stream receiving the rejected rows as CSV.
+        commercial_id (int): The commercial user the clients are assigned to.
+        batch_size (int): Number of rows inserted per transaction.
+
+    Returns:
+        ImportReport: The number of imported and rejected rows.
+
+    Raises:
+        CrmNotFoundError: If the commercial user does not exist.
+        CrmInvalidValue: If the user is not a commercial or the CSV header is incomplete.
+    """
+    commercial = UserRepository(session).get_by_id(commercial_id)
+    if not commercial:
+        raise CrmNotFoundError("Commercial user")
+    if commercial.role != UserRole.COMMERCIAL:
+        raise CrmInvalidValue("User must have commercial role.")
+
+    reader = csv.DictReader(source)
+    missing = set(IMPORT_COLUMNS) - set(reader.fieldnames or ())
+    if missing:
+        raise CrmInvalidValue(f"Missing CSV columns: {', '.join(sorted(missing))}")
+
+    try:
+        return ClientImporter(session, commercial_id, rejects, batch_size).run(reader)
+    except csv.Error as e:
+        raise CrmError(f"Malformed CSV: {e}") from e
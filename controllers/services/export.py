@@ -0,0 +1,158 @@
+import csv
+import gzip
+import json
+import sys
+from contextlib import contextmanager
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Iterable, Iterator, TextIO
+
+from sqlalchemy import RowMapping
+from sqlalchemy.orm import Session
+
+from controllers.repositories.client_repository import ClientRepository
+from controllers.repositories.contract_repository import ContractRepository
+from controllers.repositories.event_repository import EventRepository
+from controllers.services.authorization import requires_permission
+from exceptions import CrmError, CrmInvalidValue
+
+EXPORT_REPOSITORIES = {
+    "clients": ClientRepository,
+    "contracts": ContractRepository,
+    "events": EventRepository,
+}
+EXPORT_FORMATS = ("csv", "jsonl")
+
+
+def serialize_value(value):
+    """
+    Convert a column value to a CSV/JSON friendly value.
+
+    Args:
+        value: The raw column value.
+
+    Returns:
+        The value as a str, int, bool or None.
+    """
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, Enum):
+        return value.value
+    return value
+
+
+@contextmanager
+def open_output(path: str, compress: bool = False) -> Iterator[TextIO]:
+    """
+    Open an export destination for writing text.
+
+    Args:
+        path (str): Destination file path, or "-" for standard output.
+        compress (bool): Write gzip-compressed data.
+
+    Yields:
+        TextIO: The text stream to write to.
+
+    Raises:
+        CrmError: If the file cannot be opened.
+    """
+    if path == "-":
+        if compress:
+            with gzip.open(sys.stdout.buffer, "wt", encoding="utf-8", newline="") as fh:
+                yield fh
+        else:
+            yield sys.stdout
+        return
+    try:
+        if compress:
+            fh = gzip.open(path, "wt", encoding="utf-8", newline="")
+        else:
+            fh = open(path, "w", encoding="utf-8", newline="")
+    except OSError as e:
+        raise CrmError(f"Failed to open export file {path}: {e}") from e
+    with fh:
+        yield fh
+
+
+def write_csv(rows: Iterable[RowMapping], fh: TextIO) -> int:
+    """
+    Write rows as CSV, with a header taken from the first row.
+
+    Args:
+        rows (Iterable[RowMapping]): The rows to write.
+        fh (TextIO): The destination stream.
+
+    Returns:
+        int: The number of rows written.
+    """
+    writer = None
+    count = 0
+    for row in rows:
+        if writer is None:
+            writer = csv.writer(fh)
+            writer.writerow(row.keys())
+        writer.writerow(serialize_value(v) for v in row.values())
+        count += 1
+    return count
+
+
+def write_jsonl(rows: Iterable[RowMapping], fh: TextIO) -> int:
+    """
+    Write rows as JSON Lines, one object per row.
+
+    Args:
+        rows (Iterable[RowMapping]): The rows to write.
+        fh (TextIO): The destination stream.
+
+    Returns:
+        int: The number of rows written.
+    """
+    count = 0
+    for row in rows:
+        fh.write(json.dumps({k: serialize_value(v) for k, v in row.items()}))
+        fh.write("\n")
+        count += 1
+    return count
+
+
+@requires_permission("data.export")
+def export_entity(
+    session: Session,
+    entity: str,
+    fmt: str,
+    path: str,
+    compress: bool = False,
+    batch_size: int = 1000
+) -> int:
+    """
+    Stream every row of an entity to a CSV or JSON Lines file.
+
+    Rows are fetched batch_size at a time and written as they arrive, so the
+    memory used does not grow with the table size.
+
+    Args:
+        session (Session): Database session.
+        entity (str): One of EXPORT_REPOSITORIES ("clients", "contracts", "events").
+        fmt (str): One of EXPORT_FORMATS ("csv", "jsonl").
+        path (str): Destination file path, or "-" for standard output.
+        compress (bool): Write gzip-compressed data.
+        batch_size (int): Number of rows fetched from the database per batch.
+
+    Returns:
+        int: The number of rows exported.
+
+    Raises:
+        CrmInvalidValue: If the entity or format is unknown.
+    """
+    if entity not in EXPORT_REPOSITORIES:
+        raise CrmInvalidValue(f"Entity must be one of: {', '.join(EXPORT_REPOSITORIES)}")
+    if fmt not in EXPORT_FORMATS:
+        raise CrmInvalidValue(f"Format must be one of: {', '.join(EXPORT_FORMATS)}")
+
+    rows = EXPORT_REPOSITORIES[entity](session).stream_rows(batch_size)
+    writer = write_csv if fmt == "csv" else write_jsonl
+    with open_output(path, compress) as fh:
+        return writer(rows, fh)
@@ -0,0 +1,179 @@
+import enum
+from typing import Iterable
+
+from exceptions import CrmInvalidValue
+from models.user_role import UserRole
+
+
+class Access(enum.Enum):
+    """Level of access a role has on an action."""
+
+    # The action is allowed on any record
+    ALLOW = "allow"
+    # The action is allowed on the records the user owns only
+    OWNER = "owner"
+
+
+_ALL_ROLES = tuple(UserRole)
+
+# Role x action table. Roles missing from an action are denied.
+PERMISSIONS: dict[str, dict[UserRole, Access]] = {
+    # Clients
+    "client.list": dict.fromkeys(_ALL_ROLES, Access.ALLOW),
+    "client.list_own": {UserRole.COMMERCIAL: Access.ALLOW},
+    "client.create": {UserRole.COMMERCIAL: Access.ALLOW},
+    "client.update": {UserRole.GESTION: Access.ALLOW, UserRole.COMMERCIAL: Access.OWNER},
+    "client.delete": {UserRole.GESTION: Access.ALLOW, UserRole.COMMERCIAL: Access.OWNER},
+    "client.import": {UserRole.GESTION: Access.ALLOW},
+    # Contracts
+    "contract.list": dict.fromkeys(_ALL_ROLES, Access.ALLOW),
+    "contract.list_own": {UserRole.COMMERCIAL: Access.ALLOW},
+    "contract.list_unsigned": {UserRole.COMMERCIAL: Access.ALLOW},
+    "contract.list_unpaid": {UserRole.COMMERCIAL: Access.ALLOW},
+    "contract.create": {UserRole.GESTION: Access.ALLOW},
+    "contract.update": {UserRole.GESTION: Access.ALLOW, UserRole.COMMERCIAL: Access.OWNER},
+    # Events
+    "event.list": dict.fromkeys(_ALL_ROLES, Access.ALLOW),
+    "event.list_own": {UserRole.SUPPORT: Access.ALLOW},
+    "event.list_unassigned": {UserRole.GESTION: Access.ALLOW},
+    # Commercials create events for their own contracts only
+    "event.create": {UserRole.COMMERCIAL: Access.OWNER},
+    "event.assign_support": {UserRole.GESTION: Access.ALLOW},
+    # Support users update the events assigned to them only
+    "event.update": {UserRole.GESTION: Access.ALLOW, UserRole.SUPPORT: Access.OWNER},
+    # Collaborators
+    "user.list": {UserRole.GESTION: Access.ALLOW},
+    "user.create": {UserRole.GESTION: Access.ALLOW},
+    "user.update": {UserRole.GESTION: Access.ALLOW},
+    "user.delete": {UserRole.GESTION: Access.ALLOW},
+    # Bulk data
+    "data.export": {UserRole.GESTION: Access.ALLOW},
+}
+
+
+def _compile(permissions: dict[str, dict[UserRole, Access]]) -> dict[tuple[str, str], Access]:
+    """
+    Flatten the permission table into a (role value, action) lookup.
+
+    Token payloads carry the role as its string value, so keying on it lets
+    the decorators look permissions up without building a UserRole first.
+
+    Args:
+        permissions (dict[str, dict[UserRole, Access]]): The role x action table.
+
+    Returns:
+        dict[tuple[str, str], Access]: The access level of every granted (role, action) pair.
+    """
+    return {
+        (role.value, action): access
+        for action, grants in permissions.items()
+        for role, access in grants.items()
+    }
+
+
+# Compiled once at import; every check below is a single dict lookup
+_MATRIX = _compile(PERMISSIONS)
+
+
+def _role_value(role: UserRole | str) -> str:
+    """
+    Normalize a role to its string value.
+
+    Args:
+        role (UserRole | str): A UserRole or its value.
+
+    Returns:
+        str: The role value, e.g. "gestion".
+    """
+    return role.value if isinstance(role, UserRole) else role
+
+
+def get_access(role: UserRole | str, action: str) -> Access | None:
+    """
+    Return the access level of a role on an action.
+
+    Args:
+        role (UserRole | str): The role of the user.
+        action (str): An action of PERMISSIONS, e.g. "client.update".
+
+    Returns:
+        Access | None: The access level, None if the action is denied.
+    """
+    return _MATRIX.get((_role_value(role), action))
+
+
+def is_allowed(role: UserRole | str, action: str) -> bool:
+    """
+    Tell whether a role may perform an action, on any record or on its own.
+
+    Args:
+        role (UserRole | str): The role of the user.
+        action (str): An action of PERMISSIONS.
+
+    Returns:
+        bool: True if the role has any access to the action.
+    """
+    return (_role_value(role), action) in _MATRIX
+
+
+def check_action(action: str) -> str:
+    """
+    Validate an action name, so typos fail when a decorator or menu is built.
+
+    Args:
+        action (str): The action name.
+
+    Returns:
+        str: The same action name.
+
+    Raises:
+        CrmInvalidValue: If the action is not in PERMISSIONS.
+    """
+    if action not in PERMISSIONS:
+        raise CrmInvalidValue(f"Unknown permission action '{action}'.")
+    return action
+
+
+def compile_menu(entries: Iterable[tuple[str, str | None]]) -> dict[str | None, tuple[str, ...]]:
+    """
+    Precompute the options of a menu for every role.
+
+    Args:
+        entries (Iterable[tuple[str, str | None]]): (label, action) pairs in display
+            order. Entries without an action are shown to every role.
+
+    Returns:
+        dict[str | None, tuple[str, ...]]: The visible labels, keyed by role value.
+        The None key holds the entries shown to any other role.
+
+    Raises:
+        CrmInvalidValue: If an entry refers to an unknown action.
+    """
+    entries = [(label, action if action is None else check_action(action)) for label, action in entries]
+    menu = {
+        role.value: tuple(
+            label for label, action in entries
+            if action is None or is_allowed(role, action)
+        )
+        for role in UserRole
+    }
+    menu[None] = tuple(label for label, action in entries if action is None)
+    return menu
+
+
+def menu_options(menu: dict[str | None, tuple[str, ...]], role: UserRole | str) -> list[str]:
+    """
+    Return the options of a compiled menu for a role.
+
+    Args:
+        menu (dict[str | None, tuple[str, ...]]): A menu built by compile_menu().
+        role (UserRole | str): The role of the user.
+
+    Returns:
+        list[str]: The labels to display. Unknown roles only get the entries
+        without an action.
+    """
+    options = menu.get(_role_value(role))
+    if options is None:
+        options = menu[None]
+    return list(options)
@@ -0,0 +1,187 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+from typing import Iterable, Sequence
+
+from argon2 import PasswordHasher
+from sqlalchemy.orm import Session
+
+from controllers.repositories.user_repository import UserRepository
+from controllers.services.authorization import requires_permission
+from controllers.validators.validators import (
+    validate_email,
+    validate_name,
+    validate_password,
+    validate_role,
+)
+from exceptions import CrmInvalidValue
+from models.user import ARGON2_PROFILE, get_password_hasher
+
+
+@lru_cache(maxsize=None)
+def _hasher(profile: str) -> PasswordHasher:
+    """
+    Return the hasher of a profile, built once per process.
+
+    Args:
+        profile (str): Name of a profile in ARGON2_PROFILES.
+
+    Returns:
+        PasswordHasher: The profile's hasher.
+    """
+    return get_password_hasher(profile)
+
+
+def _hash_password(profile: str, password: str) -> str:
+    """
+    Hash one password; module-level so worker processes can unpickle it.
+
+    Args:
+        profile (str): Name of a profile in ARGON2_PROFILES.
+        password (str): The plaintext password.
+
+    Returns:
+        str: The encoded argon2 hash.
+    """
+    return _hasher(profile).hash(password)
+
+
+def hash_passwords(
+    passwords: Sequence[str],
+    workers: int | None = None,
+    profile: str = ARGON2_PROFILE,
+    pool: ProcessPoolExecutor | None = None
+) -> list[str]:
+    """
+    Hash many passwords in parallel across processes.
+
+    Each hash also needs its own ``memory_cost`` KiB, so ``workers`` bounds
+    the memory used as well as the CPUs (prod profile: 64 MiB per worker).
+    No more processes than passwords are started.
+
+    Args:
+        passwords (Sequence[str]): The plaintext passwords.
+        workers (int | None): Number of processes, all CPUs if None. 1 hashes in-process.
+        profile (str): Name of a profile in ARGON2_PROFILES.
+        pool (ProcessPoolExecutor | None): An existing pool to reuse across calls.
+
+    Returns:
+        list[str]: The hashes, in the order of ``passwords``.
+    """
+    hash_one = partial(_hash_password, profile)
+    workers = min(workers or os.cpu_count() or 1, max(len(passwords), 1))
+    if pool is None and workers == 1:
+        return [hash_one(p) for p in passwords]
+    # A few chunks per worker: fewer round-trips, still balanced
+    chunksize = max(1, len(passwords) // (workers * 4))
+    if pool is not None:
+        return list(pool.map(hash_one, passwords, chunksize=chunksize))
+    with ProcessPoolExecutor(max_workers=workers) as new_pool:
+        return list(new_pool.map(hash_one, passwords, chunksize=chunksize))
+
+
+def validate_user_rows(users: Iterable[dict]) -> list[dict]:
+    """
+    Validate and normalize user rows as UserController.create_user() does.
+
+    Args:
+        users (Iterable[dict]): Rows with fullname, email, role and password.
+
+    Returns:
+        list[dict]: The normalized rows.
+
+    Raises:
+        CrmInvalidValue: If a row is invalid or an email appears twice, with the row number.
+    """
+    rows = []
+    seen = set()
+    for number, user in enumerate(users, start=1):
+        try:
+            row = {
+                "fullname": validate_name(user.get("fullname") or ""),
+                "email": validate_email(user.get("email") or ""),
+                "role": validate_role(user.get("role") or ""),
+                "password": validate_password(user.get("password") or ""),
+            }
+        except CrmInvalidValue as e:
+            raise CrmInvalidValue(f"Row {number}: {e}") from e
+        if row["email"] in seen:
+            raise CrmInvalidValue(f"Row {number}: duplicate email {row['email']}.")
+        seen.add(row["email"])
+        rows.append(row)
+    return rows
+
+
+def create_users(
+    session: Session,
+    users: Iterable[dict],
+    batch_size: int = 500,
+    workers: int | None = None,
+    profile: str = ARGON2_PROFILE
+) -> int:
+    """
+    Create many users, hashing their passwords in a process pool.
+
+    Every row is validated and checked against the registered emails before
+    anything is written. Passwords are then hashed one batch at a time by the
+    pool, and each batch is inserted in its own transaction.
+
+    Args:
+        session (Session): Database session.
+        users (Iterable[dict]): Rows with fullname, email, role and password.
+        batch_size (int): Number of users hashed and inserted per transaction.
+        workers (int | None): Number of hashing processes, all CPUs if None.
+        profile (str): Name of the argon2 profile to hash with.
+
+    Returns:
+        int: The number of users created.
+
+    Raises:
+        CrmInvalidValue: If a row is invalid or an email is already registered.
+    """
+    rows = validate_user_rows(users)
+    repo = UserRepository(session)
+    existing = repo.find_existing_emails({row["email"] for row in rows})
+    if existing:
+        raise CrmInvalidValue(f"Emails already registered: {', '.join(sorted(existing))}")
+    if not rows:
+        return 0
+
+    workers = workers or os.cpu_count() or 1
+    pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 and len(rows) > 1 else None
+    try:
+        for start in range(0, len(rows), batch_size):
+            batch = rows[start:start + batch_size]
+            hashes = hash_passwords([row.pop("password") for row in batch], workers, profile, pool)
+            for row, password_hash in zip(batch, hashes):
+                row["password_hash"] = password_hash
+            repo.bulk_insert(batch)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    return len(rows)
+
+
+@requires_permission("user.create")
+def provision_users(
+    session: Session,
+    users: Iterable[dict],
+    batch_size: int = 500,
+    workers: int | None = None
+) -> int:
+    """
+    Create many users at once (gestion only), see create_users().
+
+    Args:
+        session (Session): Database session.
+        users (Iterable[dict]): Rows with fullname, email, role and password.
+        batch_size (int): Number of users hashed and inserted per transaction.
+        workers (int | None): Number of hashing processes, all CPUs if None.
+
+    Returns:
+        int: The number of users created.
+
+    Raises:
+        CrmInvalidValue: If a row is invalid or an email is already registered.
+    """
+    return create_users(session, users, batch_size, workers)
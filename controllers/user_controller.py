@@ -1,12 +1,16 @@
 from typing import List, Optional, Type
 
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
+from config.actions import track_action
 from config.console import console
 from config.sentry_logging import capture_event
+from controllers.repositories.pagination import Page
 from controllers.repositories.user_repository import UserRepository
 from controllers.services.auth import generate_token
-from controllers.services.authorization import requires_role
+from controllers.services.auth_context import auth_context
+from controllers.services.authorization import requires_permission
 from controllers.services.token_cache import save_token
 from controllers.validators.validators import (
     validate_email,
@@ -43,6 +47,9 @@ class UserController:
         """
         Authenticate a user and generate an authentication token.
 
+        A password hash made with a cheaper argon2 profile than the current one
+        is upgraded on the way.
+
         Args:
             email: The email address of the user to authenticate.
             password: The password to validate.
@@ -60,11 +67,22 @@ class UserController:
         if not user.check_password(password):
             raise CrmInvalidValue("Wrong password.")
 
+        # Upgrade hashes made with an older or cheaper argon2 profile
+        if user.needs_rehash():
+            user.set_password(password)
+            try:
+                self.repo.save(user, refresh=False)
+            except SQLAlchemyError as e:
+                # Keep the old hash: the login itself succeeded
+                self.session.rollback()
+                capture_event("Password rehash failed", level="warning", user_id=user.id, reason=str(e))
+
         token = generate_token(user)
         save_token(token)
+        auth_context.clear()
         return user
 
-    @requires_role("gestion")
+    @requires_permission("user.list")
     def show_menu(self) -> None:
         """
         Display and handle the user management menu.
@@ -75,18 +93,19 @@ class UserController:
         while True:
             try:
                 choice = self.view.show_menu()
-                if choice == "List users":
-                    self.list_users()
-                elif choice == "Add user":
-                    self.add_user()
-                elif choice == "Edit user":
-                    self.edit_user()
-                elif choice == "Delete user":
-                    self.delete_user()
-                elif choice == "Back":
-                    break
-                else:
-                    self.view.show_error(f"Unknown option: {choice}")
+                with track_action(f"Collaborators: {choice}"):
+                    if choice == "List users":
+                        self.list_users()
+                    elif choice == "Add user":
+                        self.add_user()
+                    elif choice == "Edit user":
+                        self.edit_user()
+                    elif choice == "Delete user":
+                        self.delete_user()
+                    elif choice == "Back":
+                        break
+                    else:
+                        self.view.show_error(f"Unknown option: {choice}")
 
             except CrmInvalidValue as e:
                 self.view.show_error(str(e))
@@ -99,13 +118,12 @@ class UserController:
         Requires 'gestion' role permissions.
         """
         try:
-            users = self.list_all_users()
-            self.view.display_user_table(users)
+            self.view.display_user_pages(self.page_users)
         except CrmInvalidValue as e:
             capture_event("User list failed", level="error", reason=str(e))
             self.view.show_error(str(e))
 
-    @requires_role("gestion")
+    @requires_permission("user.create")
     def add_user(self) -> None:
         """
         Handle the user creation workflow.
@@ -127,7 +145,7 @@ class UserController:
             )
             self.view.show_error(str(e))
 
-    @requires_role("gestion")
+    @requires_permission("user.update")
     def edit_user(self) -> None:
         """
         Handle the user editing workflow.
@@ -156,7 +174,7 @@ class UserController:
             )
             self.view.show_error(str(e))
 
-    @requires_role("gestion")
+    @requires_permission("user.delete")
     def delete_user(self) -> None:
         """
         Handle the user deletion workflow.
@@ -220,7 +238,7 @@ class UserController:
         capture_event("User created", user_id=saved_user.id, level="info")
         return saved_user
 
-    @requires_role("gestion")
+    @requires_permission("user.list")
     def list_all_users(self) -> List[Type[User]]:
         """
         Retrieve a list of all users in the system.
@@ -230,6 +248,20 @@ class UserController:
         """
         return self.repo.list_all()
 
+    @requires_permission("user.list")
+    def page_users(self, after=None, before=None) -> Page[User]:
+        """
+        Retrieve one page of users in the system.
+
+        Args:
+            after: Cursor returned as ``next_cursor`` by the previous page.
+            before: Cursor returned as ``prev_cursor`` by the following page.
+
+        Returns:
+            Page[User]: The requested page of users.
+        """
+        return self.repo.page(after=after, before=before)
+
     def get_user_by_id(self, user_id: int) -> Optional[User]:
         """
         Retrieve a user by their ID.
@@ -242,7 +274,7 @@ class UserController:
         """
         return self.repo.get_by_id(user_id)
 
-    @requires_role("gestion")
+    @requires_permission("user.update")
     def update_user(
         self,
         user_id: int,
@@ -285,7 +317,7 @@ class UserController:
 
         return self.repo.save(user)
 
-    @requires_role("gestion")
+    @requires_permission("user.delete")
     def delete_user_logic(self, user: User) -> None:
         """
         Delete a user by their ID.
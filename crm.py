@@ -0,0 +1,148 @@
+"""
+Thin client of the CRM daemon (crm_daemon.py): runs a cli.py command there.
+
+    python crm.py clients list --mine --format json
+
+The command line is sent over the daemon's Unix socket and the output is
+streamed back, so the command runs on the daemon's warm engine and
+connections instead of importing and connecting from scratch. When no
+daemon is listening the command runs in this process, exactly like
+``python cli.py``. ``--stop-daemon`` asks the daemon to exit.
+
+This module only imports the standard library, to keep its start-up short.
+
+Protocol (JSON, one object per line): the client sends a request, e.g.
+``{"argv": ["whoami"], "cwd": "/home/me", "tty": false, "width": 80,
+"output_format": "auto", "stdin": null}`` or ``{"control": "stop"}``; the
+daemon answers with ``{"out": text}`` and ``{"err": text}`` frames as the
+command writes, then ``{"exit": status}``.
+"""
+import json
+import os
+import shutil
+import socket
+import sys
+
+SOCKET_PATH = os.getenv("CRM_SOCKET")
+
+
+def default_socket_path() -> str:
+    """
+    Return the path of the daemon socket.
+
+    Returns:
+        str: CRM_SOCKET, else crm.sock in XDG_RUNTIME_DIR, else ~/.epicevents.sock.
+    """
+    if SOCKET_PATH:
+        return SOCKET_PATH
+    runtime_dir = os.getenv("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return os.path.join(runtime_dir, "crm.sock")
+    return os.path.join(os.path.expanduser("~"), ".epicevents.sock")
+
+
+def _stdin_for(argv: list[str]) -> tuple[list[str], str | None]:
+    """
+    Read what the command would read from stdin, since the daemon has none.
+
+    Only ``login`` (the password) and ``batch`` from stdin read it, so other
+    commands never consume the caller's stdin.
+
+    Args:
+        argv (list[str]): The command line.
+
+    Returns:
+        tuple[list[str], str | None]: The command line to send and the stdin text.
+    """
+    if argv[:1] == ["login"]:
+        if "--password-stdin" in argv:
+            return argv, sys.stdin.readline()
+        import getpass
+        return argv + ["--password-stdin"], getpass.getpass("Password: ") + "\n"
+    if argv[:1] == ["batch"]:
+        sources = [arg for arg in argv[1:] if not arg.startswith("--")]
+        if not sources or sources == ["-"]:
+            return argv, sys.stdin.read()
+    return argv, None
+
+
+def connect(path: str | None = None) -> socket.socket | None:
+    """
+    Connect to the daemon.
+
+    Args:
+        path (str | None): The socket path, default_socket_path() if None.
+
+    Returns:
+        socket.socket | None: The connection, None if no daemon is listening.
+    """
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(path or default_socket_path())
+    except (FileNotFoundError, ConnectionRefusedError):
+        sock.close()
+        return None
+    return sock
+
+
+def request(sock: socket.socket, message: dict) -> int:
+    """
+    Send a request and relay the answer to stdout and stderr.
+
+    Args:
+        sock (socket.socket): A connection to the daemon.
+        message (dict): The request.
+
+    Returns:
+        int: The exit status of the command.
+    """
+    sock.sendall(json.dumps(message).encode() + b"\n")
+    with sock, sock.makefile("r", encoding="utf-8") as answers:
+        for line in answers:
+            frame = json.loads(line)
+            if "out" in frame:
+                sys.stdout.write(frame["out"])
+                sys.stdout.flush()
+            elif "err" in frame:
+                sys.stderr.write(frame["err"])
+                sys.stderr.flush()
+            elif "exit" in frame:
+                return frame["exit"]
+    print("Error: the daemon closed the connection.", file=sys.stderr)
+    return 1
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Run a cli.py command through the daemon, or in process without one.
+
+    Args:
+        argv (list[str] | None): Command-line arguments, defaults to sys.argv.
+
+    Returns:
+        int: The process exit code.
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    sock = connect()
+    if argv == ["--stop-daemon"]:
+        if sock is None:
+            print("No daemon is running.", file=sys.stderr)
+            return 1
+        return request(sock, {"control": "stop"})
+    if sock is None:
+        import cli
+        return cli.main(argv)
+
+    argv, stdin = _stdin_for(argv)
+    return request(sock, {
+        "argv": argv,
+        "cwd": os.getcwd(),
+        "tty": sys.stdout.isatty(),
+        "width": shutil.get_terminal_size().columns,
+        "output_format": os.getenv("CRM_OUTPUT", "auto"),
+        "stdin": stdin,
+    })
+
+
+if __name__ == "__main__":
+    sys.exit(main())
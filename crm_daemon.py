@@ -0,0 +1,232 @@
+"""
+CRM daemon: runs the cli.py commands sent by crm.py over a Unix socket.
+
+    python crm_daemon.py [--socket PATH] [--idle-timeout SECONDS]
+
+The daemon imports the application once and keeps its engine, pooled
+SQLite connection (with its page cache), SQLAlchemy's compiled statement
+cache and the verified token claims across commands. A command then costs
+its queries plus a socket round trip, instead of the interpreter start-up,
+the imports and a cold connection of every ``python cli.py`` run.
+
+Commands run one at a time, in the caller's working directory, with the
+caller's token (the same ~/.epicevents_jwt) and output settings. The socket
+is created readable and writable by its owner only. Restart the daemon
+after changing the code or the environment; ``python crm.py --stop-daemon``
+stops it, as do SIGTERM and the idle timeout.
+"""
+import argparse
+import io
+import json
+import os
+import signal
+import socket
+import sys
+from contextlib import redirect_stderr, redirect_stdout
+
+from sqlalchemy import text
+from sqlalchemy.orm import configure_mappers
+
+import cli
+from config.console import CustomConsole
+from crm import connect, default_socket_path
+from database.session import engine
+from exceptions import CrmError
+from views import renderers
+
+
+class FrameWriter(io.TextIOBase):
+    """
+    Text stream that forwards every write to the client as a JSON frame.
+    """
+
+    def __init__(self, sock: socket.socket, stream: str, tty: bool = False) -> None:
+        """
+        Initialize the writer.
+
+        Args:
+            sock (socket.socket): The client connection.
+            stream (str): The frame key, "out" or "err".
+            tty (bool): Whether the client's stream is a terminal.
+        """
+        self.sock = sock
+        self.stream = stream
+        self.tty = tty
+
+    def write(self, text: str) -> int:
+        if text:
+            self.sock.sendall(json.dumps({self.stream: text}).encode() + b"\n")
+        return len(text)
+
+    def isatty(self) -> bool:
+        return self.tty
+
+
+def send_exit(sock: socket.socket, status: int) -> None:
+    """
+    Send the final frame of a request.
+
+    Args:
+        sock (socket.socket): The client connection.
+        status (int): The exit status of the command.
+    """
+    sock.sendall(json.dumps({"exit": status}).encode() + b"\n")
+
+
+def run_request(sock: socket.socket, message: dict) -> None:
+    """
+    Run one command of the client and stream its output back.
+
+    Args:
+        sock (socket.socket): The client connection.
+        message (dict): The request, see crm.py.
+    """
+    out = FrameWriter(sock, "out", message.get("tty", False))
+    err = FrameWriter(sock, "err")
+    output = CustomConsole(file=out, force_terminal=out.tty, width=message.get("width") or 80)
+
+    previous = os.getcwd(), renderers.OUTPUT_FORMAT, sys.stdin
+    try:
+        os.chdir(message.get("cwd") or previous[0])
+        renderers.OUTPUT_FORMAT = message.get("output_format") or "auto"
+        sys.stdin = io.StringIO(message.get("stdin") or "")
+        with redirect_stdout(out), redirect_stderr(err):
+            try:
+                status = cli.main(message["argv"], output)
+            except SystemExit as e:
+                # argparse errors and --help
+                status = e.code if isinstance(e.code, int) else int(e.code is not None)
+            except OSError:
+                # Most likely the client went away: drop the request
+                raise
+            except Exception as e:
+                print(f"Error: {e}", file=sys.stderr)
+                status = 1
+    finally:
+        os.chdir(previous[0])
+        renderers.OUTPUT_FORMAT, sys.stdin = previous[1], previous[2]
+    send_exit(sock, status)
+
+
+def handle(sock: socket.socket) -> bool:
+    """
+    Read a request from a connection and answer it.
+
+    Args:
+        sock (socket.socket): The client connection.
+
+    Returns:
+        bool: False if the daemon was asked to stop.
+    """
+    with sock.makefile("r", encoding="utf-8") as requests:
+        message = json.loads(requests.readline())
+    if message.get("control") == "stop":
+        send_exit(sock, 0)
+        return False
+    if message.get("control") == "ping":
+        send_exit(sock, 0)
+        return True
+    run_request(sock, message)
+    return True
+
+
+def bind(path: str) -> socket.socket:
+    """
+    Listen on the daemon socket, replacing a stale socket file.
+
+    Args:
+        path (str): The socket path.
+
+    Returns:
+        socket.socket: The listening socket, accessible to its owner only.
+
+    Raises:
+        CrmError: If another daemon is listening on the path.
+    """
+    if os.path.exists(path):
+        running = connect(path)
+        if running is not None:
+            running.close()
+            raise CrmError(f"A daemon is already listening on {path}.")
+        os.unlink(path)
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    umask = os.umask(0o177)
+    try:
+        server.bind(path)
+    finally:
+        os.umask(umask)
+    server.listen(16)
+    return server
+
+
+def serve(server: socket.socket, idle_timeout: float | None = None) -> None:
+    """
+    Answer requests one at a time until asked to stop or idle for too long.
+
+    A request that fails (malformed, or the client went away) is dropped
+    without stopping the daemon.
+
+    Args:
+        server (socket.socket): The listening socket.
+        idle_timeout (float | None): Seconds without a request before exiting, None for never.
+    """
+    server.settimeout(idle_timeout)
+    while True:
+        try:
+            sock, _ = server.accept()
+        except socket.timeout:
+            return
+        sock.settimeout(None)
+        with sock:
+            try:
+                if not handle(sock):
+                    return
+            except (OSError, ValueError, KeyError):
+                continue
+
+
+def warm_up() -> None:
+    """Configure the mappers and open the pooled connection before the first request."""
+    configure_mappers()
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Run the daemon in the foreground.
+
+    Args:
+        argv (list[str] | None): Command-line arguments, defaults to sys.argv.
+
+    Returns:
+        int: The process exit code.
+    """
+    parser = argparse.ArgumentParser(description="Serve cli.py commands to crm.py over a Unix socket.")
+    parser.add_argument("--socket", default=default_socket_path(),
+                        help="Socket path (default: CRM_SOCKET, $XDG_RUNTIME_DIR/crm.sock or ~/.epicevents.sock)")
+    parser.add_argument("--idle-timeout", type=float, default=0,
+                        help="Exit after this many seconds without a request (default: never)")
+    args = parser.parse_args(argv)
+
+    warm_up()
+    try:
+        server = bind(args.socket)
+    except (CrmError, OSError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    # Leave through the finally clause, which removes the socket file
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    print(f"Listening on {args.socket}", file=sys.stderr)
+    try:
+        serve(server, args.idle_timeout or None)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+        os.unlink(args.socket)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,6 +3,8 @@ import sys
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from sqlalchemy import Engine, inspect, text
+
 from database.session import engine
 from models.base import Base
 
@@ -11,10 +13,40 @@ from models.client import Client
 from models.contract import Contract
 from models.event import Event
 
+def apply_indexes(bind: Engine = engine) -> list[str]:
+    """
+    Create the model indexes missing from an existing database.
+
+    create_all() skips tables that already exist, and their indexes with them,
+    so databases created before an index was declared never receive it.
+
+    Args:
+        bind (Engine): The engine of the database to upgrade.
+
+    Returns:
+        list[str]: The names of the indexes that were created.
+    """
+    created = []
+    with bind.begin() as conn:
+        inspector = inspect(conn)
+        for table in Base.metadata.sorted_tables:
+            existing = {index["name"] for index in inspector.get_indexes(table.name)}
+            for index in table.indexes:
+                if index.name not in existing:
+                    index.create(bind=conn)
+                    created.append(index.name)
+        if created and bind.dialect.name == "sqlite":
+            # Refresh the planner statistics so the new indexes get picked up
+            conn.execute(text("ANALYZE"))
+    return created
+
 def create_database():
     print("Creating database and tables...")
     Base.metadata.create_all(bind=engine)
+    created = apply_indexes(engine)
+    if created:
+        print(f"Created missing indexes: {', '.join(created)}")
     print("Database and tables created successfully.")
 
 if __name__ == "__main__":
-    create_database()
\ No newline at end of file
+    create_database()
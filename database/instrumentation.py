@@ -0,0 +1,353 @@
+"""
+Opt-in SQL instrumentation: per-action query statistics and N+1 detection.
+
+When enabled (``SQL_TRACE=1``, see database/session.py), engine events record
+every statement with its duration, the rows it returned or changed and the
+line of application code that triggered it. Statements are grouped by the
+user-facing action running at the time (see config/actions.py), and a
+statement that runs again and again with different parameters within one
+action is reported as an N+1 pattern, e.g. a lazy load per row of a listing.
+
+The summary of each action is written as the action ends, to stderr or to
+the file named by ``SQL_TRACE_FILE``; the statements run outside any action
+are summarized when the application exits.
+"""
+import atexit
+import os
+import sys
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Iterator, TextIO
+
+from sqlalchemy import Engine, event
+
+from config.actions import add_action_observer
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Distinct parameter sets of one statement, within one action, that make an N+1
+N_PLUS_ONE_THRESHOLD = int(os.getenv("SQL_TRACE_N_PLUS_ONE", 3))
+
+# Name of the action collecting the statements run outside any tracked action
+OUTSIDE_ACTIONS = "(outside actions)"
+
+
+@dataclass
+class QueryRecord:
+    """
+    One executed statement.
+
+    Attributes:
+        statement (str): The SQL sent to the database.
+        parameters (str): The bound parameters, as text.
+        call_site (str): The application line that triggered the statement.
+        duration_ms (float): Execution time in milliseconds, fetching excluded.
+        rows (int): Rows fetched for a SELECT, rows changed otherwise.
+    """
+
+    statement: str
+    parameters: str
+    call_site: str
+    duration_ms: float = 0.0
+    rows: int = 0
+
+
+@dataclass
+class NPlusOne:
+    """
+    A statement repeated with different parameters within one action.
+
+    Attributes:
+        statement (str): The repeated SQL.
+        count (int): Number of executions.
+        distinct_parameters (int): Number of distinct parameter sets.
+        call_site (str): Where the first execution came from.
+    """
+
+    statement: str
+    count: int
+    distinct_parameters: int
+    call_site: str
+
+
+@dataclass
+class ActionStats:
+    """
+    The statements run by one user-facing action.
+
+    Attributes:
+        name (str): The action, e.g. "Clients: List clients".
+        queries (list[QueryRecord]): The statements, in execution order.
+    """
+
+    name: str
+    queries: list[QueryRecord] = field(default_factory=list)
+
+    @property
+    def total_ms(self) -> float:
+        """float: Total execution time of the statements, in milliseconds."""
+        return sum(query.duration_ms for query in self.queries)
+
+    def n_plus_one(self, threshold: int = N_PLUS_ONE_THRESHOLD) -> list[NPlusOne]:
+        """
+        Find the statements run with at least ``threshold`` distinct parameter sets.
+
+        Args:
+            threshold (int): Minimum number of distinct parameter sets to report.
+
+        Returns:
+            list[NPlusOne]: The suspected N+1 patterns, most repeated first.
+        """
+        by_statement = defaultdict(list)
+        for query in self.queries:
+            by_statement[query.statement].append(query)
+        patterns = []
+        for statement, queries in by_statement.items():
+            distinct = len({query.parameters for query in queries})
+            if distinct >= threshold:
+                patterns.append(NPlusOne(statement, len(queries), distinct, queries[0].call_site))
+        return sorted(patterns, key=lambda pattern: pattern.count, reverse=True)
+
+
+class _CountingFetch:
+    """
+    Fetch strategy proxy of a result that counts the rows it hands out.
+
+    SQLite reports no rowcount for SELECT statements, so the rows are counted
+    as the ORM or the caller fetches them.
+    """
+
+    def __init__(self, strategy, record: QueryRecord) -> None:
+        self._strategy = strategy
+        self._record = record
+
+    def __getattr__(self, name: str):
+        return getattr(self._strategy, name)
+
+    def fetchone(self, result, dbapi_cursor, hard_close: bool = False):
+        row = self._strategy.fetchone(result, dbapi_cursor, hard_close)
+        if row is not None:
+            self._record.rows += 1
+        return row
+
+    def fetchmany(self, result, dbapi_cursor, size=None):
+        rows = self._strategy.fetchmany(result, dbapi_cursor, size)
+        self._record.rows += len(rows)
+        return rows
+
+    def fetchall(self, result, dbapi_cursor):
+        rows = self._strategy.fetchall(result, dbapi_cursor)
+        self._record.rows += len(rows)
+        return rows
+
+    def yield_per(self, result, dbapi_cursor, num: int) -> None:
+        # yield_per() swaps in a buffered strategy: keep counting through it
+        self._strategy.yield_per(result, dbapi_cursor, num)
+        result.cursor_strategy = _CountingFetch(result.cursor_strategy, self._record)
+
+
+def _call_site() -> str:
+    """
+    Return the innermost application frame of the current stack.
+
+    Returns:
+        str: "path:line in function", relative to the project, or "?" if none.
+    """
+    frame = sys._getframe(2)
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if (filename.startswith(PROJECT_ROOT) and filename != __file__
+                and "site-packages" not in filename):
+            return (f"{os.path.relpath(filename, PROJECT_ROOT)}:{frame.f_lineno} "
+                    f"in {frame.f_code.co_name}")
+        frame = frame.f_back
+    return "?"
+
+
+class SqlRecorder:
+    """
+    Records the statements of an engine, grouped by action.
+    """
+
+    def __init__(self, n_plus_one_threshold: int = N_PLUS_ONE_THRESHOLD, output: TextIO | None = None) -> None:
+        """
+        Initialize the recorder.
+
+        Args:
+            n_plus_one_threshold (int): Distinct parameter sets that make an N+1.
+            output (TextIO | None): Where each action's summary is written as it ends, nowhere if None.
+        """
+        self.n_plus_one_threshold = n_plus_one_threshold
+        self.output = output
+        self.actions: list[ActionStats] = []
+        self._stack: list[ActionStats] = []
+        self._outside = ActionStats(OUTSIDE_ACTIONS)
+
+    def install(self, engine: Engine) -> None:
+        """
+        Start recording the statements of an engine.
+
+        Args:
+            engine (Engine): The engine to instrument.
+        """
+        event.listen(engine, "before_cursor_execute", self._before_execute)
+        event.listen(engine, "after_cursor_execute", self._after_execute)
+        event.listen(engine, "after_execute", self._after_result)
+
+    def uninstall(self, engine: Engine) -> None:
+        """
+        Stop recording the statements of an engine.
+
+        Args:
+            engine (Engine): The instrumented engine.
+        """
+        event.remove(engine, "before_cursor_execute", self._before_execute)
+        event.remove(engine, "after_cursor_execute", self._after_execute)
+        event.remove(engine, "after_execute", self._after_result)
+
+    @contextmanager
+    def action(self, name: str) -> Iterator[ActionStats]:
+        """
+        Attribute the statements run inside the block to an action.
+
+        Actions nest: statements go to the innermost one.
+
+        Args:
+            name (str): The action name.
+
+        Yields:
+            ActionStats: The statistics of the action.
+        """
+        stats = ActionStats(name)
+        self._stack.append(stats)
+        try:
+            yield stats
+        finally:
+            self._stack.pop()
+            if stats.queries:
+                self.actions.append(stats)
+                self._write(self.summary(stats))
+
+    def _write(self, text: str) -> None:
+        """Write a summary to the output right away, so it survives a crash or a kill."""
+        if self.output is not None:
+            self.output.write(text + "\n\n")
+            self.output.flush()
+
+    def _before_execute(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        record = QueryRecord(statement, repr(parameters), _call_site())
+        (self._stack[-1] if self._stack else self._outside).queries.append(record)
+        conn.info.setdefault("sql_trace", []).append((record, time.perf_counter()))
+
+    def _after_execute(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        record, start = conn.info["sql_trace"].pop()
+        record.duration_ms = (time.perf_counter() - start) * 1000
+        if cursor.rowcount is not None and cursor.rowcount >= 0:
+            record.rows = cursor.rowcount
+        if context is not None:
+            context._sql_trace_record = record
+
+    def _after_result(self, conn, clauseelement, multiparams, params, execution_options, result) -> None:
+        record = getattr(result.context, "_sql_trace_record", None)
+        if record is not None and result.returns_rows:
+            result.cursor_strategy = _CountingFetch(result.cursor_strategy, record)
+
+    def summary(self, stats: ActionStats) -> str:
+        """
+        Describe the statements of one action.
+
+        Args:
+            stats (ActionStats): The action.
+
+        Returns:
+            str: The summary: totals, slowest statements and N+1 patterns.
+        """
+        lines = [
+            f"[{stats.name}] {len(stats.queries)} queries, {stats.total_ms:.1f} ms, "
+            f"{sum(query.rows for query in stats.queries)} rows"
+        ]
+        for query in sorted(stats.queries, key=lambda q: q.duration_ms, reverse=True)[:3]:
+            lines.append(f"  {query.duration_ms:8.2f} ms {query.rows:6} rows  "
+                         f"{_shorten(query.statement)}  ({query.call_site})")
+        for pattern in stats.n_plus_one(self.n_plus_one_threshold):
+            lines.append(f"  N+1: {pattern.count}x with {pattern.distinct_parameters} parameter sets "
+                         f"from {pattern.call_site}: {_shorten(pattern.statement)}")
+        return "\n".join(lines)
+
+    def report(self) -> str:
+        """
+        Describe every action recorded so far.
+
+        Returns:
+            str: One summary per action, in execution order.
+        """
+        actions = self.actions + ([self._outside] if self._outside.queries else [])
+        if not actions:
+            return "SQL trace: no statement recorded."
+        return "\n\n".join(self.summary(stats) for stats in actions)
+
+    def finish(self) -> None:
+        """
+        Write what the actions did not: the statements run outside any action,
+        or a note if nothing was recorded at all.
+        """
+        if self._outside.queries:
+            self._write(self.summary(self._outside))
+        elif not self.actions:
+            self._write("SQL trace: no statement recorded.")
+
+
+def _shorten(statement: str, width: int = 90) -> str:
+    """
+    Collapse a statement to one line of at most ``width`` characters.
+
+    Args:
+        statement (str): The SQL.
+        width (int): Maximum length.
+
+    Returns:
+        str: The shortened statement.
+    """
+    line = " ".join(statement.split())
+    return line if len(line) <= width else line[:width - 3] + "..."
+
+
+# The recorder of the application engine, None while instrumentation is off
+recorder: SqlRecorder | None = None
+
+
+def _finish_report(output: TextIO) -> None:
+    """
+    Complete the report of the application recorder at exit.
+
+    Args:
+        output (TextIO): The recorder output, closed unless it is stderr.
+    """
+    if recorder is not None:
+        recorder.finish()
+    if output is not sys.stderr:
+        output.close()
+
+
+def enable_sql_instrumentation(engine: Engine, report_path: str | None = None) -> SqlRecorder:
+    """
+    Instrument the application engine and report its statements by tracked
+    action, each summary as soon as the action ends.
+
+    Args:
+        engine (Engine): The engine to instrument.
+        report_path (str | None): File receiving the report, stderr if None.
+
+    Returns:
+        SqlRecorder: The recorder, also available as ``recorder``.
+    """
+    global recorder
+    output = open(report_path, "w") if report_path else sys.stderr
+    recorder = SqlRecorder(output=output)
+    recorder.install(engine)
+    add_action_observer(recorder.action)
+    atexit.register(_finish_report, output)
+    return recorder
+
@@ -1,12 +1,124 @@
 import os
-from sqlalchemy import create_engine
+from sqlalchemy import Engine, create_engine, event
 from sqlalchemy.orm import sessionmaker
 
+from database.instrumentation import enable_sql_instrumentation
+from exceptions import CrmInvalidValue
+
 # Use an environment variable for the DB URL, with a default value
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///database/test.db")
 
+# PRAGMAs applied to every new SQLite connection, by profile.
+# "stock" keeps SQLite defaults (rollback journal, no busy timeout).
+SQLITE_PROFILES: dict[str, dict[str, str | int]] = {
+    "stock": {},
+    "dev": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "busy_timeout": 5000,
+        "foreign_keys": "ON",
+        "temp_store": "MEMORY",
+    },
+    "prod": {
+        # WAL lets readers and one writer work on the shared file at once
+        "journal_mode": "WAL",
+        # NORMAL is durable in WAL mode except on power loss
+        "synchronous": "NORMAL",
+        "mmap_size": 256 * 1024 * 1024,
+        # Negative values are in KiB: 64 MiB page cache per connection
+        "cache_size": -64 * 1024,
+        "temp_store": "MEMORY",
+        "busy_timeout": 5000,
+        "foreign_keys": "ON",
+    },
+    "test": {
+        # Throwaway databases: trade durability for speed
+        "journal_mode": "MEMORY",
+        "synchronous": "OFF",
+        "temp_store": "MEMORY",
+        "foreign_keys": "ON",
+    },
+}
+
+# Only DB_PROFILE selects the profile: APP_ENV is free-form (production,
+# staging, ...) and an unknown name would stop every entry point at import
+DB_PROFILE = os.getenv("DB_PROFILE", "dev")
+
+
+def get_sqlite_pragmas(profile: str, overrides: str | None = None) -> dict[str, str | int]:
+    """
+    Resolve the PRAGMAs of an engine profile.
+
+    Args:
+        profile (str): Name of a profile in SQLITE_PROFILES.
+        overrides (str | None): Comma-separated ``name=value`` pairs applied on top
+            of the profile, e.g. ``"cache_size=-20000,mmap_size=0"``.
+
+    Returns:
+        dict[str, str | int]: The PRAGMA names and values to apply.
+
+    Raises:
+        CrmInvalidValue: If the profile is unknown or an override is malformed.
+    """
+    if profile not in SQLITE_PROFILES:
+        raise CrmInvalidValue(
+            f"Unknown DB profile '{profile}'. Choose one of: {', '.join(SQLITE_PROFILES)}"
+        )
+    pragmas = dict(SQLITE_PROFILES[profile])
+    for item in filter(None, (overrides or "").split(",")):
+        name, sep, value = item.partition("=")
+        if not sep or not name.strip().isidentifier():
+            raise CrmInvalidValue(f"Invalid SQLite PRAGMA override '{item}'.")
+        pragmas[name.strip()] = value.strip()
+    return pragmas
+
+
+def apply_sqlite_pragmas(engine: Engine, pragmas: dict[str, str | int]) -> None:
+    """
+    Register a connect hook that applies PRAGMAs to every new SQLite connection.
+
+    Args:
+        engine (Engine): The engine to configure. Non-SQLite engines are left untouched.
+        pragmas (dict[str, str | int]): The PRAGMA names and values to apply.
+    """
+    if engine.dialect.name != "sqlite" or not pragmas:
+        return
+
+    @event.listens_for(engine, "connect")
+    def _set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+        cursor.close()
+
+
+def build_engine(
+    url: str = DATABASE_URL,
+    profile: str = DB_PROFILE,
+    overrides: str | None = None
+) -> Engine:
+    """
+    Create an engine configured with the given profile.
+
+    Args:
+        url (str): The database URL.
+        profile (str): Name of a profile in SQLITE_PROFILES.
+        overrides (str | None): PRAGMA overrides, see get_sqlite_pragmas().
+
+    Returns:
+        Engine: The configured engine.
+    """
+    engine = create_engine(url, echo=False)
+    apply_sqlite_pragmas(engine, get_sqlite_pragmas(profile, overrides))
+    return engine
+
+
 # Create the database engine
-engine = create_engine(DATABASE_URL, echo=False)
+engine = build_engine(overrides=os.getenv("SQLITE_PRAGMAS"))
+
+# Opt-in per-action statement recording and N+1 detection (report printed at exit)
+if os.getenv("SQL_TRACE") == "1":
+    enable_sql_instrumentation(engine, os.getenv("SQL_TRACE_FILE"))
 
 # Create a "factory" of sessions configured
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
\ No newline at end of file
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
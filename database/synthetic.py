@@ -0,0 +1,342 @@
+"""
+Deterministic synthetic data for load and performance testing.
+
+The same seed always produces the same rows. Distributions follow what a real
+CRM looks like rather than a uniform spread:
+
+* commercial portfolios are Zipf-skewed: a few commercials own most clients;
+* contract amounts are log-normal, about a quarter are unsigned and a part
+  of the signed ones are fully paid;
+* events cluster on a limited calendar (weekends, evenings) so many of them
+  overlap, and a share of them has no support contact yet.
+
+Rows are written with Core bulk inserts, one transaction per batch, with the
+secondary indexes dropped during the load and rebuilt at the end.
+"""
+import random
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from decimal import Decimal
+from itertools import accumulate
+from typing import Callable, Sequence
+
+from sqlalchemy import Connection, Engine, func, insert, select
+
+from controllers.services.user_provisioning import hash_passwords
+from database.create_db import apply_indexes
+from exceptions import CrmInvalidValue
+from models.base import Base
+from models.client import Client
+from models.contract import Contract
+from models.event import Event
+from models.user import User
+from models.user_role import UserRole
+
+FIRST_NAMES = (
+    "Alice", "Bruno", "Chloé", "David", "Emma", "Farid", "Gabriel", "Hugo", "Inès", "Jules",
+    "Karim", "Léa", "Manon", "Nathan", "Olivia", "Paul", "Quentin", "Rose", "Sarah", "Théo",
+)
+LAST_NAMES = (
+    "Martin", "Bernard", "Dubois", "Thomas", "Robert", "Richard", "Petit", "Durand", "Leroy",
+    "Moreau", "Simon", "Laurent", "Lefebvre", "Michel", "Garcia", "David", "Bertrand", "Roux",
+)
+COMPANY_WORDS = (
+    "Atlas", "Nova", "Blue", "Green", "Pixel", "Summit", "Vertex", "Orbit", "Lumen", "Cedar",
+)
+COMPANY_SUFFIXES = ("SA", "SAS", "SARL", "LLC", "Group", "Studio", "Labs")
+EVENT_KINDS = ("Wedding", "Birthday", "Seminar", "Gala", "Conference", "Product launch", "Party")
+LOCATIONS = (
+    "12 rue de la Paix, Paris", "3 quai Saint-Antoine, Lyon", "8 cours Mirabeau, Aix",
+    "45 promenade des Anglais, Nice", "1 place du Capitole, Toulouse", "20 rue Sainte-Catherine, Bordeaux",
+)
+
+# Share of generated users in each role; every role gets at least one user
+ROLE_SHARES = ((UserRole.COMMERCIAL, 0.5), (UserRole.SUPPORT, 0.3), (UserRole.GESTION, 0.2))
+
+
+@dataclass(frozen=True)
+class DatasetSpec:
+    """
+    Size and shape of a synthetic dataset.
+
+    Attributes:
+        users (int): Number of users to create.
+        clients (int): Number of clients to create.
+        contracts_per_client (float): Mean number of contracts per client.
+        events_per_contract (float): Mean number of events per signed contract.
+        unassigned_ratio (float): Share of events without a support contact.
+        skew (float): Zipf exponent of the commercial and support workloads, 0 for uniform.
+        seed (int): Seed of the random generator.
+        start (datetime): Reference date the generated dates are spread around.
+        password (str): Password shared by every generated user.
+    """
+
+    users: int = 0
+    clients: int = 0
+    contracts_per_client: float = 2
+    events_per_contract: float = 1
+    unassigned_ratio: float = 0.2
+    skew: float = 1.1
+    seed: int = 42
+    start: datetime = datetime(2025, 1, 1)
+    password: str = "Azertyuiop123"
+
+
+def _draw_count(rng: random.Random, mean: float) -> int:
+    """
+    Draw a non-negative count averaging ``mean`` (uniform between 0 and 2 * mean).
+
+    Args:
+        rng (random.Random): The random generator.
+        mean (float): The expected value.
+
+    Returns:
+        int: The count.
+    """
+    return int(rng.uniform(0, 2 * mean + 1)) if mean > 0 else 0
+
+
+def skewed_picker(rng: random.Random, ids: Sequence[int], skew: float) -> Callable[[], int]:
+    """
+    Build a picker returning ids with Zipf-distributed frequencies.
+
+    The ids are shuffled first so the busiest one is not always the lowest id.
+
+    Args:
+        rng (random.Random): The random generator.
+        ids (Sequence[int]): The ids to pick from.
+        skew (float): Zipf exponent; 0 picks uniformly.
+
+    Returns:
+        Callable[[], int]: A function returning one id per call.
+
+    Raises:
+        CrmInvalidValue: If ``ids`` is empty.
+    """
+    if not ids:
+        raise CrmInvalidValue("Cannot pick from an empty set of users.")
+    ids = list(ids)
+    rng.shuffle(ids)
+    cum_weights = list(accumulate(1 / rank ** skew for rank in range(1, len(ids) + 1)))
+    return lambda: rng.choices(ids, cum_weights=cum_weights)[0]
+
+
+def _next_id(conn: Connection, model) -> int:
+    """
+    Return the first free primary key of a table, so generated rows can carry explicit ids.
+
+    Args:
+        conn (Connection): Database connection.
+        model: The mapped class.
+
+    Returns:
+        int: One more than the largest id in the table.
+    """
+    return (conn.execute(select(func.max(model.id))).scalar() or 0) + 1
+
+
+def _drop_secondary_indexes(bind: Engine) -> None:
+    """
+    Drop the non-unique indexes so the bulk load does not maintain them row by row.
+
+    apply_indexes() recreates them once the data is in.
+
+    Args:
+        bind (Engine): The engine of the database being loaded.
+    """
+    with bind.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                if not index.unique:
+                    index.drop(bind=conn, checkfirst=True)
+
+
+def _user_rows(spec: DatasetSpec, rng: random.Random, first_id: int) -> list[dict]:
+    """
+    Generate the user rows, split between roles by ROLE_SHARES.
+
+    Args:
+        spec (DatasetSpec): The dataset to generate.
+        rng (random.Random): The random generator.
+        first_id (int): Id of the first user.
+
+    Returns:
+        list[dict]: The user rows.
+    """
+    if not spec.users:
+        return []
+    counts = [max(1, int(spec.users * share)) for _, share in ROLE_SHARES]
+    counts[0] += spec.users - sum(counts)
+    # Hashed once: argon2 is slow on purpose and every user shares the password
+    password_hash = hash_passwords([spec.password], workers=1)[0]
+    rows = []
+    for (role, _), count in zip(ROLE_SHARES, counts):
+        for _ in range(count):
+            user_id = first_id + len(rows)
+            rows.append({
+                "id": user_id,
+                "fullname": f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+                "email": f"{role.value}{user_id}@example.com",
+                "role": role,
+                "password_hash": password_hash,
+            })
+    return rows
+
+
+def _role_ids(conn: Connection, role: UserRole) -> list[int]:
+    """
+    Return the ids of every user of a role, in id order.
+
+    Args:
+        conn (Connection): Database connection.
+        role (UserRole): The role.
+
+    Returns:
+        list[int]: The user ids.
+    """
+    return list(conn.execute(select(User.id).where(User.role == role).order_by(User.id)).scalars())
+
+
+def _insert_clients(
+    conn: Connection,
+    spec: DatasetSpec,
+    rng: random.Random,
+    counts: dict[str, int],
+    batch_size: int
+) -> None:
+    """
+    Generate and insert the clients with their contracts and events.
+
+    Rows are buffered client by client; whenever a buffer is full all three
+    are flushed, parents first, so foreign keys always point at rows already
+    written.
+
+    Args:
+        conn (Connection): Database connection.
+        spec (DatasetSpec): The dataset to generate.
+        rng (random.Random): The random generator.
+        counts (dict[str, int]): Row counts by table name, updated in place.
+        batch_size (int): Number of rows inserted per statement and transaction.
+
+    Raises:
+        CrmInvalidValue: If the database has no commercial or support user.
+    """
+    pick_commercial = skewed_picker(rng, _role_ids(conn, UserRole.COMMERCIAL), spec.skew)
+    pick_support = skewed_picker(rng, _role_ids(conn, UserRole.SUPPORT), spec.skew)
+    client_id, contract_id, event_id = (_next_id(conn, m) for m in (Client, Contract, Event))
+    buffers = {Client: [], Contract: [], Event: []}
+    monday = spec.start - timedelta(days=spec.start.weekday())
+
+    def flush() -> None:
+        for model, rows in buffers.items():
+            if rows:
+                conn.execute(insert(model), rows)
+                counts[model.__tablename__] += len(rows)
+                rows.clear()
+        conn.commit()
+
+    for _ in range(spec.clients):
+        commercial_id = pick_commercial()
+        created_at = spec.start - timedelta(days=rng.randint(0, 730), seconds=rng.randint(0, 86399))
+        buffers[Client].append({
+            "id": client_id,
+            "fullname": f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+            "email": f"client{client_id}@example.com",
+            "phone": f"+33{client_id:09d}",
+            "company": f"{rng.choice(COMPANY_WORDS)} {rng.choice(COMPANY_WORDS)} "
+                       f"{rng.choice(COMPANY_SUFFIXES)}",
+            "commercial_id": commercial_id,
+            "created_at": created_at,
+            "updated_at": created_at + timedelta(days=rng.randint(0, 90)),
+        })
+
+        for _ in range(_draw_count(rng, spec.contracts_per_client)):
+            total = Decimal(f"{min(rng.lognormvariate(8, 1), 9_999_999):.2f}")
+            is_signed = rng.random() < 0.75
+            if not is_signed:
+                remaining = total
+            elif rng.random() < 0.4:
+                remaining = Decimal("0.00")
+            else:
+                remaining = (total * Decimal(rng.randint(1, 99)) / 100).quantize(Decimal("0.01"))
+            creation_date = created_at + timedelta(days=rng.randint(0, 365))
+            buffers[Contract].append({
+                "id": contract_id,
+                "total_amount": total,
+                "remaining_amount": remaining,
+                "creation_date": creation_date,
+                "end_date": creation_date + timedelta(days=rng.randint(30, 365)),
+                "is_signed": is_signed,
+                "client_id": client_id,
+                "commercial_id": commercial_id,
+            })
+
+            events = _draw_count(rng, spec.events_per_contract) if is_signed else 0
+            for _ in range(events):
+                # Friday to Sunday of the year around the reference date: events overlap
+                day = monday + timedelta(weeks=rng.randint(-26, 26), days=rng.choice((4, 5, 5, 6)))
+                start_date = day + timedelta(hours=rng.randint(10, 20), minutes=rng.choice((0, 15, 30, 45)))
+                unassigned = rng.random() < spec.unassigned_ratio
+                buffers[Event].append({
+                    "id": event_id,
+                    "name": f"{rng.choice(EVENT_KINDS)} {event_id}",
+                    "start_date": start_date,
+                    "end_date": start_date + timedelta(hours=rng.randint(2, 30)),
+                    "location": rng.choice(LOCATIONS),
+                    "attendees": max(1, int(rng.lognormvariate(4, 0.8))),
+                    "notes": None if rng.random() < 0.5 else "Generated event.",
+                    "contract_id": contract_id,
+                    "support_contact_id": None if unassigned else pick_support(),
+                })
+                event_id += 1
+            contract_id += 1
+        client_id += 1
+
+        if max(len(rows) for rows in buffers.values()) >= batch_size:
+            flush()
+    flush()
+
+
+def populate(bind: Engine, spec: DatasetSpec, batch_size: int = 10_000) -> dict[str, int]:
+    """
+    Append a synthetic dataset to an existing schema.
+
+    Clients are spread over every commercial of the database and events over
+    every support user, including the users that were there before. The
+    secondary indexes are dropped for the load and rebuilt afterwards, even
+    if it fails.
+
+    Args:
+        bind (Engine): The engine of the database to load.
+        spec (DatasetSpec): The dataset to generate.
+        batch_size (int): Number of rows inserted per statement and transaction.
+
+    Returns:
+        dict[str, int]: The number of rows inserted, by table name.
+
+    Raises:
+        CrmInvalidValue: If the spec is invalid or the database has no commercial
+            or support user to own the generated rows.
+    """
+    if not 0 <= spec.unassigned_ratio <= 1:
+        raise CrmInvalidValue("The unassigned ratio must be between 0 and 1.")
+    if min(spec.users, spec.clients, spec.contracts_per_client, spec.events_per_contract) < 0:
+        raise CrmInvalidValue("Dataset sizes cannot be negative.")
+    if 0 < spec.users < len(ROLE_SHARES):
+        raise CrmInvalidValue(f"Generate at least {len(ROLE_SHARES)} users, one per role.")
+    rng = random.Random(spec.seed)
+    counts = {"user_account": 0, "client": 0, "contract": 0, "event": 0}
+
+    _drop_secondary_indexes(bind)
+    try:
+        with bind.connect() as conn:
+            users = _user_rows(spec, rng, _next_id(conn, User))
+            if users:
+                conn.execute(insert(User), users)
+                conn.commit()
+                counts["user_account"] = len(users)
+            if spec.clients:
+                _insert_clients(conn, spec, rng, counts, batch_size)
+    finally:
+        apply_indexes(bind)
+    return counts
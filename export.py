@@ -0,0 +1,46 @@
+import argparse
+import sys
+
+from controllers.services.export import EXPORT_FORMATS, EXPORT_REPOSITORIES, export_entity
+from database.session import SessionLocal
+from exceptions import CrmError
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Export clients, contracts or events to CSV or JSON Lines.
+
+    Requires a logged-in gestion user (cached token).
+
+    Args:
+        argv (list[str] | None): Command-line arguments, defaults to sys.argv.
+
+    Returns:
+        int: The process exit code.
+    """
+    parser = argparse.ArgumentParser(description="Stream CRM data to CSV or JSON Lines.")
+    parser.add_argument("entity", choices=list(EXPORT_REPOSITORIES))
+    parser.add_argument("--format", dest="fmt", choices=EXPORT_FORMATS, default="csv")
+    parser.add_argument("--output", "-o", default="-",
+                        help="Destination file, '-' for stdout (default)")
+    parser.add_argument("--gzip", action="store_true",
+                        help="Compress the output (implied by a .gz output name)")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    args = parser.parse_args(argv)
+
+    compress = args.gzip or args.output.endswith(".gz")
+    session = SessionLocal()
+    try:
+        count = export_entity(session, args.entity, args.fmt, args.output,
+                              compress=compress, batch_size=args.batch_size)
+    except CrmError as e:
+        print(f"Export failed: {e}", file=sys.stderr)
+        return 1
+    finally:
+        session.close()
+    print(f"Exported {count} {args.entity}.", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
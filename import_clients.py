@@ -0,0 +1,49 @@
+import argparse
+import sys
+
+from controllers.services.client_import import import_clients
+from database.session import SessionLocal
+from exceptions import CrmError
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Import clients from a CSV file and assign them to a commercial.
+
+    Requires a logged-in gestion user (cached token).
+
+    Args:
+        argv (list[str] | None): Command-line arguments, defaults to sys.argv.
+
+    Returns:
+        int: The process exit code.
+    """
+    parser = argparse.ArgumentParser(
+        description="Import clients from a CSV with columns fullname, email, phone, company."
+    )
+    parser.add_argument("source", help="CSV file to import")
+    parser.add_argument("--commercial", type=int, required=True,
+                        help="ID of the commercial user the clients are assigned to")
+    parser.add_argument("--rejects", default="rejects.csv",
+                        help="Where rejected rows are written (default: rejects.csv)")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    args = parser.parse_args(argv)
+
+    session = SessionLocal()
+    try:
+        with open(args.source, newline="", encoding="utf-8") as source, \
+                open(args.rejects, "w", newline="", encoding="utf-8") as rejects:
+            report = import_clients(session, source, rejects, args.commercial,
+                                    batch_size=args.batch_size)
+    except (CrmError, OSError) as e:
+        print(f"Import failed: {e}", file=sys.stderr)
+        return 1
+    finally:
+        session.close()
+    print(f"Imported {report.imported} clients, rejected {report.rejected} "
+          f"(see {args.rejects}).", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
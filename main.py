@@ -1,35 +1,75 @@
+import argparse
+import os
 import sys
 
 import sentry_sdk
 from sqlalchemy.orm import Session
 
+from config.actions import track_action
 from config.console import console
+from config.profiling import enable_profiling
 from config.sentry_logging import init_sentry
 from controllers.auth_controller import AuthController
 from controllers.menu_controller import MenuController
-from database.session import SessionLocal
+from database.session import SessionLocal, engine
 from exceptions import CrmAuthenticationError
 from views.base import display_error, display_info, display_success
 
+# Reuse a still-valid token from the last login instead of prompting (0 to disable)
+RESUME_SESSION = os.getenv("RESUME_SESSION", "1") != "0"
 
-def main() -> None:
+# Run on the terminal's alternate screen, keeping the shell scrollback intact (1 to enable)
+ALT_SCREEN = os.getenv("CRM_ALT_SCREEN", "0") == "1"
+
+# Per-action profiling: "1" for timings, "detail" to add cProfile and tracemalloc
+CRM_PROFILE = os.getenv("CRM_PROFILE", "")
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """
+    Parse the command line options.
+
+    Args:
+        argv (list[str] | None): The arguments, sys.argv[1:] if None.
+
+    Returns:
+        argparse.Namespace: The options.
+    """
+    parser = argparse.ArgumentParser(description="Epic Events CRM")
+    parser.add_argument("--profile", action="store_true", default=CRM_PROFILE in ("1", "detail"),
+                        help="Time every menu action and write a report when the session ends")
+    parser.add_argument("--profile-detail", action="store_true", default=CRM_PROFILE == "detail",
+                        help="Also run cProfile and tracemalloc for every action (slower)")
+    parser.add_argument("--profile-file", default=os.getenv("CRM_PROFILE_FILE"),
+                        help="Report file (default: crm_profile_<timestamp>.txt)")
+    return parser.parse_args(argv)
+
+
+def main(args: argparse.Namespace | None = None) -> None:
     """
     Main entry point for the Epic Events CRM CLI application.
 
+    Args:
+        args (argparse.Namespace | None): The command line options, see parse_args().
+
     Raises:
         CrmAuthenticationError: If there's an authentication-related error.
         Exception: For any other unexpected errors during execution.
     """
+    args = args or parse_args([])
     init_sentry()
+    if args.profile or args.profile_detail:
+        enable_profiling(engine, console, args.profile_file, detail=args.profile_detail)
     session: Session = SessionLocal()
 
     display_success("Welcome to Epic Events CRM CLI")
 
     while True:
         try:
-            # Authenticate user
+            # Authenticate user, resuming the cached session when possible
             auth_ctrl = AuthController(session)
-            user = auth_ctrl.authenticate()
+            with track_action("Login"):
+                user = auth_ctrl.authenticate(resume=RESUME_SESSION)
             # Set user context for Sentry
             sentry_sdk.set_user({
                 "email": user.email,
@@ -52,7 +92,8 @@ def main() -> None:
 
 if __name__ == "__main__":
     try:
-        main()
+        with console.alternate_screen(ALT_SCREEN):
+            main(parse_args())
     except KeyboardInterrupt:
         console.clear()
         display_info("Application interrupted by user. Goodbye!")
@@ -35,7 +35,7 @@ class Client(Base):
     fullname: Mapped[str] = mapped_column(String(70), nullable=False)
     email: Mapped[str] = mapped_column(
         String(100), nullable=False, unique=True)
-    phone: Mapped[str] = mapped_column(String(20), nullable=True)
+    phone: Mapped[str] = mapped_column(String(20), nullable=True, index=True)
     company: Mapped[str] = mapped_column(String(120), nullable=True)
 
     created_at: Mapped[datetime] = mapped_column(
@@ -47,7 +47,8 @@ class Client(Base):
 
     commercial_id: Mapped[int] = mapped_column(
         ForeignKey("user_account.id"),
-        nullable=True
+        nullable=True,
+        index=True
     )
 
     # Relationships
@@ -2,7 +2,7 @@ from datetime import datetime
 from decimal import Decimal
 from typing import List
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Numeric
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, Numeric, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import Base
@@ -31,6 +31,26 @@ class Contract(Base):
     """
 
     __tablename__ = "contract"
+    __table_args__ = (
+        # "Unsigned contracts" listing, scoped by commercial; its leading
+        # column also serves the commercial_id foreign key lookups
+        Index("ix_contract_commercial_signed", "commercial_id", "is_signed"),
+        # "Unsigned contracts" listing across all commercials; the repository
+        # filters with "is_signed = 0" so the planner can match the predicate
+        Index(
+            "ix_contract_unsigned",
+            "id",
+            sqlite_where=text("is_signed = 0"),
+            postgresql_where=text("is_signed = false"),
+        ),
+        # "Unpaid contracts" listing: partial index on the few open balances
+        Index(
+            "ix_contract_commercial_unpaid",
+            "commercial_id",
+            sqlite_where=text("remaining_amount > 0"),
+            postgresql_where=text("remaining_amount > 0"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     total_amount: Mapped[Decimal] = mapped_column(
@@ -56,7 +76,8 @@ class Contract(Base):
     # Foreign keys
     client_id: Mapped[int] = mapped_column(
         ForeignKey("client.id"),
-        nullable=False
+        nullable=False,
+        index=True
     )
     commercial_id: Mapped[int] = mapped_column(
         ForeignKey("user_account.id"),
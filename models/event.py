@@ -33,7 +33,7 @@ class Event(Base):
 
     id: Mapped[int] = mapped_column(primary_key=True)
     name: Mapped[str] = mapped_column(String(100), nullable=False)
-    start_date: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    start_date: Mapped[datetime] = mapped_column(DateTime, nullable=False, index=True)
     end_date: Mapped[datetime] = mapped_column(DateTime, nullable=False)
     location: Mapped[str] = mapped_column(String(255), nullable=False)
     attendees: Mapped[int] = mapped_column(nullable=False)
@@ -42,10 +42,13 @@ class Event(Base):
     # Foreign keys
     contract_id: Mapped[int] = mapped_column(
         ForeignKey("contract.id"),
-        nullable=False
+        nullable=False,
+        index=True
     )
+    # The index also serves the "unassigned events" listing (IS NULL)
     support_contact_id: Mapped[Optional[int]] = mapped_column(
-        ForeignKey("user_account.id")
+        ForeignKey("user_account.id"),
+        index=True
     )
 
     # Relationships
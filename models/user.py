@@ -1,14 +1,50 @@
+import os
 from typing import List
 
-from argon2 import PasswordHasher
-from argon2.exceptions import VerifyMismatchError
+from argon2 import PasswordHasher, extract_parameters
+from argon2.exceptions import InvalidHashError, VerifyMismatchError
 from sqlalchemy import Enum, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
+from exceptions import CrmInvalidValue
 from .base import Base
 from .user_role import UserRole
 
-pass_hasher = PasswordHasher()
+# argon2id cost parameters, by profile. memory_cost is in KiB.
+ARGON2_PROFILES: dict[str, dict[str, int]] = {
+    # argon2-cffi defaults (RFC 9106 low-memory recommendation)
+    "prod": {"time_cost": 3, "memory_cost": 64 * 1024, "parallelism": 4},
+    # OWASP minimum for argon2id: still safe, ~3x cheaper than prod
+    "dev": {"time_cost": 2, "memory_cost": 19 * 1024, "parallelism": 1},
+    # Cheapest valid parameters, for test suites and throwaway seeds only
+    "test": {"time_cost": 1, "memory_cost": 8, "parallelism": 1},
+}
+
+# Only ARGON2_PROFILE selects the profile, so a deployment setting such as
+# APP_ENV can neither weaken the hashes nor name an unknown profile
+ARGON2_PROFILE = os.getenv("ARGON2_PROFILE", "prod")
+
+
+def get_password_hasher(profile: str) -> PasswordHasher:
+    """Create the password hasher of a cost profile.
+
+    Args:
+        profile (str): Name of a profile in ARGON2_PROFILES.
+
+    Returns:
+        PasswordHasher: A hasher using the profile's cost parameters.
+
+    Raises:
+        CrmInvalidValue: If the profile is unknown.
+    """
+    if profile not in ARGON2_PROFILES:
+        raise CrmInvalidValue(
+            f"Unknown argon2 profile '{profile}'. Choose one of: {', '.join(ARGON2_PROFILES)}"
+        )
+    return PasswordHasher(**ARGON2_PROFILES[profile])
+
+
+pass_hasher = get_password_hasher(ARGON2_PROFILE)
 
 
 class User(Base):
@@ -87,3 +123,23 @@ class User(Base):
             return pass_hasher.verify(self.password_hash, password)
         except VerifyMismatchError:
             return False
+
+    def needs_rehash(self) -> bool:
+        """Tell whether the stored hash should be upgraded to the current profile.
+
+        Hashes made with costlier parameters than the current profile are kept,
+        so running with a cheap profile never weakens existing passwords.
+
+        Returns:
+            bool: True if the hash is cheaper than the current profile.
+        """
+        if not pass_hasher.check_needs_rehash(self.password_hash):
+            return False
+        try:
+            stored = extract_parameters(self.password_hash)
+        except InvalidHashError:
+            return True
+        return (
+            stored.time_cost <= pass_hasher.time_cost
+            and stored.memory_cost <= pass_hasher.memory_cost
+        )
@@ -5,8 +5,12 @@ from models.contract import Contract
 from models.client import Client
 from models.base import Base
 from database.session import SessionLocal, engine
+from controllers.services.user_provisioning import hash_passwords
+from database.synthetic import DatasetSpec, populate
+import argparse
 import os
 import sys
+import time
 from datetime import datetime
 from decimal import Decimal
 
@@ -31,45 +35,44 @@ def seed_data() -> None:
         email="lisa@test.com",
         role=UserRole.COMMERCIAL,
     )
-    commercial_1.set_password("Azertyuiop123")
 
     commercial_2 = User(
         fullname="Marge Simpson",
         email="marge@test.com",
         role=UserRole.COMMERCIAL,
     )
-    commercial_2.set_password("Azertyuiop123")
 
     gestion_1 = User(
         fullname="Homer Simpson",
         email="homer@test.com",
         role=UserRole.GESTION,
     )
-    gestion_1.set_password("Azertyuiop123")
 
     gestion_2 = User(
         fullname="Abram Simpson",
         email="abram@test.com",
         role=UserRole.GESTION,
     )
-    gestion_2.set_password("Azertyuiop123")
 
     support_1 = User(
         fullname="Bart Simpson",
         email="bart@test.com",
         role=UserRole.SUPPORT,
     )
-    support_1.set_password("Azertyuiop123")
 
     support_2 = User(
         fullname="Maggie Simpson",
         email="maggie@test.com",
         role=UserRole.SUPPORT,
     )
-    support_2.set_password("Azertyuiop123")
 
-    session.add_all([commercial_1, commercial_2, gestion_1,
-                    gestion_2, support_1, support_2])
+    users = [commercial_1, commercial_2, gestion_1,
+             gestion_2, support_1, support_2]
+    # One hash (and salt) per user, computed in parallel
+    hashes = hash_passwords(["Azertyuiop123"] * len(users))
+    for user, password_hash in zip(users, hashes):
+        user.password_hash = password_hash
+    session.add_all(users)
     session.flush()  # Get user IDs
 
     # Create client
@@ -155,5 +158,41 @@ def seed_data() -> None:
     session.close()
 
 
-if __name__ == "__main__":
+def main() -> None:
+    """Seed the sample data, then append the synthetic dataset asked for on the command line."""
+    parser = argparse.ArgumentParser(
+        description="Recreate the database with the sample data, plus optional synthetic data."
+    )
+    parser.add_argument("--users", type=int, default=0, help="Synthetic users (split 50/30/20 commercial/support/gestion)")
+    parser.add_argument("--clients", type=int, default=0, help="Synthetic clients")
+    parser.add_argument("--contracts-per-client", type=float, default=2, help="Mean contracts per client")
+    parser.add_argument("--events-per-contract", type=float, default=1, help="Mean events per signed contract")
+    parser.add_argument("--unassigned-ratio", type=float, default=0.2, help="Share of events without support")
+    parser.add_argument("--skew", type=float, default=1.1, help="Zipf exponent of the portfolios, 0 for uniform")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed; same seed, same data")
+    parser.add_argument("--batch-size", type=int, default=10_000, help="Rows per insert and transaction")
+    args = parser.parse_args()
+
     seed_data()
+    if not (args.users or args.clients):
+        return
+    spec = DatasetSpec(
+        users=args.users,
+        clients=args.clients,
+        contracts_per_client=args.contracts_per_client,
+        events_per_contract=args.events_per_contract,
+        unassigned_ratio=args.unassigned_ratio,
+        skew=args.skew,
+        seed=args.seed,
+    )
+    print("Generate the synthetic data...")
+    start = time.perf_counter()
+    counts = populate(engine, spec, batch_size=args.batch_size)
+    elapsed = time.perf_counter() - start
+    rows = sum(counts.values())
+    print(", ".join(f"{count} {table}" for table, count in counts.items())
+          + f" inserted in {elapsed:.1f}s ({rows / elapsed:,.0f} rows/s).")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,11 +2,14 @@ import re
 import os
 
 import pytest
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import Session
 import pexpect
 from unittest.mock import MagicMock
 
+# Hash test passwords with the cheapest argon2 parameters (read when models.user is imported)
+os.environ.setdefault("ARGON2_PROFILE", "test")
+
 from models.base import Base
 from models.event import Event
 from models.client import Client
@@ -21,6 +24,15 @@ def _disable_sentry():
     os.environ["DISABLE_SENTRY"] = "1"
 
 
+# Start every test without cached auth claims
+@pytest.fixture(autouse=True)
+def _clear_auth_context():
+    from controllers.services.auth_context import auth_context
+    auth_context.clear()
+    yield
+    auth_context.clear()
+
+
 @pytest.fixture
 def session():
     engine = create_engine("sqlite:///:memory:")
@@ -29,6 +41,25 @@ def session():
         yield session
 
 
+@pytest.fixture
+def count_queries(session):
+    """
+    Count the SQL statements executed on the test engine.
+
+    Returns:
+        list: A list that receives every executed statement; use len() on it.
+    """
+    statements = []
+    engine = session.get_bind()
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _record)
+    yield statements
+    event.remove(engine, "before_cursor_execute", _record)
+
+
 @pytest.fixture
 def user_data():
     return {
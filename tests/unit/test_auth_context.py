@@ -0,0 +1,75 @@
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from controllers.services.auth import get_current_user
+from controllers.services.auth_context import auth_context
+from controllers.services.authorization import get_token_payload_or_raise
+
+
+@pytest.fixture
+def token_file(tmp_path, monkeypatch):
+    path = tmp_path / "token.jwt"
+    path.write_text("first.token")
+    monkeypatch.setattr("controllers.services.token_cache.TOKEN_PATH", path)
+    return path
+
+
+def _claims(user_id=1, role="gestion", ttl=3600):
+    return {"id": user_id, "role": role, "exp": int(time.time()) + ttl}
+
+
+def test_claims_are_decoded_once(token_file, monkeypatch):
+    decode = MagicMock(return_value=_claims())
+    monkeypatch.setattr("controllers.services.authorization.decode_token", decode)
+
+    for _ in range(5):
+        assert get_token_payload_or_raise()["role"] == "gestion"
+
+    decode.assert_called_once_with("first.token")
+
+
+def test_token_file_change_invalidates_claims(token_file, monkeypatch):
+    decode = MagicMock(side_effect=[_claims(role="gestion"), _claims(role="support")])
+    monkeypatch.setattr("controllers.services.authorization.decode_token", decode)
+
+    assert get_token_payload_or_raise()["role"] == "gestion"
+    token_file.write_text("second.token.longer")
+    assert get_token_payload_or_raise()["role"] == "support"
+
+
+def test_expired_claims_are_not_reused(token_file, monkeypatch):
+    decode = MagicMock(return_value=_claims(ttl=-1))
+    monkeypatch.setattr("controllers.services.authorization.decode_token", decode)
+
+    get_token_payload_or_raise()
+    get_token_payload_or_raise()
+
+    assert decode.call_count == 2
+
+
+def test_current_user_is_cached_per_session(session, seeded_user, token_file, monkeypatch):
+    monkeypatch.setattr("controllers.services.auth.decode_token",
+                        lambda token: _claims(user_id=seeded_user.id))
+    get_by_id = MagicMock(return_value=seeded_user)
+    monkeypatch.setattr("controllers.repositories.user_repository.UserRepository.get_by_id",
+                        lambda self, uid: get_by_id(uid))
+
+    assert get_current_user(session) is seeded_user
+    assert get_current_user(session) is seeded_user
+    assert get_by_id.call_count == 1
+
+    other_session = MagicMock()
+    get_current_user(other_session)
+    assert get_by_id.call_count == 2
+
+
+def test_clear_forgets_claims(token_file, monkeypatch):
+    monkeypatch.setattr("controllers.services.authorization.decode_token",
+                        lambda token: _claims())
+    get_token_payload_or_raise()
+    assert auth_context.get_claims() is not None
+
+    auth_context.clear()
+    assert auth_context.get_claims() is None
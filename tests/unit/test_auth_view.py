@@ -1,7 +1,12 @@
 from unittest.mock import patch, MagicMock
 
+import pytest
+
 from controllers.auth_controller import AuthController
+from controllers.services.auth import generate_token
+from controllers.services.token_cache import save_token
 from exceptions import CrmInvalidValue
+from models.user_role import UserRole
 
 
 def test_auth_controller_login_success(session, seeded_user):
@@ -41,3 +46,62 @@ def test_auth_controller_login_invalid_credentials(session):
 
         assert user is None
         mock_error.assert_called_once_with("Invalid credentials")
+
+
+@pytest.fixture
+def token_file(tmp_path, monkeypatch):
+    path = tmp_path / "token.jwt"
+    monkeypatch.setattr("controllers.services.token_cache.TOKEN_PATH", path)
+    return path
+
+
+def test_authenticate_resumes_valid_token(session, seeded_user, token_file):
+    save_token(generate_token(seeded_user))
+
+    with patch("controllers.auth_controller.show_session_resumed") as mock_resumed, \
+            patch.object(AuthController, "login_flow") as mock_login:
+        user = AuthController(session).authenticate()
+
+    assert user.id == seeded_user.id
+    mock_resumed.assert_called_once_with(user)
+    # No prompt, hence no password verification
+    mock_login.assert_not_called()
+
+
+def test_authenticate_prompts_without_token(session, seeded_user, token_file):
+    with patch.object(AuthController, "login_flow", return_value=seeded_user) as mock_login:
+        assert AuthController(session).authenticate() is seeded_user
+    mock_login.assert_called_once()
+
+
+def test_authenticate_resume_disabled(session, seeded_user, token_file):
+    save_token(generate_token(seeded_user))
+
+    with patch.object(AuthController, "login_flow", return_value=seeded_user) as mock_login:
+        AuthController(session).authenticate(resume=False)
+    mock_login.assert_called_once()
+
+
+def test_resume_session_discards_token_with_stale_role(session, seeded_user, token_file):
+    save_token(generate_token(seeded_user))
+    seeded_user.role = UserRole.SUPPORT
+    session.commit()
+
+    assert AuthController(session).resume_session() is None
+    assert not token_file.exists()
+
+
+def test_resume_session_discards_token_of_deleted_user(session, seeded_user, token_file):
+    save_token(generate_token(seeded_user))
+    session.delete(seeded_user)
+    session.commit()
+
+    assert AuthController(session).resume_session() is None
+    assert not token_file.exists()
+
+
+def test_resume_session_invalid_token(session, token_file):
+    save_token("not.a.token")
+
+    assert AuthController(session).resume_session() is None
+    assert not token_file.exists()
@@ -1,126 +1,213 @@
 from unittest.mock import MagicMock
 import pytest
 
-from controllers.services.authorization import requires_role, requires_self_or_role, get_event_owner_id
-from exceptions import CrmAuthenticationError, CrmNotFoundError
+from controllers.services.authorization import (
+    requires_permission_for_all,
+    requires_permission,
+    get_event_owner_id,
+    authorize_many,
+    BatchAuthorization,
+    BATCH_RESOURCES,
+)
+from exceptions import CrmAuthenticationError, CrmInvalidValue, CrmNotFoundError
 from exceptions import CrmForbiddenAccessError
 
 
-@requires_role("gestion")
-def wrapped_func():
-    return "Access granted"
+def test_get_event_owner_id_ok(monkeypatch):
+    session = MagicMock()
+    event = MagicMock(spec=["id", "contract_id"])
+    event.id = 1
+    event.contract_id = 2
 
+    # Event and owning commercial come back from a single joined query
+    monkeypatch.setattr(
+        "controllers.repositories.event_repository.EventRepository.get_with_owner_id",
+        lambda self, eid: (event, 42) if eid == 1 else None
+    )
 
-def test_requires_role_ok(monkeypatch):
-    monkeypatch.setattr("controllers.services.authorization.load_token", lambda: "valid_token")
-    monkeypatch.setattr("controllers.services.authorization.decode_token", lambda token: {"role": "gestion"})
+    # Execution
+    owner_id = get_event_owner_id(session, 1)
+    assert owner_id == 42
 
-    assert wrapped_func() == "Access granted"
 
+def test_get_event_owner_id_event_not_found(monkeypatch):
+    session = MagicMock()
 
-def test_requires_role_invalid(monkeypatch):
-    monkeypatch.setattr("controllers.services.authorization.load_token", lambda: "valid_token")
-    monkeypatch.setattr("controllers.services.authorization.decode_token", lambda token: {"role": "support"})
+    # No event found
+    monkeypatch.setattr(
+        "controllers.repositories.event_repository.EventRepository.get_with_owner_id",
+        lambda self, eid: None
+    )
 
-    with pytest.raises(CrmForbiddenAccessError, match="Forbidden"):
-        wrapped_func()
+    with pytest.raises(CrmNotFoundError, match="Event not found."):
+        get_event_owner_id(session, 1)
 
 
-def test_requires_role_missing_token(monkeypatch):
-    monkeypatch.setattr("controllers.services.authorization.load_token", lambda: None)
+def test_get_event_owner_id_contract_not_found(monkeypatch):
+    session = MagicMock()
+    event = MagicMock(spec=["id", "contract_id"])
+    event.id = 1
+    event.contract_id = 2
 
-    with pytest.raises(CrmAuthenticationError, match="Authentication required"):
-        wrapped_func()
+    # Event found, but the outer join found no contract
+    monkeypatch.setattr(
+        "controllers.repositories.event_repository.EventRepository.get_with_owner_id",
+        lambda self, eid: (event, None)
+    )
+
+    with pytest.raises(CrmNotFoundError, match="Associated contract not found."):
+        get_event_owner_id(session, 1)
 
-@requires_self_or_role("gestion")
-def wrapped_func2(user_id: int):
-    return f"Access granted to user {user_id}"
 
 
-def test_requires_self_or_role_by_role(monkeypatch):
+def _owner_repository(owners):
+    repo = MagicMock()
+    repo.return_value.get_owner_ids.side_effect = lambda ids: {i: o for i, o in owners.items() if i in ids}
+    return repo
+
+
+def test_authorize_many_for_owner(monkeypatch):
     monkeypatch.setattr("controllers.services.authorization.load_token", lambda: "valid_token")
-    monkeypatch.setattr("controllers.services.authorization.decode_token", lambda token: {"role": "gestion", "id": 999})
+    monkeypatch.setattr("controllers.services.authorization.decode_token", lambda token: {"role": "commercial", "id": 7})
+    repo = _owner_repository({1: 7, 2: 8, 3: None})
+    monkeypatch.setitem(BATCH_RESOURCES, "client", (repo, "Client"))
+
+    result = authorize_many(MagicMock(), "client", [1, 2, 3, 4], "client.update")
 
-    assert wrapped_func2(user_id=123) == "Access granted to user 123"
+    # 3 exists but has no owner
+    assert result == BatchAuthorization(allowed={1}, denied={2, 3}, not_found={4})
+    assert [result.status(i) for i in (1, 2, 3, 4)] == ["allowed", "denied", "denied", "not_found"]
+    # The whole set is resolved with a single repository call
+    repo.return_value.get_owner_ids.assert_called_once_with({1, 2, 3, 4})
 
 
-def test_requires_self_or_role_by_identity(monkeypatch):
+def test_authorize_many_for_role(monkeypatch):
     monkeypatch.setattr("controllers.services.authorization.load_token", lambda: "valid_token")
-    monkeypatch.setattr("controllers.services.authorization.decode_token", lambda token: {"role": "support", "id": 123})
+    monkeypatch.setattr("controllers.services.authorization.decode_token", lambda token: {"role": "gestion", "id": 1})
+    monkeypatch.setitem(BATCH_RESOURCES, "contract", (_owner_repository({1: 7, 2: None}), "Contract"))
 
-    assert wrapped_func2(user_id=123) == "Access granted to user 123"
+    result = authorize_many(MagicMock(), "contract", {1, 2, 3}, "contract.update")
+    assert result == BatchAuthorization(allowed={1, 2}, not_found={3})
 
+    with pytest.raises(CrmNotFoundError, match="Contract not found: 3."):
+        result.raise_for_errors("Contract")
 
-def test_requires_self_or_role_forbidden(monkeypatch):
+
+def test_authorize_many_without_access(monkeypatch):
     monkeypatch.setattr("controllers.services.authorization.load_token", lambda: "valid_token")
-    monkeypatch.setattr("controllers.services.authorization.decode_token", lambda token: {"role": "support", "id": 42})
+    monkeypatch.setattr("controllers.services.authorization.decode_token", lambda token: {"role": "support", "id": 1})
+    monkeypatch.setitem(BATCH_RESOURCES, "event", (_owner_repository({1: 7}), "Event"))
 
-    with pytest.raises(CrmForbiddenAccessError, match="Forbidden"):
-        wrapped_func2(user_id=123)
+    with pytest.raises(CrmForbiddenAccessError):
+        authorize_many(MagicMock(), "event", [1], "event.assign_support")
 
 
-def test_requires_self_or_role_no_token(monkeypatch):
-    monkeypatch.setattr("controllers.services.authorization.load_token", lambda: None)
+def test_authorize_many_unknown_resource():
+    with pytest.raises(CrmInvalidValue):
+        authorize_many(MagicMock(), "user", [1], "user.update")
+    with pytest.raises(CrmInvalidValue):
+        authorize_many(MagicMock(), "client", [1], "client.reassign")
 
-    with pytest.raises(CrmAuthenticationError, match="Authentication required"):
-        wrapped_func2(user_id=123)
 
+def test_requires_permission_for_all(monkeypatch):
+    monkeypatch.setattr("controllers.services.authorization.load_token", lambda: "valid_token")
+    monkeypatch.setattr("controllers.services.authorization.decode_token", lambda token: {"role": "commercial", "id": 7})
+    monkeypatch.setitem(BATCH_RESOURCES, "client", (_owner_repository({1: 7, 2: 8}), "Client"))
+
+    @requires_permission_for_all("client.update", "client")
+    def reassign(session, client_ids):
+        return sorted(client_ids)
+
+    @requires_permission_for_all("client.update", "client", pass_as="authorization")
+    def reassign_allowed(session, client_ids, authorization=None):
+        return sorted(authorization.allowed)
 
-def test_get_event_owner_id_ok(monkeypatch):
     session = MagicMock()
-    # Create fake Event and Contract objects with MagicMock
-    event = MagicMock(spec=["id", "contract_id"])
-    event.id = 1
-    event.contract_id = 2
+    assert reassign(session, [1]) == [1]
+    with pytest.raises(CrmForbiddenAccessError):
+        reassign(session, [1, 2])
+    assert reassign_allowed(session, client_ids=[1, 2]) == [1]
 
-    contract = MagicMock(spec=["id", "commercial_id"])
-    contract.id = 2
-    contract.commercial_id = 42
 
-    # Monkey-patch des repositories
-    monkeypatch.setattr(
-        "controllers.repositories.event_repository.EventRepository.get_by_id",
-        lambda self, eid: event if eid == 1 else None
-    )
-    monkeypatch.setattr(
-        "controllers.repositories.contract_repository.ContractRepository.get_by_id",
-        lambda self, cid: contract if cid == 2 else None
-    )
+@requires_permission("user.list")
+def list_users():
+    return "Access granted"
 
-    # Execution
-    owner_id = get_event_owner_id(session, 1)
-    assert owner_id == 42
 
+def test_requires_permission(monkeypatch):
+    monkeypatch.setattr("controllers.services.authorization.load_token", lambda: "valid_token")
+    monkeypatch.setattr("controllers.services.authorization.decode_token", lambda token: {"role": "gestion", "id": 1})
+    assert list_users() == "Access granted"
+
+    monkeypatch.setattr("controllers.services.authorization.decode_token", lambda token: {"role": "support", "id": 1})
+    with pytest.raises(CrmForbiddenAccessError):
+        list_users()
+
+
+def test_requires_permission_with_owner(monkeypatch):
+    monkeypatch.setattr("controllers.services.authorization.load_token", lambda: "valid_token")
+    loader = MagicMock(return_value=7)
+
+    @requires_permission("client.update", loader)
+    def update(session, client_id):
+        return client_id
 
-def test_get_event_owner_id_event_not_found(monkeypatch):
     session = MagicMock()
+    # Full access: the owner is not even looked up
+    monkeypatch.setattr("controllers.services.authorization.decode_token", lambda token: {"role": "gestion", "id": 1})
+    assert update(session, 5) == 5
+    loader.assert_not_called()
+
+    # Owner access: only on own records
+    monkeypatch.setattr("controllers.services.authorization.decode_token", lambda token: {"role": "commercial", "id": 7})
+    assert update(session, 5) == 5
+    monkeypatch.setattr("controllers.services.authorization.decode_token", lambda token: {"role": "commercial", "id": 8})
+    with pytest.raises(CrmForbiddenAccessError):
+        update(session, 5)
+
+    # No access: rejected before any lookup
+    loader.reset_mock()
+    monkeypatch.setattr("controllers.services.authorization.decode_token", lambda token: {"role": "support", "id": 7})
+    with pytest.raises(CrmForbiddenAccessError):
+        update(session, 5)
+    loader.assert_not_called()
+
+
+def test_requires_permission_missing_token(monkeypatch):
+    monkeypatch.setattr("controllers.services.authorization.load_token", lambda: None)
 
-    # No event found
-    monkeypatch.setattr(
-        "controllers.repositories.event_repository.EventRepository.get_by_id",
-        lambda self, eid: None
-    )
+    with pytest.raises(CrmAuthenticationError, match="Authentication required"):
+        list_users()
 
-    with pytest.raises(CrmNotFoundError, match="Event not found."):
-        get_event_owner_id(session, 1)
 
+def test_requires_permission_passes_entity(monkeypatch):
+    monkeypatch.setattr("controllers.services.authorization.load_token", lambda: "valid_token")
+    monkeypatch.setattr("controllers.services.authorization.decode_token", lambda token: {"role": "commercial", "id": 7})
+    client = MagicMock()
+    loader = MagicMock(return_value=(client, 7))
+
+    @requires_permission("client.update", loader, pass_as="client")
+    def update(session, client_id, client=None):
+        return client
 
-def test_get_event_owner_id_contract_not_found(monkeypatch):
     session = MagicMock()
-    # Event found
-    event = MagicMock(spec=["id", "contract_id"])
-    event.id = 1
-    event.contract_id = 2
+    # The id is found even when passed positionally, and loaded only once
+    assert update(session, 5) is client
+    loader.assert_called_once_with(session=session, client_id=5)
 
-    monkeypatch.setattr(
-        "controllers.repositories.event_repository.EventRepository.get_by_id",
-        lambda self, eid: event
-    )
-    # Contract not found
-    monkeypatch.setattr(
-        "controllers.repositories.contract_repository.ContractRepository.get_by_id",
-        lambda self, cid: None
-    )
 
-    with pytest.raises(CrmNotFoundError, match="Associated contract not found."):
-        get_event_owner_id(session, 1)
\ No newline at end of file
+def test_requires_permission_pass_as_forbidden(monkeypatch):
+    monkeypatch.setattr("controllers.services.authorization.load_token", lambda: "valid_token")
+    monkeypatch.setattr("controllers.services.authorization.decode_token", lambda token: {"role": "commercial", "id": 7})
+
+    @requires_permission("client.update", lambda session, client_id: (MagicMock(), 8), pass_as="client")
+    def update(session, client_id, client=None):
+        return client
+
+    with pytest.raises(CrmForbiddenAccessError):
+        update(MagicMock(), client_id=5)
+
+
+def test_requires_permission_unknown_action():
+    with pytest.raises(CrmInvalidValue):
+        requires_permission("client.udpate")
@@ -29,3 +29,44 @@ def test_display_menu_invalid_then_valid(monkeypatch):
         choice = base_view.display_menu("Title", ["one", "two", "three"])
         assert choice == 2
         assert mock_err.call_count == 2
+
+# browse_pages navigation
+def test_browse_pages_next_previous_then_back(monkeypatch):
+    from controllers.repositories.pagination import Page
+    from views import base as base_view
+
+    pages = {
+        None: Page([1, 2], next_cursor=2),
+        ("after", 2): Page([3, 4], next_cursor=4, prev_cursor=3),
+        ("before", 3): Page([1, 2], next_cursor=2),
+    }
+
+    def fetch_page(after=None, before=None):
+        if after is not None:
+            return pages[("after", after)]
+        if before is not None:
+            return pages[("before", before)]
+        return pages[None]
+
+    mock_console = MagicMock()
+    mock_console.input.side_effect = ["n", "p", "q"]
+    monkeypatch.setattr(base_view, "console", mock_console)
+    rendered = []
+
+    base_view.browse_pages(fetch_page, rendered.append)
+
+    assert rendered == [[1, 2], [3, 4], [1, 2]]
+
+
+def test_browse_pages_single_page_does_not_prompt(monkeypatch):
+    from controllers.repositories.pagination import Page
+    from views import base as base_view
+
+    mock_console = MagicMock()
+    monkeypatch.setattr(base_view, "console", mock_console)
+    rendered = []
+
+    base_view.browse_pages(lambda: Page(["only"]), rendered.append)
+
+    assert rendered == [["only"]]
+    mock_console.input.assert_not_called()
@@ -0,0 +1,30 @@
+import pytest
+
+from benchmarks.suite import compare, percentile
+
+BASELINE = {"100/client_repo.list_all": {"p50": 2.0, "queries": 1}}
+
+
+def test_percentile_interpolates():
+    samples = [4.0, 1.0, 3.0, 2.0, 5.0]
+
+    assert percentile(samples, 50) == 3.0
+    assert percentile(samples, 100) == 5.0
+    assert percentile(samples, 95) == pytest.approx(4.8)
+    assert percentile([7.0], 99) == 7.0
+
+
+def test_compare_flags_slowdowns_and_extra_queries():
+    assert compare({"100/client_repo.list_all": {"p50": 2.4, "queries": 1}}, BASELINE, 0.25) == []
+
+    slower = compare({"100/client_repo.list_all": {"p50": 3.0, "queries": 1}}, BASELINE, 0.25)
+    assert slower == ["100/client_repo.list_all: p50 2.00 -> 3.00 ms"]
+    more_queries = compare({"100/client_repo.list_all": {"p50": 2.0, "queries": 21}}, BASELINE, 0.25)
+    assert more_queries == ["100/client_repo.list_all: queries 1 -> 21"]
+
+
+def test_compare_ignores_noise_and_new_cases():
+    tiny = {"100/user_repo.list_all": {"p50": 0.02, "queries": 1}}
+
+    assert compare({"100/user_repo.list_all": {"p50": 0.05, "queries": 1}}, tiny, 0.25) == []
+    assert compare({"1000/client_repo.list_all": {"p50": 9.0, "queries": 1}}, BASELINE, 0.25) == []
@@ -0,0 +1,201 @@
+import io
+import json
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy.exc import SQLAlchemyError
+
+import cli
+import controllers.services.token_cache as token_cache
+from config.console import CustomConsole
+from controllers.repositories.event_repository import EventRepository
+from controllers.services.auth import generate_token
+from models.client import Client
+from models.contract import Contract
+from models.event import Event
+from models.user import User
+from models.user_role import UserRole
+
+
+@pytest.fixture(autouse=True)
+def token_path(tmp_path, monkeypatch):
+    monkeypatch.setattr(token_cache, "TOKEN_PATH", tmp_path / "token")
+
+
+@pytest.fixture
+def ctx(session):
+    out = io.StringIO()
+    context = cli.Context(session, CustomConsole(file=out), CustomConsole(file=io.StringIO()))
+    context.out = out
+    return context
+
+
+def login(user):
+    token_cache.save_token(generate_token(user))
+
+
+def run(ctx, *argv):
+    ctx.out.truncate(0)
+    ctx.out.seek(0)
+    return cli.run_command(ctx, cli.build_parser().parse_args(list(argv)))
+
+
+def add_user(session, name, role):
+    user = User(fullname=name, email=f"{name.split()[0].lower()}@test.com", role=role)
+    user.set_password("Azertyuiop123")
+    session.add(user)
+    session.commit()
+    return user
+
+
+@pytest.fixture
+def data(session):
+    lisa = add_user(session, "Lisa Simpson", UserRole.COMMERCIAL)
+    marge = add_user(session, "Marge Simpson", UserRole.COMMERCIAL)
+    homer = add_user(session, "Homer Simpson", UserRole.GESTION)
+    bart = add_user(session, "Bart Simpson", UserRole.SUPPORT)
+    for i, owner in enumerate([lisa, lisa, lisa, marge]):
+        session.add(Client(fullname=f"Client {'abcd'[i]}", email=f"client{i}@test.com",
+                           phone=f"+3310000000{i}", company="Duff", commercial_id=owner.id))
+    session.commit()
+    contract = Contract(client_id=1, commercial_id=lisa.id, total_amount=100, remaining_amount=50,
+                        is_signed=True, creation_date=datetime(2025, 1, 1), end_date=datetime(2026, 1, 1))
+    session.add(contract)
+    session.commit()
+    session.add(Event(contract_id=contract.id, name="Party", start_date=datetime(2025, 6, 1, 10),
+                      end_date=datetime(2025, 6, 1, 12), location="Springfield", attendees=10))
+    session.commit()
+    return {"lisa": lisa, "homer": homer, "bart": bart}
+
+
+def test_commands_require_a_cached_token(ctx, data):
+    assert run(ctx, "clients", "list") == 3
+    assert ctx.out.getvalue() == ""
+
+
+def test_list_mine_streams_every_page_as_json(ctx, data):
+    login(data["lisa"])
+
+    assert run(ctx, "clients", "list", "--mine", "--format", "json", "--batch-size", "2") == 0
+
+    rows = json.loads(ctx.out.getvalue())
+    assert [row["Name"] for row in rows] == ["Client a", "Client b", "Client c"]
+
+
+def test_assigned_event_leaves_the_unassigned_listing(ctx, data):
+    login(data["homer"])
+
+    assert run(ctx, "events", "list", "--unassigned", "--format", "json") == 0
+    assert json.loads(ctx.out.getvalue()) == [{
+        "ID": "1", "Contract": "1", "Client": "Client a", "Name": "Party",
+        "Start": "2025-06-01 10:00:00", "End": "2025-06-01 12:00:00", "Location": "Springfield",
+        "Attendees": "10", "Support": "None", "Notes": "",
+    }]
+
+    assert run(ctx, "events", "assign", "1", "--support", str(data["bart"].id), "--format", "tsv") == 0
+    assert run(ctx, "events", "list", "--unassigned", "--format", "json") == 0
+    assert json.loads(ctx.out.getvalue()) == []
+
+
+def test_assign_many_events_at_once(ctx, session, data):
+    login(data["homer"])
+    session.add(Event(contract_id=1, name="Wedding", start_date=datetime(2025, 7, 1, 10),
+                      end_date=datetime(2025, 7, 1, 12), location="Shelbyville", attendees=50))
+    session.commit()
+    support = str(data["bart"].id)
+
+    # One missing event: nothing is assigned
+    assert run(ctx, "events", "assign", "1", "2", "42", "--support", support) == 5
+    assert run(ctx, "events", "list", "--unassigned", "--format", "json") == 0
+    assert len(json.loads(ctx.out.getvalue())) == 2
+
+    assert run(ctx, "events", "assign", "1", "2", "--support", support, "--format", "json") == 0
+    assert [row["Support"] for row in json.loads(ctx.out.getvalue())] == ["Bart Simpson"] * 2
+
+
+def test_assigning_many_events_commits_once(ctx, session, data, monkeypatch):
+    login(data["homer"])
+    session.add(Event(contract_id=1, name="Wedding", start_date=datetime(2025, 7, 1, 10),
+                      end_date=datetime(2025, 7, 1, 12), location="Shelbyville", attendees=50))
+    session.commit()
+    support = str(data["bart"].id)
+    save = EventRepository.save
+
+    def save_once(self, event, refresh=True):
+        if event.id == 2:
+            raise SQLAlchemyError("disk I/O error")
+        return save(self, event, refresh)
+
+    # A failing save undoes the events saved before it
+    monkeypatch.setattr(EventRepository, "save", save_once)
+    assert run(ctx, "events", "assign", "1", "2", "--support", support) == 1
+    assert run(ctx, "events", "list", "--unassigned", "--format", "json") == 0
+    assert len(json.loads(ctx.out.getvalue())) == 2
+
+    monkeypatch.setattr(EventRepository, "save", save)
+    with patch.object(session, "commit", wraps=session.commit) as commit:
+        assert run(ctx, "events", "assign", "1", "2", "--support", support) == 0
+    assert commit.call_count == 1
+
+
+def test_import_users(ctx, data, tmp_path):
+    source = tmp_path / "users.csv"
+    source.write_text("fullname,email,role,password\n"
+                      "Ned Flanders,ned@test.com,commercial,Okilydokily1\n"
+                      "Moe Szyslak,moe@test.com,support,Tavern12345\n")
+    login(data["bart"])
+    assert run(ctx, "users", "import", str(source)) == 4
+
+    login(data["homer"])
+    assert run(ctx, "users", "import", str(source), "--workers", "1") == 0
+    assert run(ctx, "users", "list", "--format", "json") == 0
+    assert {"ned@test.com", "moe@test.com"} <= {row["Email"] for row in json.loads(ctx.out.getvalue())}
+    # Already registered: nothing is written
+    assert run(ctx, "users", "import", str(source)) == 1
+    assert run(ctx, "users", "import", str(tmp_path / "missing.csv")) == 1
+
+
+def test_permissions_are_checked(ctx, data):
+    login(data["bart"])
+
+    assert run(ctx, "contracts", "list", "--unpaid") == 4
+    assert run(ctx, "events", "assign", "1", "--support", str(data["bart"].id)) == 4
+
+
+def test_update_keeps_the_fields_not_given(ctx, session, data):
+    login(data["lisa"])
+
+    assert run(ctx, "clients", "update", "1", "--company", "Kwik-E-Mart", "--format", "tsv") == 0
+
+    assert ctx.out.getvalue().splitlines()[1].split("\t")[1:5] == [
+        "Client a", "client0@test.com", "+33100000000", "Kwik-E-Mart"]
+    assert run(ctx, "clients", "update", "4", "--company", "Kwik-E-Mart") == 4
+    assert run(ctx, "clients", "update", "99", "--company", "Kwik-E-Mart") == 5
+
+
+def test_update_a_client_without_phone_or_company(ctx, session, data):
+    login(data["lisa"])
+    session.add(Client(fullname="Client e", email="client9@test.com", commercial_id=data["lisa"].id))
+    session.commit()
+
+    assert run(ctx, "clients", "update", "5", "--fullname", "Client f", "--format", "tsv") == 0
+    assert ctx.out.getvalue().splitlines()[1].split("\t")[1:5] == ["Client f", "client9@test.com", "-", "-"]
+    assert run(ctx, "clients", "update", "5", "--phone", "12") == 1
+
+
+def test_batch_runs_every_line_in_one_session(ctx, data, capsys):
+    login(data["homer"])
+    commands = io.StringIO(
+        "# assign then list\n"
+        f"events assign 1 --support {data['bart'].id} --format tsv\n"
+        "events assign 42 --support 1\n"
+        "\n"
+        "users list --format tsv\n"
+    )
+
+    status = cli.run_batch(ctx, cli.build_parser(), commands, keep_going=True)
+
+    assert status == 5
+    assert "Line 3 failed" in capsys.readouterr().err
+    assert ctx.out.getvalue().count("Bart Simpson") == 2
@@ -86,10 +86,11 @@ def test_list_by_commercial_success(session, mock_auth, seeded_user_commercial):
     controller = ClientController(
         session, seeded_user_commercial, make_console())
     fake_list = [MagicMock()]
-    with patch('controllers.client_controller.ClientRepository.list_by_commercial', return_value=fake_list) as mock_list:
+    with patch('controllers.client_controller.ClientRepository.list_all', return_value=fake_list) as mock_list:
         result = controller.list_by_commercial()
         assert result == fake_list
-        mock_list.assert_called_once_with(seeded_user_commercial.id)
+        mock_list.assert_called_once_with()
+    assert controller.own_repo.policy.user_id == seeded_user_commercial.id
 
 
 def test_get_client_by_id_success(session, mock_auth, seeded_user_commercial):
@@ -136,7 +137,6 @@ def test_update_client_success(session, mock_auth, seeded_user):
 
     with patch('controllers.services.authorization.get_token_payload_or_raise', return_value={'role': 'gestion', 'id': seeded_user.id}), \
             patch('controllers.services.auth.get_current_user', return_value=seeded_user), \
-            patch('controllers.client_controller.get_client_owner_id', return_value=seeded_user.id), \
             patch('controllers.client_controller.ClientRepository.get_by_id', return_value=existing), \
             patch('controllers.client_controller.ClientRepository.save', return_value=updated) as mock_save:
         result = controller._update_client(
@@ -159,7 +159,6 @@ def test_update_client_not_found(session, mock_auth, seeded_user):
     controller = ClientController(session, seeded_user, make_console())
     with patch('controllers.services.authorization.get_token_payload_or_raise', return_value={'role': 'gestion', 'id': seeded_user.id}), \
             patch('controllers.services.auth.get_current_user', return_value=seeded_user), \
-            patch('controllers.client_controller.get_client_owner_id', return_value=seeded_user.id), \
             patch('controllers.client_controller.ClientRepository.get_by_id', return_value=None):
         with pytest.raises(CrmNotFoundError, match="Client not found.") as exc:
             controller._update_client(123, "N", "n@e.com", "+1", "C")
@@ -0,0 +1,69 @@
+import csv
+import io
+from unittest.mock import patch
+
+import pytest
+
+from controllers.repositories.client_repository import ClientRepository
+from controllers.services.client_import import import_clients
+from exceptions import CrmInvalidValue
+from models.client import Client
+
+
+@pytest.fixture
+def mock_auth_gestion(seeded_user):
+    with patch('controllers.services.authorization.get_token_payload_or_raise',
+               return_value={'role': 'gestion', 'id': seeded_user.id}):
+        yield
+
+
+def _csv(rows):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(["fullname", "email", "phone", "company"])
+    writer.writerows(rows)
+    buffer.seek(0)
+    return buffer
+
+
+def test_import_clients_batches_and_rejects(session, seeded_user_commercial, mock_auth_gestion):
+    session.add(Client(fullname="Existing", email="taken@email.com", phone="+33100000000",
+                       commercial_id=seeded_user_commercial.id))
+    session.commit()
+    source = _csv([
+        ["Alice Martin", "alice@email.com", "+33 6 00 00 00 01", "Acme"],
+        ["Bob Martin", "not-an-email", "+33600000002", "Acme"],
+        ["Carol Martin", "TAKEN@email.com", "+33600000003", "Acme"],
+        ["Dave Martin", "dave@email.com", "+33100000000", "Acme"],
+        ["Erin Martin", "alice@email.com", "+33600000005", "Acme"],
+        ["Frank Martin", "frank@email.com", "+33600000006", "Acme"],
+        ["Grace Martin", "grace@email.com", "+33600000007", "Acme"],
+    ])
+    rejects = io.StringIO()
+
+    report = import_clients(session, source, rejects, seeded_user_commercial.id, batch_size=2)
+
+    assert (report.imported, report.rejected) == (3, 4)
+    rejected = list(csv.DictReader(io.StringIO(rejects.getvalue())))
+    assert sorted((r["line"], r["error"]) for r in rejected) == [
+        ("3", "Invalid email format."),
+        ("4", "Email already exists."),
+        ("5", "Phone already exists."),
+        ("6", "Email already exists."),
+    ]
+    imported = ClientRepository(session).list_by_commercial(seeded_user_commercial.id)
+    assert {c.email for c in imported} >= {"alice@email.com", "frank@email.com", "grace@email.com"}
+    alice = ClientRepository(session).get_by_email("alice@email.com")
+    assert alice.phone == "+33600000001"
+    assert alice.created_at is not None
+
+
+def test_import_clients_requires_commercial(session, seeded_user, mock_auth_gestion):
+    with pytest.raises(CrmInvalidValue, match="commercial role"):
+        import_clients(session, _csv([]), io.StringIO(), seeded_user.id)
+
+
+def test_import_clients_missing_columns(session, seeded_user_commercial, mock_auth_gestion):
+    source = io.StringIO("fullname,email\nAlice,alice@email.com\n")
+    with pytest.raises(CrmInvalidValue, match="Missing CSV columns: company, phone"):
+        import_clients(session, source, io.StringIO(), seeded_user_commercial.id)
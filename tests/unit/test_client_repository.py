@@ -1,4 +1,5 @@
 from controllers.repositories.client_repository import ClientRepository
+from controllers.repositories.pagination import iter_pages
 from models.client import Client
 
 
@@ -96,3 +97,83 @@ def test_get_client_by_phone_not_found(session, seeded_user_commercial):
     repo = ClientRepository(session)
     result = repo.get_by_phone("1234567890")
     assert result is None
+
+
+def test_page_walks_forward_and_backward(session, seeded_user_commercial):
+    repo = ClientRepository(session)
+    for i in range(7):
+        repo.save(Client(
+            fullname=f"Client {i}",
+            email=f"client{i}@email.com",
+            commercial_id=seeded_user_commercial.id
+        ))
+
+    first = repo.page(limit=3)
+    assert [c.fullname for c in first.items] == ["Client 0", "Client 1", "Client 2"]
+    assert first.prev_cursor is None
+
+    second = repo.page(after=first.next_cursor, limit=3)
+    third = repo.page(after=second.next_cursor, limit=3)
+    assert [c.fullname for c in third.items] == ["Client 6"]
+    assert third.next_cursor is None
+
+    back = repo.page(before=third.prev_cursor, limit=3)
+    assert [c.id for c in back.items] == [c.id for c in second.items]
+    assert back.next_cursor == second.next_cursor
+
+
+def test_iter_pages_reads_every_row_page_by_page(session, seeded_user_commercial, count_queries):
+    repo = ClientRepository(session)
+    for i in range(7):
+        repo.save(Client(
+            fullname=f"Client {i}",
+            email=f"client{i}@email.com",
+            commercial_id=seeded_user_commercial.id
+        ))
+
+    commercial_id = seeded_user_commercial.id
+    count_queries.clear()
+    names = [c.fullname for c in iter_pages(repo.page, commercial_id=commercial_id, limit=3)]
+
+    assert names == [f"Client {i}" for i in range(7)]
+    assert len(count_queries) == 3
+
+
+def test_page_with_sort_key_and_filter(session, seeded_user_commercial):
+    repo = ClientRepository(session)
+    for i, name in enumerate(["Charlie", "Alice", "Bob", "Alice"]):
+        repo.save(Client(
+            fullname=name,
+            email=f"{name.lower()}{i}@email.com",
+            commercial_id=seeded_user_commercial.id
+        ))
+
+    first = repo.page(commercial_id=seeded_user_commercial.id, limit=2, sort_key=Client.fullname)
+    second = repo.page(commercial_id=seeded_user_commercial.id, after=first.next_cursor,
+                       limit=2, sort_key=Client.fullname)
+    names = [c.fullname for c in first.items + second.items]
+    assert names == ["Alice", "Alice", "Bob", "Charlie"]
+    assert repo.page(commercial_id=seeded_user_commercial.id + 1).items == []
+
+
+def test_get_owner_ids(session, seeded_user_commercial, count_queries):
+    repo = ClientRepository(session)
+    clients = [
+        repo.save(Client(
+            fullname=f"Client {i}",
+            email=f"owner{i}@email.com",
+            commercial_id=seeded_user_commercial.id if i else None
+        ))
+        for i in range(3)
+    ]
+    ids = {c.id for c in clients}
+
+    count_queries.clear()
+    owners = repo.get_owner_ids(ids | {9999})
+    assert len(count_queries) == 1
+    assert owners == {
+        clients[0].id: None,
+        clients[1].id: seeded_user_commercial.id,
+        clients[2].id: seeded_user_commercial.id,
+    }
+    assert repo.get_owner_ids(set()) == {}
@@ -59,6 +59,47 @@ def test_display_client_table(monkeypatch):
     assert table.row_count == 2
 
 
+def test_display_client_table_streams_an_iterator():
+    import io
+    import json
+    from config.console import CustomConsole
+
+    out = io.StringIO()
+    view = cv.ClientsView(CustomConsole(file=out, force_terminal=True))
+    clients = iter([DummyClient(1, 'Homer Simpson', 'homer@sp.com', '+33123456789', 'Duff')])
+
+    view.display_client_table(clients, fmt='json')
+
+    rows = json.loads(out.getvalue())
+    assert rows[0]['Name'] == 'Homer Simpson'
+    assert rows[0]['Commercial'] == '-'
+
+
+@pytest.mark.parametrize("fmt", ["rich", "plain", "tsv", "json"])
+def test_display_client_table_without_phone_or_company(fmt):
+    import io
+    from config.console import CustomConsole
+
+    out = io.StringIO()
+    view = cv.ClientsView(CustomConsole(file=out, force_terminal=True, width=200))
+
+    view.display_client_table([DummyClient(1, 'Homer Simpson', 'homer@sp.com', None, None)], fmt=fmt)
+
+    assert 'Homer Simpson' in out.getvalue()
+    assert cv.ClientsView.format_row(DummyClient(1, 'Homer', 'h@sp.com', None, None))[3:5] == ('-', '-')
+
+
+def test_display_client_table_empty(monkeypatch):
+    fake_console = make_console()
+    info = MagicMock()
+    monkeypatch.setattr(cv, 'display_info', info)
+
+    cv.ClientsView(fake_console).display_client_table(iter([]))
+
+    info.assert_called_once_with("No clients found.", clear=False)
+    fake_console.print.assert_not_called()
+
+
 def test_prompt_new_client_success(monkeypatch):
     fake_console = make_console()
     monkeypatch.setattr(cv, 'console', fake_console)
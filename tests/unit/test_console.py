@@ -0,0 +1,64 @@
+import io
+import os
+
+import pytest
+
+from config.console import CLEAR_SCROLLBACK, CustomConsole
+
+
+def make_console(terminal=True):
+    out = io.StringIO()
+    return CustomConsole(file=out, force_terminal=terminal, legacy_windows=False), out
+
+
+def test_clear_writes_control_sequences_without_a_process(monkeypatch):
+    monkeypatch.setattr(os, "system", lambda *a: pytest.fail("clear() spawned a process"))
+    console, out = make_console()
+
+    console.clear()
+
+    assert out.getvalue() == "\x1b[2J\x1b[H" + CLEAR_SCROLLBACK
+
+
+def test_clear_is_skipped_while_the_screen_is_clean():
+    console, out = make_console()
+    console.clear()
+    out.truncate(0)
+    out.seek(0)
+
+    console.clear()
+    assert out.getvalue() == ""
+
+    console.print("Hello")
+    console.clear()
+    assert out.getvalue().endswith("\x1b[2J\x1b[H" + CLEAR_SCROLLBACK)
+
+
+def test_clear_does_nothing_outside_a_terminal():
+    console, out = make_console(terminal=False)
+
+    console.print("Hello")
+    console.clear()
+
+    assert out.getvalue() == "Hello\n"
+
+
+def test_alternate_screen_is_restored():
+    console, out = make_console()
+
+    with console.alternate_screen():
+        console.print("Inside")
+        console.clear()
+    assert out.getvalue().startswith("\x1b[?1049h")
+    assert out.getvalue().endswith("\x1b[?1049l")
+    # The scrollback belongs to the main screen: it is left alone
+    assert CLEAR_SCROLLBACK not in out.getvalue()
+
+
+def test_alternate_screen_disabled():
+    console, out = make_console()
+
+    with console.alternate_screen(enable=False):
+        pass
+
+    assert out.getvalue() == ""
@@ -6,6 +6,7 @@ from unittest.mock import patch, MagicMock
 from exceptions import CrmInvalidValue, CrmNotFoundError, CrmIntegrityError
 from controllers.contract_controller import ContractController
 from controllers.repositories.contract_repository import ContractRepository
+from controllers.repositories.pagination import Page
 from controllers.repositories.client_repository import ClientRepository
 from models.contract import Contract
 from models.client import Client
@@ -89,6 +90,18 @@ def test_create_contract_validation_error(session, seeded_user, mock_auth_gestio
             )
 
 
+def test_create_contract_integrity_error_is_raised(session, seeded_user, mock_auth_gestion):
+    ctrl = ContractController(session, seeded_user, make_console())
+    ctrl.view = MagicMock()
+    fake_client = MagicMock(commercial_id=1)
+    with patch.object(ClientRepository, 'get_by_id', return_value=fake_client), \
+            patch.object(ContractRepository, 'save', side_effect=Exception("boom")):
+        with pytest.raises(CrmIntegrityError, match="Could not create contract"):
+            ctrl._create_contract(client_id=1, amount=Decimal('10'), is_signed=True, end_date="2030-01-01")
+    # Reporting the error is left to the caller (menu or cli.py)
+    ctrl.view.show_error.assert_not_called()
+
+
 def test_get_contract_by_id_success(session, seeded_user, mock_auth_gestion):
     ctrl = ContractController(session, seeded_user, make_console())
     fake_contract = MagicMock()
@@ -178,9 +191,10 @@ def test_update_contract_repository_error(session, seeded_user, mock_auth_gestio
 def test_list_all_contracts_success(session, seeded_user_commercial):
     ctrl = ContractController(session, seeded_user_commercial, make_console())
     fake_list = [MagicMock(), MagicMock()]
-    ctrl.repo.list_all = MagicMock(return_value=fake_list)
+    ctrl.repo.page = MagicMock(return_value=Page(fake_list))
     ctrl.view.display_contract_table = MagicMock()
     ctrl.list_all_contracts()
+    ctrl.repo.page.assert_called_once_with()
     ctrl.view.display_contract_table.assert_called_once_with(
         fake_list, title="All Contracts")
 
@@ -188,28 +202,31 @@ def test_list_all_contracts_success(session, seeded_user_commercial):
 def test_list_by_commercial_success(session, seeded_user_commercial, mock_auth_commercial):
     ctrl = ContractController(session, seeded_user_commercial, make_console())
     fake_list = [MagicMock()]
-    ctrl.repo.list_by_commercial = MagicMock(return_value=fake_list)
+    ctrl.own_repo.page = MagicMock(return_value=Page(fake_list))
     ctrl.view.display_contract_table = MagicMock()
     ctrl.list_by_commercial()
+    # the scope comes from the row policy of the current user
+    assert ctrl.own_repo.policy.user_id == seeded_user_commercial.id
+    ctrl.own_repo.page.assert_called_once_with()
     ctrl.view.display_contract_table.assert_called_once_with(
         fake_list, title="My Contracts")
 
 
 def test_list_unsigned_contracts(session, seeded_user_commercial, mock_auth_commercial):
-    # given a mix of signed and unsigned contracts
+    # given the repository returns the unsigned contracts of the commercial
     c1 = MagicMock(is_signed=False, remaining_amount=0)
-    c2 = MagicMock(is_signed=True,  remaining_amount=10)
     c3 = MagicMock(is_signed=False, remaining_amount=5)
 
     ctrl = ContractController(session, seeded_user_commercial, make_console())
     # Mock out the repo call and the view
-    ctrl.repo.list_all = MagicMock(return_value=[c1, c2, c3])
+    ctrl.own_repo.page = MagicMock(return_value=Page([c1, c3]))
     ctrl.view.display_contract_table = MagicMock()
 
     # when
     ctrl.list_unsigned_contracts()
 
-    # then only the unsigned ones get shown, with the right title
+    # then the filter is pushed to the repository, scoped to the current user
+    ctrl.own_repo.page.assert_called_once_with(unsigned=True)
     ctrl.view.display_contract_table.assert_called_once_with(
         [c1, c3],
         title="Unsigned Contracts"
@@ -217,20 +234,20 @@ def test_list_unsigned_contracts(session, seeded_user_commercial, mock_auth_comm
 
 
 def test_list_unpaid_contracts(session, seeded_user_commercial, mock_auth_commercial):
-    # given a mix of fully-paid and partly-paid contracts
-    c1 = MagicMock(is_signed=True,  remaining_amount=0)
+    # given the repository returns the partly-paid contracts of the commercial
     c2 = MagicMock(is_signed=True,  remaining_amount=20)
     c3 = MagicMock(is_signed=False, remaining_amount=5)
 
     ctrl = ContractController(session, seeded_user_commercial, make_console())
     # Mock out the repo call and the view
-    ctrl.repo.list_all = MagicMock(return_value=[c1, c2, c3])
+    ctrl.own_repo.page = MagicMock(return_value=Page([c2, c3]))
     ctrl.view.display_contract_table = MagicMock()
 
     # when
     ctrl.list_unpaid_contracts()
 
-    # then only those with remaining_amount > 0 get shown, with the right title
+    # then the filter is pushed to the repository, scoped to the current user
+    ctrl.own_repo.page.assert_called_once_with(unpaid=True)
     ctrl.view.display_contract_table.assert_called_once_with(
         [c2, c3],
         title="Unpaid Contracts"
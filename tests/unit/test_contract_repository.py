@@ -1,7 +1,10 @@
 from datetime import datetime, timedelta
 from decimal import Decimal
 
+from sqlalchemy import text
+
 from controllers.repositories.contract_repository import ContractRepository
+from models.client import Client
 from models.contract import Contract
 
 def test_contract_repository_crud(session):
@@ -31,3 +34,98 @@ def test_contract_repository_crud(session):
     assert fetched.id == saved.id
 
     assert repo.get_by_id(99999) is None
+
+
+
+def _seed_contracts(session, commercial_id, count, start=0):
+    for i in range(start, start + count):
+        client = Client(
+            fullname=f"Client {i}",
+            email=f"client{i}@email.com",
+            commercial_id=commercial_id
+        )
+        session.add(client)
+        session.flush()
+        session.add(Contract(
+            total_amount=Decimal("100.00"),
+            remaining_amount=Decimal("50.00"),
+            end_date=datetime.now(),
+            client_id=client.id,
+            commercial_id=commercial_id
+        ))
+    session.commit()
+    session.expunge_all()
+
+
+def _render_names(contracts):
+    return [(c.client.fullname, c.commercial.fullname) for c in contracts]
+
+
+def test_list_all_query_count_is_constant(session, seeded_user_commercial, count_queries):
+    repo = ContractRepository(session)
+    commercial_id = seeded_user_commercial.id
+
+    _seed_contracts(session, commercial_id, 3)
+    count_queries.clear()
+    assert len(_render_names(repo.list_all())) == 3
+    small = len(count_queries)
+
+    _seed_contracts(session, commercial_id, 30, start=3)
+    session.expunge_all()
+    count_queries.clear()
+    assert len(_render_names(repo.list_all())) == 33
+    assert len(count_queries) == small
+
+
+def test_list_by_commercial_loads_relationships(session, seeded_user_commercial, count_queries):
+    repo = ContractRepository(session)
+    commercial_id = seeded_user_commercial.id
+    _seed_contracts(session, commercial_id, 10)
+
+    count_queries.clear()
+    names = _render_names(repo.list_by_commercial(commercial_id))
+
+    assert len(names) == 10
+    assert len(count_queries) == 1
+
+
+def test_list_filtered_by_status(session, seeded_user_commercial):
+    repo = ContractRepository(session)
+    commercial_id = seeded_user_commercial.id
+    client = Client(fullname="Client", email="client@email.com", commercial_id=commercial_id)
+    session.add(client)
+    session.flush()
+
+    def make(signed, remaining, owner=commercial_id):
+        contract = Contract(
+            total_amount=Decimal("100.00"),
+            remaining_amount=Decimal(remaining),
+            end_date=datetime.now(),
+            is_signed=signed,
+            client_id=client.id,
+            commercial_id=owner
+        )
+        return repo.save(contract).id
+
+    unsigned_unpaid = make(False, "40.00")
+    unsigned_paid = make(False, "0.00")
+    signed_unpaid = make(True, "10.00")
+    make(True, "0.00")
+    other_unsigned = make(False, "40.00", owner=commercial_id + 100)
+
+    def ids(contracts):
+        return {c.id for c in contracts}
+
+    assert ids(repo.list_unsigned(commercial_id)) == {unsigned_unpaid, unsigned_paid}
+    assert ids(repo.list_unpaid(commercial_id)) == {unsigned_unpaid, signed_unpaid}
+    assert ids(repo.list_filtered(commercial_id, unsigned=True, unpaid=True)) == {unsigned_unpaid}
+    assert other_unsigned in ids(repo.list_unsigned())
+
+
+def test_unsigned_filter_uses_the_partial_index(session):
+    query = ContractRepository(session)._filtered_query(unsigned=True)
+    sql = str(query.statement.compile(session.get_bind(), compile_kwargs={"literal_binds": True}))
+
+    plan = session.execute(text(f"EXPLAIN QUERY PLAN {sql}")).all()
+
+    assert any("ix_contract_unsigned" in row[-1] for row in plan)
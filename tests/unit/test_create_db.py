@@ -0,0 +1,34 @@
+from sqlalchemy import create_engine, inspect
+
+from database.create_db import apply_indexes
+from models.base import Base
+
+
+def _index_names(engine, table):
+    return {index["name"] for index in inspect(engine).get_indexes(table)}
+
+
+def test_apply_indexes_upgrades_existing_database():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    # Simulate a database created before the indexes were declared
+    with engine.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                index.drop(bind=conn)
+
+    created = apply_indexes(engine)
+
+    assert "ix_contract_unsigned" in created
+    assert "ix_contract_commercial_unpaid" in created
+    assert {"ix_event_contract_id", "ix_event_support_contact_id", "ix_event_start_date"} <= \
+        _index_names(engine, "event")
+    assert {"ix_client_commercial_id", "ix_client_phone"} <= _index_names(engine, "client")
+    assert "ix_contract_client_id" in _index_names(engine, "contract")
+
+
+def test_apply_indexes_is_idempotent():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+
+    assert apply_indexes(engine) == []
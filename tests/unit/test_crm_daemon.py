@@ -0,0 +1,73 @@
+import io
+import multiprocessing
+import os
+import stat
+import sys
+
+import pytest
+
+import cli
+import crm
+import crm_daemon
+from exceptions import CrmError
+
+
+@pytest.fixture
+def socket_path(tmp_path, monkeypatch):
+    path = str(tmp_path / "crm.sock")
+    monkeypatch.setattr(crm, "SOCKET_PATH", path)
+    return path
+
+
+@pytest.fixture
+def daemon(socket_path, monkeypatch):
+    # A forked process, since the daemon redirects sys.stdout and sys.stderr
+    monkeypatch.setattr(cli, "main", fake_main)
+    server = crm_daemon.bind(socket_path)
+    process = multiprocessing.get_context("fork").Process(target=crm_daemon.serve, args=(server,))
+    process.start()
+    yield process
+    process.kill()
+    process.join()
+    server.close()
+
+
+def fake_main(argv, output=None):
+    if argv == ["--bad"]:
+        cli.build_parser().parse_args(argv)
+    output.write_text(f"{argv} in {os.getcwd()} read {sys.stdin.read()!r}\n")
+    print("a warning", file=sys.stderr)
+    return 5
+
+
+def test_commands_run_in_the_daemon(daemon, monkeypatch, tmp_path, capsys):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(sys, "stdin", io.StringIO("whoami\n"))
+
+    assert crm.main(["batch", "-"]) == 5
+
+    out, err = capsys.readouterr()
+    assert out == f"['batch', '-'] in {tmp_path} read 'whoami\\n'\n"
+    assert err == "a warning\n"
+    assert crm.main(["--bad"]) == 2
+    assert "crm: error:" in capsys.readouterr().err
+
+
+def test_stop_daemon(daemon, socket_path):
+    assert crm.main(["--stop-daemon"]) == 0
+    daemon.join(timeout=5)
+    assert daemon.exitcode == 0
+
+
+def test_socket_is_private_and_not_shared(daemon, socket_path):
+    assert stat.S_IMODE(os.stat(socket_path).st_mode) == 0o600
+    with pytest.raises(CrmError):
+        crm_daemon.bind(socket_path)
+
+
+def test_without_a_daemon_commands_run_in_process(socket_path, monkeypatch):
+    calls = []
+    monkeypatch.setattr(cli, "main", lambda argv: calls.append(argv) or 0)
+
+    assert crm.main(["whoami"]) == 0
+    assert calls == [["whoami"]]
@@ -6,6 +6,7 @@ from unittest.mock import patch, MagicMock
 
 from controllers.event_controller import EventController
 from controllers.repositories.event_repository import EventRepository
+from controllers.repositories.pagination import Page
 from controllers.repositories.contract_repository import ContractRepository
 from controllers.repositories.user_repository import UserRepository
 from exceptions import CrmInvalidValue, CrmNotFoundError, CrmIntegrityError
@@ -317,7 +318,7 @@ def test_update_event_repository_error(monkeypatch, seeded_user):
 def test_list_all_events(monkeypatch, seeded_user):
     ctrl = EventController(None, seeded_user, make_console())
     fake = [MagicMock(), MagicMock()]
-    monkeypatch.setattr(EventRepository, 'list_all', lambda self: fake)
+    monkeypatch.setattr(EventRepository, 'page', lambda self: Page(fake))
     ctrl.view.display_event_table = MagicMock()
 
     ctrl.list_all_events()
@@ -327,8 +328,8 @@ def test_list_all_events(monkeypatch, seeded_user):
 
 def test_list_my_events(monkeypatch, seeded_user_commercial):
     ctrl = EventController(None, seeded_user_commercial, make_console())
-    monkeypatch.setattr(EventRepository, 'list_by_support_contact',
-                        lambda self, uid: ["Duff"])
+    monkeypatch.setattr(EventRepository, 'page',
+                        lambda self: Page(["Duff"]))
     ctrl.view.display_event_table = MagicMock()
 
     with patch('controllers.services.authorization.get_token_payload_or_raise',
@@ -341,8 +342,8 @@ def test_list_my_events(monkeypatch, seeded_user_commercial):
 
 def test_list_unassigned_events(monkeypatch, seeded_user):
     ctrl = EventController(None, seeded_user, make_console())
-    monkeypatch.setattr(EventRepository, 'list_without_support',
-                        lambda self: ["Sideshow Bob"])
+    monkeypatch.setattr(EventRepository, 'page',
+                        lambda self, unassigned: Page(["Sideshow Bob"]))
     ctrl.view.display_event_table = MagicMock()
 
     with patch('controllers.services.authorization.get_token_payload_or_raise',
@@ -1,7 +1,12 @@
 from datetime import datetime, timedelta
+from decimal import Decimal
 
 from controllers.repositories.event_repository import EventRepository
+from models.client import Client
+from models.contract import Contract
 from models.event import Event
+from models.user import User
+from models.user_role import UserRole
 
 
 def test_event_repository_crud(session):
@@ -126,3 +131,102 @@ def test_event_repository_list_by_contract(session):
     other_contract_events = repo.list_by_contract(6)
     assert len(other_contract_events) == 1
     assert other_contract_events[0].name == "Different Event"
+
+
+def _seed_events(session, commercial_id, support_id, count, start=0):
+    now = datetime.now()
+    for i in range(start, start + count):
+        client = Client(
+            fullname=f"Client {i}",
+            email=f"client{i}@email.com",
+            commercial_id=commercial_id
+        )
+        session.add(client)
+        session.flush()
+        contract = Contract(
+            total_amount=Decimal("100.00"),
+            remaining_amount=Decimal("0.00"),
+            end_date=now,
+            is_signed=True,
+            client_id=client.id,
+            commercial_id=commercial_id
+        )
+        session.add(contract)
+        session.flush()
+        session.add(Event(
+            name=f"Event {i}",
+            start_date=now,
+            end_date=now + timedelta(hours=2),
+            location="Venue Hall",
+            attendees=10,
+            contract_id=contract.id,
+            # every other event is left unassigned
+            support_contact_id=support_id if i % 2 == 0 else None
+        ))
+    session.commit()
+    session.expunge_all()
+
+
+def _render_names(events):
+    return [
+        (
+            e.contract.client.fullname,
+            e.support_contact.fullname if e.support_contact else "-"
+        )
+        for e in events
+    ]
+
+
+def test_event_list_query_count_is_constant(session, seeded_user_commercial, count_queries):
+    support = User(fullname="Support User", email="support@email.com", role=UserRole.SUPPORT)
+    support.set_password("CorrectPassword123")
+    session.add(support)
+    session.commit()
+    commercial_id, support_id = seeded_user_commercial.id, support.id
+    repo = EventRepository(session)
+
+    _seed_events(session, commercial_id, support_id, 4)
+    count_queries.clear()
+    assert len(_render_names(repo.list_all())) == 4
+    small = len(count_queries)
+
+    _seed_events(session, commercial_id, support_id, 40, start=4)
+    session.expunge_all()
+    count_queries.clear()
+    assert len(_render_names(repo.list_all())) == 44
+    assert len(count_queries) == small == 1
+
+    for listing in (
+        lambda: repo.list_by_support_contact(support_id),
+        repo.list_without_support,
+    ):
+        session.expunge_all()
+        count_queries.clear()
+        assert len(_render_names(listing())) == 22
+        assert len(count_queries) == 1
+
+
+def test_event_get_with_owner_id_single_query(session, seeded_user_commercial, count_queries):
+    commercial_id = seeded_user_commercial.id
+    _seed_events(session, commercial_id, None, 1)
+    repo = EventRepository(session)
+    event_id = session.query(Event.id).scalar()
+
+    count_queries.clear()
+    event, owner_id = repo.get_with_owner_id(event_id)
+    assert event.name == "Event 0"
+    assert owner_id == commercial_id
+    assert len(count_queries) == 1
+
+    assert repo.get_with_owner_id(9999) is None
+
+
+def test_event_get_owner_ids(session, seeded_user_commercial, count_queries):
+    commercial_id = seeded_user_commercial.id
+    _seed_events(session, commercial_id, None, 3)
+    ids = {event_id for (event_id,) in session.query(Event.id)}
+
+    count_queries.clear()
+    owners = EventRepository(session).get_owner_ids(ids | {9999})
+    assert len(count_queries) == 1
+    assert owners == dict.fromkeys(ids, commercial_id)
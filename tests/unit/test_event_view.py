@@ -112,7 +112,7 @@ def test_display_event_table_with_data(monkeypatch):
         ),
     ]
     view = EventsView(console)
-    with patch("views.event_view.create_table") as mock_create_table:
+    with patch("views.base.create_table") as mock_create_table:
         table_mock = MagicMock()
         mock_create_table.return_value = table_mock
         view.display_event_table(evts, title="T")
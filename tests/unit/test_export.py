@@ -0,0 +1,74 @@
+import csv
+import gzip
+import json
+from datetime import datetime, timedelta
+from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
+
+from controllers.services.export import export_entity
+from exceptions import CrmInvalidValue
+from models.client import Client
+from models.contract import Contract
+from models.event import Event
+
+
+@pytest.fixture
+def mock_auth_gestion(seeded_user):
+    with patch('controllers.services.authorization.get_token_payload_or_raise',
+               return_value={'role': 'gestion', 'id': seeded_user.id}):
+        yield
+
+
+@pytest.fixture
+def seeded_data(session, seeded_user_commercial):
+    now = datetime(2025, 6, 4, 13, 15)
+    for i in range(5):
+        client = Client(fullname=f"Client {i}", email=f"client{i}@email.com",
+                        commercial_id=seeded_user_commercial.id)
+        session.add(client)
+        session.flush()
+        contract = Contract(total_amount=Decimal("100.50"), remaining_amount=Decimal("0"),
+                            end_date=now, is_signed=True, client_id=client.id,
+                            commercial_id=seeded_user_commercial.id)
+        session.add(contract)
+        session.flush()
+        session.add(Event(name=f"Event {i}", start_date=now, end_date=now + timedelta(hours=2),
+                          location="Venue Hall", attendees=10, contract_id=contract.id))
+    session.commit()
+
+
+def test_export_clients_csv(session, seeded_data, mock_auth_gestion, tmp_path):
+    path = tmp_path / "clients.csv"
+
+    count = export_entity(session, "clients", "csv", str(path), batch_size=2)
+
+    assert count == 5
+    with open(path, newline="") as fh:
+        rows = list(csv.DictReader(fh))
+    assert [r["fullname"] for r in rows] == [f"Client {i}" for i in range(5)]
+
+
+def test_export_contracts_jsonl_gzip(session, seeded_data, mock_auth_gestion, tmp_path):
+    path = tmp_path / "contracts.jsonl.gz"
+
+    count = export_entity(session, "contracts", "jsonl", str(path), compress=True)
+
+    assert count == 5
+    with gzip.open(path, "rt") as fh:
+        rows = [json.loads(line) for line in fh]
+    assert rows[0]["total_amount"] == "100.50"
+    assert rows[0]["end_date"] == "2025-06-04T13:15:00"
+    assert rows[0]["is_signed"] is True
+
+
+def test_export_empty_table_writes_nothing(session, mock_auth_gestion, tmp_path):
+    path = tmp_path / "events.csv"
+    assert export_entity(session, "events", "csv", str(path)) == 0
+    assert path.read_text() == ""
+
+
+def test_export_invalid_entity(session, mock_auth_gestion, tmp_path):
+    with pytest.raises(CrmInvalidValue, match="Entity must be one of"):
+        export_entity(session, "users", "csv", str(tmp_path / "users.csv"))
@@ -0,0 +1,118 @@
+import io
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import select, update
+
+from controllers.client_controller import ClientController
+from controllers.repositories.client_repository import ClientRepository
+from config.actions import add_action_observer, remove_action_observer, track_action
+from database.instrumentation import OUTSIDE_ACTIONS, SqlRecorder
+from models.client import Client
+
+
+@pytest.fixture
+def clients(session, seeded_user_commercial):
+    for n in range(5):
+        session.add(Client(fullname=f"Client {n}", email=f"client{n}@email.com",
+                           commercial_id=seeded_user_commercial.id))
+    session.commit()
+
+
+@pytest.fixture
+def recorder(session):
+    recorder = SqlRecorder()
+    recorder.install(session.get_bind())
+    yield recorder
+    recorder.uninstall(session.get_bind())
+
+
+def test_records_statements_per_action(session, clients, recorder):
+    with recorder.action("List"):
+        ClientRepository(session).list_all()
+    with recorder.action("Stream"):
+        assert len(list(ClientRepository(session).stream_rows(batch_size=2))) == 5
+    with recorder.action("Rename"):
+        session.execute(update(Client).values(company="Renamed"))
+    with recorder.action("Nothing"):
+        pass
+
+    assert [action.name for action in recorder.actions] == ["List", "Stream", "Rename"]
+    listing, stream, rename = recorder.actions
+    assert len(listing.queries) == 1
+    assert listing.queries[0].rows == 5
+    assert listing.queries[0].duration_ms > 0
+    assert listing.queries[0].call_site.startswith("controllers/repositories/client_repository.py:")
+    assert stream.queries[0].rows == 5
+    assert rename.queries[0].rows == 5
+    assert "[List] 1 queries" in recorder.report()
+
+
+def test_flags_lazy_loads_as_n_plus_one(session, clients, recorder):
+    with recorder.action("Lazy"):
+        for client in session.scalars(select(Client)).all():
+            client.contracts
+
+    patterns = recorder.actions[0].n_plus_one()
+    assert len(patterns) == 1
+    assert patterns[0].count == 5
+    assert patterns[0].distinct_parameters == 5
+    assert "FROM contract" in patterns[0].statement
+    assert patterns[0].call_site.startswith("tests/unit/test_instrumentation.py:")
+    assert "N+1: 5x" in recorder.report()
+
+
+def test_repeated_identical_statement_is_not_n_plus_one(session, clients, recorder):
+    with recorder.action("Same"):
+        for _ in range(5):
+            session.execute(select(Client).where(Client.id == 1)).all()
+
+    assert recorder.actions[0].n_plus_one() == []
+
+
+def test_statements_outside_actions(session, clients, recorder):
+    session.execute(select(Client)).all()
+
+    assert recorder.actions == []
+    assert OUTSIDE_ACTIONS in recorder.report()
+
+
+def test_summary_is_written_as_each_action_ends(session, clients):
+    output = io.StringIO()
+    recorder = SqlRecorder(output=output)
+    recorder.install(session.get_bind())
+    try:
+        with recorder.action("List"):
+            ClientRepository(session).list_all()
+            assert output.getvalue() == ""
+        assert output.getvalue().startswith("[List] 1 queries")
+
+        recorder.finish()
+        assert OUTSIDE_ACTIONS not in output.getvalue()
+        session.execute(select(Client)).all()
+        recorder.finish()
+        assert OUTSIDE_ACTIONS in output.getvalue()
+    finally:
+        recorder.uninstall(session.get_bind())
+
+
+def test_menu_choices_are_tracked(session, clients, seeded_user_commercial, recorder):
+    controller = ClientController(session, seeded_user_commercial, MagicMock())
+    controller.view = MagicMock()
+    controller.view.show_menu.side_effect = ["List clients", "Back"]
+    controller.view.display_client_pages.side_effect = lambda fetch_page, **kw: fetch_page()
+
+    add_action_observer(recorder.action)
+    try:
+        controller.show_menu()
+    finally:
+        remove_action_observer(recorder.action)
+
+    assert [action.name for action in recorder.actions] == ["Clients: List clients"]
+
+
+def test_track_action_without_observers(session, clients, recorder):
+    with track_action("Anything"):
+        session.execute(select(Client)).all()
+
+    assert recorder.actions == []
@@ -0,0 +1,49 @@
+from unittest.mock import patch
+
+import pytest
+from argon2 import extract_parameters
+
+import models.user as user_module
+from controllers.repositories.user_repository import UserRepository
+from controllers.user_controller import UserController
+from exceptions import CrmInvalidValue
+from models.user import ARGON2_PROFILES, User, get_password_hasher
+from models.user_role import UserRole
+
+
+def test_get_password_hasher():
+    hasher = get_password_hasher("dev")
+    assert hasher.time_cost == ARGON2_PROFILES["dev"]["time_cost"]
+    assert hasher.memory_cost == ARGON2_PROFILES["dev"]["memory_cost"]
+
+    with pytest.raises(CrmInvalidValue, match="Unknown argon2 profile"):
+        get_password_hasher("fast")
+
+
+def _user_hashed_with(profile):
+    user = User(fullname="Hash User", email="hash@email.com", role=UserRole.GESTION)
+    with patch.object(user_module, "pass_hasher", get_password_hasher(profile)):
+        user.set_password("CorrectPassword123")
+    return user
+
+
+def test_needs_rehash_only_upgrades():
+    with patch.object(user_module, "pass_hasher", get_password_hasher("dev")):
+        assert _user_hashed_with("test").needs_rehash()
+        assert not _user_hashed_with("dev").needs_rehash()
+        # A costlier hash is never downgraded
+        assert not _user_hashed_with("prod").needs_rehash()
+
+
+def test_login_rehashes_cheaper_hash(session, monkeypatch, tmp_path):
+    monkeypatch.setattr("controllers.services.token_cache.TOKEN_PATH", tmp_path / "token.jwt")
+    user = _user_hashed_with("test")
+    session.add(user)
+    session.commit()
+
+    with patch.object(user_module, "pass_hasher", get_password_hasher("dev")):
+        UserController(session).authenticate("hash@email.com", "CorrectPassword123")
+
+    stored = UserRepository(session).get_by_email("hash@email.com").password_hash
+    assert extract_parameters(stored).memory_cost == ARGON2_PROFILES["dev"]["memory_cost"]
+    assert user.check_password("CorrectPassword123")
@@ -0,0 +1,45 @@
+import pytest
+
+from controllers.services.permissions import (
+    PERMISSIONS,
+    Access,
+    compile_menu,
+    get_access,
+    is_allowed,
+    menu_options,
+)
+from exceptions import CrmInvalidValue
+from models.user_role import UserRole
+
+
+def test_get_access_accepts_role_or_value():
+    assert get_access(UserRole.GESTION, "client.update") is Access.ALLOW
+    assert get_access("commercial", "client.update") is Access.OWNER
+    assert get_access("support", "client.update") is None
+    assert get_access(None, "client.list") is None
+
+
+def test_is_allowed():
+    assert is_allowed("support", "event.update")
+    assert not is_allowed("commercial", "user.list")
+    assert not is_allowed("gestion", "unknown.action")
+
+
+def test_every_action_grants_known_roles():
+    for grants in PERMISSIONS.values():
+        assert set(grants) <= set(UserRole)
+        assert all(isinstance(access, Access) for access in grants.values())
+
+
+def test_compile_menu():
+    menu = compile_menu([("List", "client.list"), ("Add", "client.create"), ("Back", None)])
+
+    assert menu_options(menu, "commercial") == ["List", "Add", "Back"]
+    assert menu_options(menu, UserRole.SUPPORT) == ["List", "Back"]
+    # unknown roles only get the entries without a permission
+    assert menu_options(menu, "other") == ["Back"]
+
+
+def test_compile_menu_unknown_action():
+    with pytest.raises(CrmInvalidValue, match="Unknown permission action"):
+        compile_menu([("Typo", "client.udpate")])
@@ -0,0 +1,98 @@
+import time
+
+import pytest
+from sqlalchemy import select
+
+from config.actions import track_action
+from config.profiling import SessionProfiler
+from models.user import User
+
+
+class FakeConsole:
+    def input(self, prompt=""):
+        self.print(prompt)
+        time.sleep(0.02)
+        return "1"
+
+    def print(self, *args, **kwargs):
+        pass
+
+    def rule(self, *args, **kwargs):
+        pass
+
+    def clear(self):
+        time.sleep(0.005)
+
+
+@pytest.fixture
+def console():
+    return FakeConsole()
+
+
+@pytest.fixture
+def profiler(session, console):
+    profiler = SessionProfiler(session.get_bind(), console)
+    profiler.install()
+    yield profiler
+    profiler.uninstall()
+
+
+def test_action_time_is_split(session, console, profiler):
+    with track_action("Users: List users"):
+        console.clear()
+        console.input("Your choice: ")
+        session.execute(select(User)).all()
+        console.print("table")
+
+    action, = profiler.actions
+    assert action.name == "Users: List users"
+    assert action.queries == 1
+    assert action.sql_ms > 0
+    assert action.input_ms >= 20
+    assert action.clear_ms >= 5
+    # The prompt printed by input() counts as input, not as rendering
+    assert action.busy_ms < action.wall_ms - 20
+    assert action.other_ms >= 0
+    assert "Users: List users" in profiler.report()
+
+
+def test_nested_actions(console, profiler):
+    with track_action("Main: Clients"):
+        console.clear()
+        with track_action("Clients: List clients"):
+            console.clear()
+
+    outer, = profiler.actions
+    inner, = outer.children
+    assert (outer.depth, inner.depth) == (0, 1)
+    assert outer.clear_ms > inner.clear_ms
+    report = profiler.report()
+    assert report.index("Main: Clients") < report.index("  Clients: List clients")
+
+
+def test_detail_mode_profiles_and_traces_memory(session, console):
+    profiler = SessionProfiler(session.get_bind(), console, detail=True)
+    profiler.install()
+    try:
+        with track_action("Allocate"):
+            data = [str(n) for n in range(20_000)]
+            console.input()
+    finally:
+        profiler.uninstall()
+
+    action, = profiler.actions
+    assert len(data) == 20_000
+    assert action.peak_kib > 100
+    assert "function calls" in action.hotspots
+    assert "--- Allocate" in profiler.report()
+
+
+def test_uninstall_restores_console(session, console):
+    profiler = SessionProfiler(session.get_bind(), console)
+    profiler.install()
+    profiler.uninstall()
+
+    assert "print" not in vars(console)
+    with track_action("Untracked"):
+        console.clear()
+    assert profiler.actions == []
@@ -0,0 +1,84 @@
+import io
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from config.console import CustomConsole
+from exceptions import CrmInvalidValue
+from views import renderers
+from views.base import render_table
+
+COLUMNS = ["ID", "Name"]
+
+
+def make_console(terminal=True):
+    out = io.StringIO()
+    return CustomConsole(file=out, force_terminal=terminal, width=120), out
+
+
+def test_choose_format(monkeypatch):
+    monkeypatch.setattr(renderers, "STREAM_THRESHOLD", 10)
+    console, _ = make_console()
+
+    assert renderers.choose_format(console, row_count=10) == "rich"
+    assert renderers.choose_format(console, row_count=11) == "plain"
+    assert renderers.choose_format(console, row_count=None) == "plain"
+    assert renderers.choose_format(make_console(terminal=False)[0], row_count=1) == "tsv"
+    assert renderers.choose_format(console, row_count=1000, fmt="rich") == "rich"
+    with pytest.raises(CrmInvalidValue):
+        renderers.choose_format(console, fmt="xml")
+
+
+def test_plain_lines_pad_and_cut_cells():
+    lines = list(renderers.plain_lines("Clients", COLUMNS, [("1", "Homer Simpson")], widths=[3, 6]))
+
+    assert lines == ["Clients", "ID   Name", "---  ------", "1    Homer…"]
+
+
+def test_tsv_lines_escape_separators():
+    lines = list(renderers.tsv_lines("Clients", COLUMNS, [("1", "Homer\tJay\nSimpson")]))
+
+    assert lines == ["ID\tName", "1\tHomer Jay Simpson"]
+
+
+def test_json_lines_form_a_json_array():
+    lines = list(renderers.json_lines("Clients", COLUMNS, [("1", "Homer"), ("2", "Marge")]))
+
+    assert json.loads("\n".join(lines)) == [{"ID": "1", "Name": "Homer"}, {"ID": "2", "Name": "Marge"}]
+    assert json.loads("\n".join(renderers.json_lines("Clients", COLUMNS, []))) == []
+
+
+def test_render_table_streams_rows_as_they_are_read():
+    console, out = make_console()
+    seen = []
+
+    def rows():
+        for i in range(250):
+            # Rows are written a chunk at a time, not after the whole listing
+            seen.append(out.getvalue().count("\n"))
+            yield (str(i), f"Client {i}")
+
+    count = render_table(console, "Clients", COLUMNS, rows(), fmt="tsv")
+
+    assert count == 250
+    assert out.getvalue().splitlines()[:2] == ["ID\tName", "0\tClient 0"]
+    assert seen[-1] == 200
+
+
+def test_render_table_prints_a_rich_table_for_small_listings():
+    console = MagicMock()
+    console.is_terminal = True
+
+    count = render_table(console, "Clients", COLUMNS, [("1", "Homer")], row_count=1)
+
+    assert count == 1
+    assert console.print.call_args[0][0].row_count == 1
+    console.write_text.assert_not_called()
+
+
+def test_render_table_prints_nothing_without_rows():
+    console, out = make_console()
+
+    assert render_table(console, "Clients", COLUMNS, iter([]), fmt="plain") == 0
+    assert out.getvalue() == ""
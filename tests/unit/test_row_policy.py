@@ -0,0 +1,88 @@
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import pytest
+
+from controllers.repositories.client_repository import ClientRepository
+from controllers.repositories.contract_repository import ContractRepository
+from controllers.repositories.event_repository import EventRepository
+from controllers.repositories.row_policy import UNRESTRICTED, RowPolicy
+from models.client import Client
+from models.contract import Contract
+from models.event import Event
+from models.user import User
+from models.user_role import UserRole
+
+
+@pytest.fixture
+def users(session):
+    users = {}
+    for role in UserRole:
+        for n in (1, 2):
+            user = User(fullname=f"{role.value} {n}", email=f"{role.value}{n}@email.com", role=role)
+            user.set_password("CorrectPassword123")
+            session.add(user)
+            users[role, n] = user
+    session.commit()
+    return users
+
+
+@pytest.fixture
+def rows(session, users):
+    """One client, contract and event per commercial, each event assigned to one support."""
+    now = datetime.now()
+    for n in (1, 2):
+        client = Client(fullname=f"Client {n}", email=f"client{n}@email.com",
+                        commercial_id=users[UserRole.COMMERCIAL, n].id)
+        session.add(client)
+        session.flush()
+        contract = Contract(total_amount=Decimal("100.00"), remaining_amount=Decimal("10.00"),
+                            end_date=now, is_signed=False, client_id=client.id,
+                            commercial_id=users[UserRole.COMMERCIAL, n].id)
+        session.add(contract)
+        session.flush()
+        session.add(Event(name=f"Event {n}", start_date=now, end_date=now + timedelta(hours=1),
+                          location="Hall", attendees=5, contract_id=contract.id,
+                          support_contact_id=users[UserRole.SUPPORT, n].id))
+    session.commit()
+
+
+def test_commercial_sees_own_clients_and_contracts(session, users, rows):
+    policy = RowPolicy.for_user(users[UserRole.COMMERCIAL, 1])
+    clients = ClientRepository(session, policy)
+    contracts = ContractRepository(session, policy)
+
+    assert [c.fullname for c in clients.list_all()] == ["Client 1"]
+    assert [c.fullname for c in clients.page().items] == ["Client 1"]
+    assert len(contracts.page(unsigned=True, unpaid=True).items) == 1
+    assert [r["fullname"] for r in clients.stream_rows()] == ["Client 1"]
+
+    other = ClientRepository(session).get_by_email("client2@email.com")
+    assert clients.get_by_id(other.id) is None
+    # Events are not restricted for commercials
+    assert len(EventRepository(session, policy).list_all()) == 2
+
+
+def test_support_sees_assigned_events(session, users, rows):
+    policy = RowPolicy.for_user(users[UserRole.SUPPORT, 2])
+
+    assert [e.name for e in EventRepository(session, policy).page().items] == ["Event 2"]
+    assert len(ClientRepository(session, policy).list_all()) == 2
+
+
+def test_gestion_and_unrestricted_see_everything(session, users, rows):
+    policy = RowPolicy.for_user(users[UserRole.GESTION, 1])
+
+    assert policy.predicate(Client) is None
+    assert UNRESTRICTED.predicate(Contract) is None
+    assert len(ContractRepository(session, policy).list_all()) == 2
+    assert len(EventRepository(session).list_all()) == 2
+
+
+def test_predicate_is_applied_in_sql(session, users, rows, count_queries):
+    policy = RowPolicy.for_user(users[UserRole.COMMERCIAL, 2])
+
+    count_queries.clear()
+    ContractRepository(session, policy).list_all()
+    assert len(count_queries) == 1
+    assert "contract.commercial_id = ?" in count_queries[0]
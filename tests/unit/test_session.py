@@ -0,0 +1,38 @@
+import pytest
+from sqlalchemy import text
+
+from database.session import build_engine, get_sqlite_pragmas
+from exceptions import CrmInvalidValue
+
+
+def test_get_sqlite_pragmas_with_overrides():
+    pragmas = get_sqlite_pragmas("prod", "cache_size=-2000, mmap_size=0")
+    assert pragmas["journal_mode"] == "WAL"
+    assert pragmas["cache_size"] == "-2000"
+    assert pragmas["mmap_size"] == "0"
+
+
+def test_get_sqlite_pragmas_unknown_profile():
+    with pytest.raises(CrmInvalidValue, match="Unknown DB profile"):
+        get_sqlite_pragmas("turbo")
+
+
+def test_get_sqlite_pragmas_invalid_override():
+    with pytest.raises(CrmInvalidValue, match="Invalid SQLite PRAGMA"):
+        get_sqlite_pragmas("dev", "busy_timeout")
+
+
+def test_build_engine_applies_pragmas_on_connect(tmp_path):
+    engine = build_engine(f"sqlite:///{tmp_path}/profile.db", "prod")
+    with engine.connect() as conn:
+        assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        assert conn.execute(text("PRAGMA busy_timeout")).scalar() == 5000
+        assert conn.execute(text("PRAGMA foreign_keys")).scalar() == 1
+    engine.dispose()
+
+
+def test_build_engine_stock_profile_keeps_defaults(tmp_path):
+    engine = build_engine(f"sqlite:///{tmp_path}/stock.db", "stock")
+    with engine.connect() as conn:
+        assert conn.execute(text("PRAGMA journal_mode")).scalar() == "delete"
+    engine.dispose()
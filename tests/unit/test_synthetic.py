@@ -0,0 +1,115 @@
+import random
+from collections import Counter
+
+import pytest
+from sqlalchemy import create_engine, inspect, select
+
+from database.synthetic import DatasetSpec, populate, skewed_picker
+from exceptions import CrmInvalidValue
+from models.base import Base
+from models.client import Client
+from models.contract import Contract
+from models.event import Event
+from models.user import User
+from models.user_role import UserRole
+
+SPEC = DatasetSpec(users=20, clients=300, contracts_per_client=2, events_per_contract=2)
+
+
+def _load(spec=SPEC, batch_size=100):
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    return engine, populate(engine, spec, batch_size=batch_size)
+
+
+def _dump(engine, model):
+    with engine.connect() as conn:
+        return conn.execute(select(model.__table__).order_by(model.id)).all()
+
+
+def test_populate_is_deterministic():
+    first, _ = _load()
+    second, _ = _load(batch_size=7)
+
+    for model in (Client, Contract, Event):
+        assert _dump(first, model) == _dump(second, model)
+    other, _ = _load(DatasetSpec(users=20, clients=300, seed=7))
+    assert _dump(first, Client) != _dump(other, Client)
+
+
+def test_populate_counts_and_references():
+    engine, counts = _load()
+
+    assert counts["user_account"] == 20
+    assert counts["client"] == 300
+    assert len(_dump(engine, Contract)) == counts["contract"]
+    # Means of 2 per parent, drawn uniformly between 0 and 4
+    assert 450 < counts["contract"] < 750
+    clients = {row.id: row for row in _dump(engine, Client)}
+    contracts = {row.id: row for row in _dump(engine, Contract)}
+    assert all(clients[c.client_id].commercial_id == c.commercial_id for c in contracts.values())
+    events = _dump(engine, Event)
+    assert all(contracts[e.contract_id].is_signed and e.end_date > e.start_date for e in events)
+    with engine.connect() as conn:
+        roles = dict(conn.execute(select(User.id, User.role)).all())
+    assert {roles[e.support_contact_id] for e in events if e.support_contact_id} == {UserRole.SUPPORT}
+
+
+def test_populate_distributions():
+    engine, _ = _load()
+
+    portfolios = Counter(row.commercial_id for row in _dump(engine, Client)).most_common()
+    # Zipf-skewed: the largest portfolio is several times the smallest
+    assert portfolios[0][1] > 4 * portfolios[-1][1]
+    events = _dump(engine, Event)
+    unassigned = sum(e.support_contact_id is None for e in events) / len(events)
+    assert 0.1 < unassigned < 0.3
+    starts = Counter(e.start_date.date() for e in events)
+    assert starts.most_common(1)[0][1] > 1
+    contracts = _dump(engine, Contract)
+    assert any(not c.is_signed for c in contracts)
+    assert any(c.is_signed and c.remaining_amount == 0 for c in contracts)
+
+
+def test_populate_restores_indexes():
+    engine, _ = _load()
+
+    names = {index["name"] for index in inspect(engine).get_indexes("event")}
+    assert {"ix_event_support_contact_id", "ix_event_start_date"} <= names
+
+
+def test_populate_uses_existing_users(session):
+    engine = session.get_bind()
+    for role in (UserRole.COMMERCIAL, UserRole.SUPPORT):
+        user = User(fullname=role.value, email=f"{role.value}@email.com", role=role)
+        user.set_password("CorrectPassword123")
+        session.add(user)
+    session.commit()
+
+    counts = populate(engine, DatasetSpec(clients=10))
+
+    assert counts["user_account"] == 0
+    assert counts["client"] == 10
+
+
+def test_populate_rejects_invalid_specs():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+
+    with pytest.raises(CrmInvalidValue):
+        populate(engine, DatasetSpec(users=2))
+    with pytest.raises(CrmInvalidValue):
+        populate(engine, DatasetSpec(unassigned_ratio=1.5))
+    # No commercial in the database to own the clients
+    with pytest.raises(CrmInvalidValue):
+        populate(engine, DatasetSpec(clients=1))
+    # The indexes dropped for the load are rebuilt even when it fails
+    assert "ix_client_commercial_id" in {index["name"] for index in inspect(engine).get_indexes("client")}
+
+
+def test_skewed_picker_uniform_without_skew():
+    pick = skewed_picker(random.Random(1), [1, 2, 3, 4], skew=0)
+    counts = Counter(pick() for _ in range(4000))
+
+    assert set(counts) == {1, 2, 3, 4}
+    assert max(counts.values()) < 1.2 * min(counts.values())
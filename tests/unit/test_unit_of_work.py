@@ -0,0 +1,77 @@
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from controllers.repositories.client_repository import ClientRepository
+from controllers.repositories.unit_of_work import in_unit_of_work, unit_of_work
+from controllers.repositories.user_repository import UserRepository
+from exceptions import CrmIntegrityError
+from models.client import Client
+
+
+def _client(i, commercial_id, email=None):
+    return Client(fullname=f"Client {i}", email=email or f"client{i}@email.com",
+                  commercial_id=commercial_id)
+
+
+def test_save_outside_unit_of_work_commits_each_time(session, seeded_user_commercial):
+    repo = ClientRepository(session)
+    with patch.object(session, "commit", wraps=session.commit) as commit:
+        repo.save(_client(1, seeded_user_commercial.id))
+        repo.save(_client(2, seeded_user_commercial.id))
+    assert commit.call_count == 2
+
+
+def test_unit_of_work_commits_once(session, seeded_user_commercial):
+    repo = ClientRepository(session)
+    with patch.object(session, "commit", wraps=session.commit) as commit:
+        with unit_of_work(session):
+            assert in_unit_of_work(session)
+            first = repo.save(_client(1, seeded_user_commercial.id))
+            # refresh=True flushes, so the generated id is available
+            assert first.id is not None
+            repo.save(_client(2, seeded_user_commercial.id), refresh=False)
+            with unit_of_work(session):
+                repo.save(_client(3, seeded_user_commercial.id), refresh=False)
+            assert commit.call_count == 0
+    assert commit.call_count == 1
+    assert not in_unit_of_work(session)
+    assert len(repo.list_all()) == 3
+
+
+def test_unit_of_work_rolls_back_everything_on_error(session, seeded_user_commercial):
+    repo = ClientRepository(session)
+    with pytest.raises(IntegrityError):
+        with unit_of_work(session):
+            repo.save(_client(1, seeded_user_commercial.id), refresh=False)
+            repo.save(_client(2, seeded_user_commercial.id, email="client1@email.com"))
+    assert repo.list_all() == []
+    assert not in_unit_of_work(session)
+
+
+def test_caught_error_still_fails_the_unit_of_work(session, seeded_user_commercial):
+    repo = ClientRepository(session)
+    with pytest.raises(CrmIntegrityError):
+        with unit_of_work(session):
+            repo.save(_client(1, seeded_user_commercial.id), refresh=False)
+            try:
+                repo.save(_client(2, seeded_user_commercial.id, email="client1@email.com"))
+            except IntegrityError:
+                pass
+            repo.save(_client(3, seeded_user_commercial.id), refresh=False)
+    # Nothing is committed, rather than only the changes after the error
+    assert repo.list_all() == []
+    assert not in_unit_of_work(session)
+    repo.save(_client(4, seeded_user_commercial.id))
+    assert len(repo.list_all()) == 1
+
+
+def test_delete_inside_unit_of_work_is_staged(session, seeded_user):
+    repo = UserRepository(session)
+    with patch.object(session, "commit", wraps=session.commit) as commit:
+        with unit_of_work(session):
+            repo.delete(seeded_user)
+            assert commit.call_count == 0
+    assert commit.call_count == 1
+    assert repo.get_by_id(seeded_user.id) is None
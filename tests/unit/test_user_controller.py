@@ -2,6 +2,7 @@ import pytest
 from unittest.mock import MagicMock
 
 from controllers.user_controller import UserController
+from controllers.repositories.pagination import Page
 from exceptions import CrmInvalidValue
 from models.user import User
 from models.user_role import UserRole
@@ -138,14 +139,18 @@ def test_show_menu_executes_all_actions_and_handles_unknown(controller):
 
 
 def test_list_users_success(controller, sample_user):
-    controller.list_all_users = MagicMock(return_value=[sample_user])
+    controller.page_users = MagicMock(return_value=Page([sample_user]))
+    controller.view.display_user_pages.side_effect = \
+        lambda fetch_page: controller.view.display_user_table(fetch_page().items)
     controller.list_users()
     controller.view.display_user_table.assert_called_once_with([sample_user])
 
 
 def test_list_users_failure(controller):
-    controller.list_all_users = MagicMock(
+    controller.page_users = MagicMock(
         side_effect=CrmInvalidValue('errMSG'))
+    controller.view.display_user_pages.side_effect = \
+        lambda fetch_page: fetch_page()
     controller.list_users()
     controller.view.show_error.assert_called_once_with('errMSG')
 
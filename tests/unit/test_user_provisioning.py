@@ -0,0 +1,78 @@
+from unittest.mock import patch
+
+import pytest
+
+from controllers.services.user_provisioning import create_users, hash_passwords, provision_users
+from exceptions import CrmForbiddenAccessError, CrmInvalidValue
+from models.user import User
+from models.user_role import UserRole
+
+
+def _rows(count, start=0):
+    return [
+        {
+            "fullname": "Staff Member",
+            "email": f"staff{i}@epicevents.com",
+            "role": "support",
+            "password": f"Password{i:04d}",
+        }
+        for i in range(start, start + count)
+    ]
+
+
+def test_hash_passwords_keeps_order():
+    passwords = ["Password0001", "Password0002", "Password0003"]
+    for workers in (1, 2):
+        hashes = hash_passwords(passwords, workers, "test")
+        user = User()
+        for password, password_hash in zip(passwords, hashes):
+            user.password_hash = password_hash
+            assert user.check_password(password)
+
+
+def test_hash_passwords_starts_no_more_workers_than_passwords():
+    with patch("controllers.services.user_provisioning.ProcessPoolExecutor") as executor:
+        hashes = hash_passwords(["Password0001"], workers=8, profile="test")
+        executor.assert_not_called()
+        hash_passwords(["Password0001", "Password0002"], workers=8, profile="test")
+    assert User(password_hash=hashes[0]).check_password("Password0001")
+    assert executor.call_args.kwargs["max_workers"] == 2
+
+
+def test_create_users_in_batches(session, count_queries):
+    count_queries.clear()
+    assert create_users(session, _rows(5), batch_size=2, workers=2, profile="test") == 5
+
+    inserts = [s for s in count_queries if s.startswith("INSERT INTO user_account")]
+    assert len(inserts) == 3
+    users = session.query(User).order_by(User.id).all()
+    assert [u.email for u in users] == [f"staff{i}@epicevents.com" for i in range(5)]
+    assert users[0].role == UserRole.SUPPORT
+    assert users[4].check_password("Password0004")
+
+
+def test_create_users_rejects_invalid_rows(session):
+    rows = _rows(2)
+    rows[1]["role"] = "boss"
+    with pytest.raises(CrmInvalidValue, match="Row 2"):
+        create_users(session, rows, workers=1, profile="test")
+
+    with pytest.raises(CrmInvalidValue, match="duplicate email"):
+        create_users(session, _rows(1) + _rows(1), workers=1, profile="test")
+    assert session.query(User).count() == 0
+
+
+def test_create_users_rejects_registered_emails(session):
+    create_users(session, _rows(2), workers=1, profile="test")
+
+    with pytest.raises(CrmInvalidValue, match="staff1@epicevents.com"):
+        create_users(session, _rows(2, start=1), workers=1, profile="test")
+    assert session.query(User).count() == 2
+
+
+def test_provision_users_requires_gestion(session, monkeypatch):
+    monkeypatch.setattr("controllers.services.authorization.load_token", lambda: "valid_token")
+    monkeypatch.setattr("controllers.services.authorization.decode_token", lambda token: {"role": "support", "id": 1})
+
+    with pytest.raises(CrmForbiddenAccessError):
+        provision_users(session, _rows(1), workers=1)
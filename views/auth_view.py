@@ -23,6 +23,13 @@ def show_login_success(user):
     display_info(f"\nWelcome, {user.fullname}!\n")
 
 
+def show_session_resumed(user):
+    """
+    Display a welcome message when the session of a cached token is resumed.
+    """
+    display_info(f"\nWelcome back, {user.fullname}! (session resumed)\n")
+
+
 def show_login_error(message: str):
     """
     Display a specific login error message.
@@ -1,8 +1,11 @@
-from typing import List
+from itertools import chain
+from typing import Callable, Iterable, List, Sequence
 
 from config.console import console
 from rich.table import Table
 
+from .renderers import STREAM_WRITERS, choose_format, write_lines
+
 
 def display_menu(title: str, choices: List[str]) -> int:
     """Display a numbered menu and return the selected index (1-based).
@@ -90,3 +93,98 @@ def create_table(title: str, columns: List[str]) -> Table:
     for col in columns:
         table.add_column(col)
     return table
+
+
+def render_table(
+    output,
+    title: str,
+    columns: List[str],
+    rows: Iterable[Sequence[str]],
+    row_count: int | None = None,
+    widths: Sequence[int] | None = None,
+    fmt: str | None = None,
+    show_empty: bool = False
+) -> int:
+    """Print rows as a Rich Table, or stream them when that fits the output better.
+
+    The format comes from views.renderers.choose_format(): a Rich Table for a
+    small listing on a terminal, fixed-width text, TSV or JSON otherwise. The
+    streamed formats write each row as soon as it is read from ``rows``.
+    Nothing is printed when there is no row, unless ``show_empty`` is set.
+
+    Args:
+        output: The console to print to.
+        title (str): The title of the table.
+        columns (List[str]): The column names.
+        rows (Iterable[Sequence[str]]): The rows, one string per column; may be a generator.
+        row_count (int | None): Number of rows if known, None for a stream.
+        widths (Sequence[int] | None): Column widths of the fixed-width text format.
+        fmt (str | None): Force a format, see views.renderers.OUTPUT_FORMATS.
+        show_empty (bool): Print the header (an empty JSON array) even without rows.
+
+    Returns:
+        int: The number of rows printed.
+    """
+    rows = iter(rows)
+    first = next(rows, None)
+    if first is None:
+        if not show_empty:
+            return 0
+        row_count = 0
+    else:
+        rows = chain([first], rows)
+
+    fmt = choose_format(output, row_count, fmt)
+    if fmt == "rich":
+        table = create_table(title, columns)
+        for row in rows:
+            table.add_row(*row)
+        output.print(table)
+        return table.row_count
+
+    count = 0
+
+    def counted():
+        nonlocal count
+        for row in rows:
+            count += 1
+            yield row
+
+    write_lines(output, STREAM_WRITERS[fmt](title, columns, counted(), widths))
+    return count
+
+
+def browse_pages(fetch_page: Callable, render_page: Callable[[list], None]) -> None:
+    """Render a keyset-paginated listing one page at a time.
+
+    The first page is fetched and rendered; while other pages exist the user
+    can move to the next or previous one, any other answer leaves the listing.
+
+    Args:
+        fetch_page (Callable): Called with ``after=`` or ``before=`` cursors (or
+            nothing for the first page), returns a Page.
+        render_page (Callable[[list], None]): Renders the items of one page.
+    """
+    page = fetch_page()
+    number = 1
+    while True:
+        render_page(page.items)
+        choices = []
+        if page.prev_cursor is not None:
+            choices.append("[p]revious")
+        if page.next_cursor is not None:
+            choices.append("[n]ext")
+        if not choices:
+            return
+
+        answer = console.input(
+            f"Page {number} - {', '.join(choices)}, any other key to go back: "
+        ).strip().lower()
+        if answer == "n" and page.next_cursor is not None:
+            page = fetch_page(after=page.next_cursor)
+            number += 1
+        elif answer == "p" and page.prev_cursor is not None:
+            page = fetch_page(before=page.prev_cursor)
+            number -= 1
+        else:
+            return
@@ -1,10 +1,25 @@
-from typing import Dict, List, Optional
+from typing import Callable, Dict, Iterable, List, Optional, Sized
 
 from config.console import console
+from controllers.services.permissions import compile_menu, menu_options
 from exceptions import CrmInvalidValue
 from models.client import Client
 
-from .base import create_table, display_error, display_info, display_menu, display_success
+from .base import browse_pages, display_error, display_info, display_menu, display_success, render_table
+
+# Menu entries and the permission each one requires, resolved per role once
+CLIENTS_MENU = compile_menu([
+    ("List clients", "client.list"),
+    ("List my clients", "client.list_own"),
+    ("Add client", "client.create"),
+    ("Edit client", "client.update"),
+    ("Delete client", "client.delete"),
+    ("Back", None),
+])
+
+CLIENT_COLUMNS = ["ID", "Name", "Email", "Phone", "Company", "Created", "Last contact", "Commercial"]
+# Column widths of the fixed-width text output
+CLIENT_WIDTHS = [6, 24, 28, 16, 20, 10, 12, 20]
 
 
 class ClientsView:
@@ -34,61 +49,68 @@ class ClientsView:
         Note:
             The available options vary based on the user's role.
         """
-        options = ["List clients"]
-        if role == "commercial":
-            options.append("List my clients")
-            options.append("Add client")
-        if role in ("commercial", "gestion"):
-            options.extend(["Edit client", "Delete client"])
-        options.append("Back")
+        options = menu_options(CLIENTS_MENU, role)
 
         choice = display_menu("Clients Menu", options)
         return options[choice - 1]
 
-    def display_client_table(self, clients: List[Client], my_clients: bool = False) -> None:
+    def display_client_table(
+        self,
+        clients: Iterable[Client],
+        my_clients: bool = False,
+        fmt: Optional[str] = None
+    ) -> None:
         """
         Display a table of clients.
 
         Args:
-            clients: List of Client objects to display.
+            clients: Client objects to display; a list, or an iterator whose
+                     rows are streamed as they are fetched.
             my_clients: If True, indicates these are the current user's clients.
                        Affects the table title.
+            fmt: Force an output format (see views.renderers), chosen automatically if None.
         """
-        if not clients:
-            msg = "No clients found."
-            display_info(msg, clear=False)
-            return
-
-        cols = [
-            "ID",
-            "Name",
-            "Email",
-            "Phone",
-            "Company",
-            "Created",
-            "Last contact",
-            "Commercial",
-        ]
         title = f"{'My' if my_clients else 'All'} Clients"
-        table = create_table(title, cols)
-
-        for client in clients:
-            created = client.created_at.strftime("%Y-%m-%d")
-            updated = client.updated_at.strftime("%Y-%m-%d")
-            commercial = getattr(client, "commercial", None)
-            commercial_name = commercial.fullname if commercial else "-"
-
-            table.add_row(
-                str(client.id),
-                client.fullname,
-                client.email,
-                client.phone,
-                client.company,
-                created,
-                updated,
-                commercial_name,
-            )
-        self.console.print(table)
+        rows = (self.format_row(client) for client in clients)
+        row_count = len(clients) if isinstance(clients, Sized) else None
+        if not render_table(self.console, title, CLIENT_COLUMNS, rows, row_count, CLIENT_WIDTHS, fmt):
+            display_info("No clients found.", clear=False)
+
+    @staticmethod
+    def format_row(client: Client) -> tuple[str, ...]:
+        """
+        Format one client as a table row.
+
+        Args:
+            client: The Client object.
+
+        Returns:
+            tuple[str, ...]: The cells, in CLIENT_COLUMNS order.
+        """
+        commercial = getattr(client, "commercial", None)
+        return (
+            str(client.id),
+            client.fullname,
+            client.email,
+            client.phone or "-",
+            client.company or "-",
+            client.created_at.strftime("%Y-%m-%d"),
+            client.updated_at.strftime("%Y-%m-%d"),
+            commercial.fullname if commercial else "-",
+        )
+
+    def display_client_pages(self, fetch_page: Callable, my_clients: bool = False) -> None:
+        """
+        Display clients one page at a time with next/previous navigation.
+
+        Args:
+            fetch_page: Callable returning a Page of clients for the given cursor.
+            my_clients: If True, indicates these are the current user's clients.
+        """
+        browse_pages(
+            fetch_page,
+            lambda clients: self.display_client_table(clients, my_clients=my_clients)
+        )
 
     def prompt_new_client(self) -> Dict[str, str]:
         """
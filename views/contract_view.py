@@ -1,17 +1,34 @@
 from decimal import Decimal
-from typing import Dict
+from typing import Callable, Dict, Iterable, Sized
 
+from controllers.services.permissions import compile_menu, menu_options
 from exceptions import CrmInvalidValue
 from models.contract import Contract
 
 from .base import (
-    create_table,
+    browse_pages,
     display_error,
     display_info,
     display_menu,
     display_success,
+    render_table,
 )
 
+# Menu entries and the permission each one requires, resolved per role once
+CONTRACTS_MENU = compile_menu([
+    ("List all contracts", "contract.list"),
+    ("List my contracts", "contract.list_own"),
+    ("List unsigned contracts", "contract.list_unsigned"),
+    ("List unpaid contracts", "contract.list_unpaid"),
+    ("Add contract", "contract.create"),
+    ("Edit contract", "contract.update"),
+    ("Back", None),
+])
+
+CONTRACT_COLUMNS = ["ID", "Client", "Commercial", "Total", "Remaining", "Signed", "Created", "End date"]
+# Column widths of the fixed-width text output
+CONTRACT_WIDTHS = [6, 24, 20, 12, 12, 6, 10, 10]
+
 
 class ContractsView:
     """
@@ -44,76 +61,80 @@ class ContractsView:
         Returns:
             str: The label of the selected menu option.
         """
-        options = ["List all contracts"]
-        if role == "commercial":
-            options.append("List my contracts")
-            options.append("List unsigned contracts")
-            options.append("List unpaid contracts")
-        if role == "gestion":
-            options.append("Add contract")
-        if role in ("commercial", "gestion"):
-            options.append("Edit contract")
-        options.append("Back")
+        options = menu_options(CONTRACTS_MENU, role)
 
         choice = display_menu("Contracts Menu", options)
         return options[choice - 1]
 
     def display_contract_table(
         self,
-        contracts: list[Contract],
-        title: str = "Contracts"
+        contracts: Iterable[Contract],
+        title: str = "Contracts",
+        fmt: str | None = None
     ) -> None:
         """
         Display a table of contracts.
 
         Args:
-            contracts: List of Contract objects to display.
+            contracts: Contract objects to display; a list, or an iterator
+                       whose rows are streamed as they are fetched.
+            title: Optional title for the table. Defaults to "Contracts".
+            fmt: Force an output format (see views.renderers), chosen automatically if None.
+        """
+        rows = (self.format_row(contract) for contract in contracts)
+        row_count = len(contracts) if isinstance(contracts, Sized) else None
+        if not render_table(self.console, title, CONTRACT_COLUMNS, rows, row_count, CONTRACT_WIDTHS, fmt):
+            display_info("No contracts found.", clear=False)
+
+    @staticmethod
+    def format_row(contract: Contract) -> tuple[str, ...]:
+        """
+        Format one contract as a table row.
+
+        Args:
+            contract: The Contract object.
+
+        Returns:
+            tuple[str, ...]: The cells, in CONTRACT_COLUMNS order.
+        """
+        created = (
+            contract.creation_date.strftime("%Y-%m-%d")
+            if hasattr(contract, "creation_date") and contract.creation_date
+            else "-"
+        )
+        commercial = getattr(contract, "commercial", None)
+        commercial_name = (
+            commercial.fullname
+            if commercial and hasattr(commercial, "fullname")
+            else str(getattr(contract, "commercial_id", "-"))
+        )
+        return (
+            str(contract.id),
+            contract.client.fullname
+            if hasattr(contract, "client")
+            else str(getattr(contract, "client_id", "-")),
+            commercial_name,
+            f"{contract.total_amount}",
+            f"{contract.remaining_amount}",
+            "Yes" if contract.is_signed else "No",
+            created,
+            contract.end_date.strftime("%Y-%m-%d")
+            if hasattr(contract, "end_date") and contract.end_date
+            else "-",
+        )
+
+    def display_contract_pages(self, fetch_page: Callable, title: str = "Contracts") -> None:
+        """
+        Display contracts one page at a time with next/previous navigation.
+
+        Args:
+            fetch_page: Callable returning a Page of contracts for the given cursor.
             title: Optional title for the table. Defaults to "Contracts".
         """
-        if not contracts:
-            msg = "No contracts found."
-            display_info(msg, clear=False)
-            return
-
-        cols = [
-            "ID",
-            "Client",
-            "Commercial",
-            "Total",
-            "Remaining",
-            "Signed",
-            "Created",
-            "End date",
-        ]
-        table = create_table(title, cols)
-        for contract in contracts:
-            created = (
-                contract.creation_date.strftime("%Y-%m-%d")
-                if hasattr(contract, "creation_date") and contract.creation_date
-                else "-"
-            )
-            commercial = getattr(contract, "commercial", None)
-            commercial_name = (
-                commercial.fullname
-                if commercial and hasattr(commercial, "fullname")
-                else str(getattr(contract, "commercial_id", "-"))
-            )
-
-            table.add_row(
-                str(contract.id),
-                contract.client.fullname
-                if hasattr(contract, "client")
-                else str(getattr(contract, "client_id", "-")),
-                commercial_name,
-                f"{contract.total_amount}",
-                f"{contract.remaining_amount}",
-                "Yes" if contract.is_signed else "No",
-                created,
-                contract.end_date.strftime("%Y-%m-%d")
-                if hasattr(contract, "end_date") and contract.end_date
-                else "-",
-            )
-        self.console.print(table)
+        browse_pages(
+            fetch_page,
+            lambda contracts: self.display_contract_table(contracts, title=title)
+        )
 
     def prompt_new_contract(self) -> Dict[str, any]:
         """
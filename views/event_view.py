@@ -1,15 +1,34 @@
-from typing import Dict, Optional, Tuple, Any, List
+from typing import Callable, Dict, Iterable, Optional, Sized, Tuple, Any, List
 
+from controllers.services.permissions import compile_menu, menu_options
 from exceptions import CrmInvalidValue
 
 from .base import (
-    create_table,
+    browse_pages,
     display_error,
     display_info,
     display_menu,
     display_success,
+    render_table,
 )
 
+# Menu entries and the permission each one requires, resolved per role once
+EVENTS_MENU = compile_menu([
+    ("List all events", "event.list"),
+    ("List my events", "event.list_own"),
+    ("List unassigned events", "event.list_unassigned"),
+    ("Add event", "event.create"),
+    ("Assign support", "event.assign_support"),
+    ("Edit event", "event.update"),
+    ("Back", None),
+])
+
+EVENT_COLUMNS = [
+    "ID", "Contract", "Client", "Name", "Start", "End", "Location", "Attendees", "Support", "Notes",
+]
+# Column widths of the fixed-width text output
+EVENT_WIDTHS = [6, 8, 20, 20, 19, 19, 20, 9, 20, 41]
+
 
 class EventsView:
     """
@@ -39,77 +58,80 @@ class EventsView:
         Returns:
             str: The label of the selected menu option.
         """
-        options = ["List all events"]
-        if role == "support":
-            options.append("List my events")
-        if role == "gestion":
-            options.append("List unassigned events")
-        if role == "commercial":
-            options.append("Add event")
-        if role == "gestion":
-            options.append("Assign support")
-        if role in ("support", "gestion"):
-            options.append("Edit event")
-        options.append("Back")
+        options = menu_options(EVENTS_MENU, role)
 
         choice = display_menu("Events Menu", options)
         return options[choice - 1]
 
-    def display_event_table(self, events: List, title: str = "Events") -> None:
+    def display_event_table(
+        self,
+        events: Iterable,
+        title: str = "Events",
+        fmt: Optional[str] = None
+    ) -> None:
         """Display a table of events.
 
         Args:
-            events: List of Event objects to display.
+            events: Event objects to display; a list, or an iterator whose
+                rows are streamed as they are fetched.
+            title: Optional title for the table. Defaults to "Events".
+            fmt: Force an output format (see views.renderers), chosen automatically if None.
+        """
+        rows = (self.format_row(event) for event in events)
+        row_count = len(events) if isinstance(events, Sized) else None
+        if not render_table(self.console, title, EVENT_COLUMNS, rows, row_count, EVENT_WIDTHS, fmt):
+            display_info("No events found.", clear=False)
+
+    @staticmethod
+    def format_row(event) -> Tuple[str, ...]:
+        """Format one event as a table row.
+
+        Args:
+            event: The Event object.
+
+        Returns:
+            Tuple[str, ...]: The cells, in EVENT_COLUMNS order.
+        """
+        client_name = (
+            getattr(event.contract, "client", None).fullname
+            if hasattr(event, "contract") and getattr(event, "contract", None)
+            else "-"
+        )
+        support_user = getattr(event, "support_contact", None)
+        support_name = (
+            support_user.fullname
+            if support_user and hasattr(support_user, "fullname")
+            else str(getattr(event, "support_contact_id", "-"))
+        )
+
+        notes_preview = (event.notes or "")[:40]
+        if event.notes and len(event.notes) > 40:
+            notes_preview += "…"
+
+        return (
+            str(event.id),
+            str(getattr(event, "contract_id", "-")),
+            client_name,
+            event.name,
+            str(event.start_date),
+            str(event.end_date),
+            event.location,
+            str(event.attendees),
+            support_name,
+            notes_preview,
+        )
+
+    def display_event_pages(self, fetch_page: Callable, title: str = "Events") -> None:
+        """Display events one page at a time with next/previous navigation.
+
+        Args:
+            fetch_page: Callable returning a Page of events for the given cursor.
             title: Optional title for the table. Defaults to "Events".
         """
-        if not events:
-            msg = "No events found."
-            display_info(msg, clear=False)
-            return
-
-        cols = [
-            "ID",
-            "Contract",
-            "Client",
-            "Name",
-            "Start",
-            "End",
-            "Location",
-            "Attendees",
-            "Support",
-            "Notes",
-        ]
-        table = create_table(title, cols)
-        for event in events:
-            client_name = (
-                getattr(event.contract, "client", None).fullname
-                if hasattr(event, "contract") and getattr(event, "contract", None)
-                else "-"
-            )
-            support_user = getattr(event, "support_contact", None)
-            support_name = (
-                support_user.fullname
-                if support_user and hasattr(support_user, "fullname")
-                else str(getattr(event, "support_contact_id", "-"))
-            )
-
-            notes_preview = (event.notes or "")[:40]
-            if event.notes and len(event.notes) > 40:
-                notes_preview += "…"
-
-            table.add_row(
-                str(event.id),
-                str(getattr(event, "contract_id", "-")),
-                client_name,
-                event.name,
-                str(event.start_date),
-                str(event.end_date),
-                event.location,
-                str(event.attendees),
-                support_name,
-                notes_preview,
-            )
-        self.console.print(table)
+        browse_pages(
+            fetch_page,
+            lambda events: self.display_event_table(events, title=title)
+        )
 
     def prompt_new_event(self) -> Dict[str, Any]:
         """
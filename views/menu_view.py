@@ -1,10 +1,27 @@
 from typing import List, Tuple, Type
 
+from controllers.services.permissions import compile_menu, menu_options
 from views.client_view import ClientsView
 from views.contract_view import ContractsView
 from views.event_view import EventsView
 from views.user_view import UsersView
 
+# Main menu entries and the permission each one requires, resolved per role once
+MAIN_MENU = compile_menu([
+    ("Clients", "client.list"),
+    ("Contracts", "contract.list"),
+    ("Events", "event.list"),
+    ("Collaborators", "user.list"),
+    ("Log out", None),
+    ("Quit", None),
+])
+MENU_VIEWS = {
+    "Clients": ClientsView,
+    "Contracts": ContractsView,
+    "Events": EventsView,
+    "Collaborators": UsersView,
+}
+
 
 def get_menu_options(role: str) -> List[Tuple[str, Type[object]]]:
     """
@@ -17,13 +34,4 @@ def get_menu_options(role: str) -> List[Tuple[str, Type[object]]]:
         List[Tuple[str, Union[Type[object], None]]]: A list of (label, view_class) tuples.
             The view_class can be None for special actions like logout/quit.
     """
-    options = [
-        ("Clients", ClientsView),
-        ("Contracts", ContractsView),
-        ("Events", EventsView),
-    ]
-    if role == "gestion":
-        options.append(("Collaborators", UsersView))
-    options.append(("Log out", None))
-    options.append(("Quit", None))
-    return options
+    return [(label, MENU_VIEWS.get(label)) for label in menu_options(MAIN_MENU, role)]
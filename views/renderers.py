@@ -0,0 +1,189 @@
+"""
+Streamed output of the listings, without rich's table layout.
+
+A rich Table measures every cell of every row to size its columns before it
+prints anything. These writers turn each row into a line as soon as it is
+read, with a constant amount of work per cell:
+
+* ``plain``: fixed-width columns, longer cells are cut to the column width;
+* ``tsv``: tab-separated values under a header line, for pipes and scripts;
+* ``json``: a JSON array of objects keyed by column name, one per line.
+
+``CRM_OUTPUT`` forces a format (``rich`` included); with ``auto`` (default),
+choose_format() streams TSV when the output is not a terminal, plain text
+above ``CRM_STREAM_THRESHOLD`` rows or when the row count is unknown, and
+keeps the rich table otherwise.
+"""
+import json
+import os
+from typing import Callable, Iterable, Iterator, Sequence
+
+from exceptions import CrmInvalidValue
+
+OUTPUT_FORMATS = ("auto", "rich", "plain", "tsv", "json")
+OUTPUT_FORMAT = os.getenv("CRM_OUTPUT", "auto")
+
+# Above this many rows, auto mode streams plain text instead of a rich table
+STREAM_THRESHOLD = int(os.getenv("CRM_STREAM_THRESHOLD", 500))
+
+# Lines handed to the console per write
+CHUNK_LINES = 100
+
+# Width of the plain-text columns the caller gives no width for
+DEFAULT_WIDTH = 16
+
+
+def choose_format(output, row_count: int | None = None, fmt: str | None = None) -> str:
+    """
+    Pick the format of a listing.
+
+    Args:
+        output: The console the listing is written to.
+        row_count (int | None): Number of rows, None if they are streamed.
+        fmt (str | None): One of OUTPUT_FORMATS, defaults to CRM_OUTPUT.
+
+    Returns:
+        str: "rich", "plain", "tsv" or "json".
+
+    Raises:
+        CrmInvalidValue: If the format is unknown.
+    """
+    fmt = fmt or OUTPUT_FORMAT
+    if fmt not in OUTPUT_FORMATS:
+        raise CrmInvalidValue(f"Output format must be one of: {', '.join(OUTPUT_FORMATS)}")
+    if fmt != "auto":
+        return fmt
+    if not output.is_terminal:
+        return "tsv"
+    if row_count is None or row_count > STREAM_THRESHOLD:
+        return "plain"
+    return "rich"
+
+
+def _fit(text: str, width: int) -> str:
+    """
+    Pad or cut a cell to a fixed width.
+
+    Args:
+        text (str): The cell.
+        width (int): The column width.
+
+    Returns:
+        str: The cell, exactly ``width`` characters long.
+    """
+    text = " ".join(text.splitlines())
+    if len(text) <= width:
+        return text.ljust(width)
+    return text[:width - 1] + "…"
+
+
+def plain_lines(
+    title: str,
+    columns: Sequence[str],
+    rows: Iterable[Sequence[str]],
+    widths: Sequence[int] | None = None
+) -> Iterator[str]:
+    """
+    Render rows as fixed-width text: the title, the header, a rule, then the rows.
+
+    Args:
+        title (str): The listing title.
+        columns (Sequence[str]): The column names.
+        rows (Iterable[Sequence[str]]): The rows, one string per column.
+        widths (Sequence[int] | None): Column widths, DEFAULT_WIDTH (or the name) if None.
+
+    Yields:
+        str: The lines, without line breaks.
+    """
+    widths = widths or [max(len(column), DEFAULT_WIDTH) for column in columns]
+    yield title
+    yield "  ".join(_fit(column, width) for column, width in zip(columns, widths)).rstrip()
+    yield "  ".join("-" * width for width in widths)
+    for row in rows:
+        yield "  ".join(_fit(cell, width) for cell, width in zip(row, widths)).rstrip()
+
+
+def _tsv_cell(text: str) -> str:
+    """Replace the characters that would break a TSV line with spaces."""
+    return text.replace("\t", " ").replace("\r", " ").replace("\n", " ")
+
+
+def tsv_lines(
+    title: str,
+    columns: Sequence[str],
+    rows: Iterable[Sequence[str]],
+    widths: Sequence[int] | None = None
+) -> Iterator[str]:
+    """
+    Render rows as tab-separated values under a header line.
+
+    The title and widths are ignored, so the output can be fed to other tools.
+
+    Args:
+        title (str): The listing title (unused).
+        columns (Sequence[str]): The column names.
+        rows (Iterable[Sequence[str]]): The rows, one string per column.
+        widths (Sequence[int] | None): Unused.
+
+    Yields:
+        str: The lines, without line breaks.
+    """
+    yield "\t".join(_tsv_cell(column) for column in columns)
+    for row in rows:
+        yield "\t".join(_tsv_cell(cell) for cell in row)
+
+
+def json_lines(
+    title: str,
+    columns: Sequence[str],
+    rows: Iterable[Sequence[str]],
+    widths: Sequence[int] | None = None
+) -> Iterator[str]:
+    """
+    Render rows as a JSON array with one object per line.
+
+    Args:
+        title (str): The listing title (unused).
+        columns (Sequence[str]): The column names, used as keys.
+        rows (Iterable[Sequence[str]]): The rows, one string per column.
+        widths (Sequence[int] | None): Unused.
+
+    Yields:
+        str: The lines, without line breaks.
+    """
+    yield "["
+    previous = None
+    for row in rows:
+        # The separator goes after an object, so hold each one until the next
+        if previous is not None:
+            yield previous + ","
+        previous = json.dumps(dict(zip(columns, row)), ensure_ascii=False)
+    if previous is not None:
+        yield previous
+    yield "]"
+
+
+STREAM_WRITERS: dict[str, Callable[..., Iterator[str]]] = {
+    "plain": plain_lines,
+    "tsv": tsv_lines,
+    "json": json_lines,
+}
+
+
+def write_lines(output, lines: Iterable[str], chunk_lines: int = CHUNK_LINES) -> None:
+    """
+    Write lines to the console as they come, a chunk at a time.
+
+    Args:
+        output: The console, written to with write_text().
+        lines (Iterable[str]): The lines, without line breaks.
+        chunk_lines (int): Lines per write.
+    """
+    chunk = []
+    for line in lines:
+        chunk.append(line)
+        if len(chunk) >= chunk_lines:
+            output.write_text("\n".join(chunk) + "\n")
+            chunk.clear()
+    if chunk:
+        output.write_text("\n".join(chunk) + "\n")
@@ -1,15 +1,20 @@
-from typing import Dict
+from typing import Callable, Dict, Sized
 
 from exceptions import CrmInvalidValue
 
 from views.base import (
-    create_table,
+    browse_pages,
     display_error,
     display_info,
     display_menu,
     display_success,
+    render_table,
 )
 
+USER_COLUMNS = ["ID", "Name", "Email", "Role"]
+# Column widths of the fixed-width text output
+USER_WIDTHS = [6, 24, 32, 10]
+
 
 class UsersView:
     """CLI view for user management: prompts and displays.
@@ -52,22 +57,41 @@ class UsersView:
         choice = display_menu("Collaborators Menu", options)
         return options[choice-1]
 
-    def display_user_table(self, users) -> None:
+    def display_user_table(self, users, fmt: str | None = None) -> None:
         """
         Display a table of users.
 
         Args:
-            users: A list of User objects to display.
-        """
-        table = create_table("All Users", ["ID", "Name", "Email", "Role"])
-        for user in users:
-            table.add_row(
-                str(user.id),
-                user.fullname,
-                user.email,
-                user.role.value
-            )
-        self.console.print(table)
+            users: User objects to display; a list, or an iterator whose rows
+                are streamed as they are fetched.
+            fmt: Force an output format (see views.renderers), chosen automatically if None.
+        """
+        rows = (self.format_row(user) for user in users)
+        row_count = len(users) if isinstance(users, Sized) else None
+        if not render_table(self.console, "All Users", USER_COLUMNS, rows, row_count, USER_WIDTHS, fmt):
+            display_info("No users found.", clear=False)
+
+    @staticmethod
+    def format_row(user) -> tuple[str, ...]:
+        """
+        Format one user as a table row.
+
+        Args:
+            user: The User object.
+
+        Returns:
+            tuple[str, ...]: The cells, in USER_COLUMNS order.
+        """
+        return (str(user.id), user.fullname, user.email, user.role.value)
+
+    def display_user_pages(self, fetch_page: Callable) -> None:
+        """
+        Display users one page at a time with next/previous navigation.
+
+        Args:
+            fetch_page: Callable returning a Page of users for the given cursor.
+        """
+        browse_pages(fetch_page, self.display_user_table)
 
     def prompt_new_user(self) -> Dict[str, str]:
         """